@@ -0,0 +1,225 @@
+"""
+Generate highergov_endpoints.py from the HigherGov OpenAPI spec.
+
+Usage:
+    python generate_endpoints.py
+
+Re-run whenever "HigherGov API.yaml" changes. The generated module holds the
+parameter spec of every endpoint plus typed get_/iter_/get_all_ wrappers that
+validate parameters and share the client's pagination, retry and caching.
+"""
+import os
+import re
+
+import yaml
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SPEC_PATH = os.path.join(HERE, "HigherGov API.yaml")
+OUTPUT_PATH = os.path.join(HERE, "highergov_endpoints.py")
+
+# Parameters handled by the wrappers themselves rather than exposed as filters.
+PAGING_PARAMS = ("page_number", "page_size")
+
+PYTHON_TYPES = {"integer": "int", "string": "str"}
+
+
+def _clean_text(text: str) -> str:
+    return re.sub(r"\s+", " ", text or "").strip()
+
+
+def _describe(operation: dict) -> tuple:
+    """Split an operation description into its summary and update frequency."""
+    description = _clean_text(operation.get("description", ""))
+    description = re.sub(r"^Description:\s*", "", description)
+    summary, _, rest = description.partition("Update Frequency:")
+    frequency = _clean_text(rest.split("Update Check Field:")[0])
+    return _clean_text(summary), frequency
+
+
+def load_endpoints(spec_path: str = SPEC_PATH) -> list:
+    with open(spec_path, "r") as f:
+        spec = yaml.safe_load(f)
+
+    endpoints = []
+    for path, methods in spec["paths"].items():
+        operation = methods["get"]
+        name = path.rstrip("/").split("/")[-1].replace("-", "_")
+        summary, frequency = _describe(operation)
+        params = {}
+        for param in operation.get("parameters", []):
+            schema = param.get("schema", {})
+            params[param["name"]] = {
+                "type": schema.get("type", "string"),
+                "format": schema.get("format"),
+                "enum": schema.get("enum"),
+                "required": bool(param.get("required", False)),
+                "description": _clean_text(param.get("description", ""))
+            }
+        endpoints.append({
+            "name": name,
+            "path": path,
+            "summary": summary or name,
+            "update_frequency": frequency,
+            "params": params
+        })
+    return endpoints
+
+
+def _signature(endpoint: dict, include_page_number: bool) -> list:
+    """Return the parameter lines of a wrapper signature, required parameters first."""
+    required, optional = [], []
+    for name, param in endpoint["params"].items():
+        if name in PAGING_PARAMS:
+            continue
+        py_type = PYTHON_TYPES.get(param["type"], "str")
+        if param["format"] == "date":
+            py_type = "Union[str, date]"
+        if param["required"]:
+            required.append(f"    {name}: {py_type}")
+        else:
+            optional.append(f"    {name}: Optional[{py_type}] = None")
+    paging = []
+    if include_page_number:
+        paging.append("    page_number: Optional[int] = None")
+    paging.append("    page_size: int = DEFAULT_PAGE_SIZE")
+    return required + optional + paging
+
+
+def _params_dict(endpoint: dict, include_page_number: bool) -> list:
+    lines = ["    params = {"]
+    names = [n for n in endpoint["params"] if n not in PAGING_PARAMS]
+    if include_page_number:
+        names += list(PAGING_PARAMS)
+    for i, name in enumerate(names):
+        comma = "," if i < len(names) - 1 else ""
+        lines.append(f'        "{name}": {name}{comma}')
+    lines.append("    }")
+    return lines
+
+
+def _args_doc(endpoint: dict) -> list:
+    lines = ["    Args:"]
+    for name, param in endpoint["params"].items():
+        if name == "page_number":
+            continue
+        description = param["description"]
+        if param["enum"]:
+            description += f" One of: {', '.join(param['enum'])}."
+        lines.append(f"        {name}: {description}")
+    lines.append("        client: HigherGovClient to use; defaults to the shared client.")
+    return lines
+
+
+def render_endpoint(endpoint: dict) -> str:
+    name = endpoint["name"]
+    spec_ref = f'ENDPOINT_SPECS["{name}"]'
+    out = []
+
+    # get_<name>: a single page.
+    out.append(f"def get_{name}(")
+    out.append(",\n".join(_signature(endpoint, include_page_number=True) +
+                          ["    client: Optional[HigherGovClient] = None"]))
+    out.append(") -> Dict[str, Any]:")
+    out.append('    """')
+    out.append(f"    {endpoint['summary']}")
+    out.append("")
+    if endpoint["update_frequency"]:
+        out.append(f"    Update Frequency: {endpoint['update_frequency']}")
+        out.append("")
+    out.append(f"    Endpoint: {endpoint['path']}")
+    out.append("")
+    out.extend(_args_doc(endpoint))
+    out.append("")
+    out.append("    Raises:")
+    out.append("        ValueError: If a parameter does not match the spec.")
+    out.append('    """')
+    out.extend(_params_dict(endpoint, include_page_number=True))
+    out.append(f"    return call_endpoint_spec({spec_ref}, params, client)")
+    out.append("")
+    out.append("")
+
+    # iter_<name>: every record, lazily.
+    out.append(f"def iter_{name}(")
+    out.append(",\n".join(_signature(endpoint, include_page_number=False) + [
+        "    max_page_number: Optional[int] = None",
+        "    max_workers: int = DEFAULT_MAX_WORKERS",
+        "    client: Optional[HigherGovClient] = None"
+    ]))
+    out.append(") -> Iterator[Dict[str, Any]]:")
+    out.append(f'    """Lazily yield the records of every page of {endpoint["path"]}, in page order. See get_{name}."""')
+    out.extend(_params_dict(endpoint, include_page_number=False))
+    out.append(f"    return iter_endpoint_records({spec_ref}, params, page_size, max_page_number, max_workers, client)")
+    out.append("")
+    out.append("")
+
+    # get_all_<name>: every record, as a list.
+    filter_names = [n for n in endpoint["params"] if n not in PAGING_PARAMS]
+    out.append(f"def get_all_{name}(")
+    out.append(",\n".join(_signature(endpoint, include_page_number=False) + [
+        "    max_page_number: Optional[int] = None",
+        "    max_workers: int = DEFAULT_MAX_WORKERS",
+        "    client: Optional[HigherGovClient] = None"
+    ]))
+    out.append(") -> List[Dict[str, Any]]:")
+    out.append(f'    """Fetch the records of every page of {endpoint["path"]} into a list. See get_{name}."""')
+    out.append(f"    return list(iter_{name}(")
+    call_args = [f"        {n}={n}" for n in filter_names + ["page_size", "max_page_number", "max_workers", "client"]]
+    out.append(",\n".join(call_args))
+    out.append("    ))")
+    out.append("")
+    out.append("")
+    return "\n".join(out)
+
+
+def render_specs(endpoints: list) -> str:
+    """Render ENDPOINT_SPECS with one line per parameter."""
+    lines = ["ENDPOINT_SPECS = {"]
+    for i, endpoint in enumerate(endpoints):
+        lines.append(f'    "{endpoint["name"]}": {{')
+        lines.append(f'        "path": {endpoint["path"]!r},')
+        lines.append(f'        "update_frequency": {endpoint["update_frequency"]!r},')
+        lines.append('        "params": {')
+        params = list(endpoint["params"].items())
+        for j, (name, param) in enumerate(params):
+            comma = "," if j < len(params) - 1 else ""
+            lines.append(
+                f'            "{name}": {{"type": {param["type"]!r}, "format": {param["format"]!r}, '
+                f'"enum": {param["enum"]!r}, "required": {param["required"]!r}}}{comma}'
+            )
+        lines.append("        }")
+        lines.append("    }" + ("," if i < len(endpoints) - 1 else ""))
+    lines.append("}")
+    return "\n".join(lines).replace("'", '"')
+
+
+def render_module(endpoints: list) -> str:
+    header = [
+        "# Generated by generate_endpoints.py from \"HigherGov API.yaml\". Do not edit by hand.",
+        "from datetime import date",
+        "from typing import Any, Dict, Iterator, List, Optional, Union",
+        "",
+        "from highergov_client import (",
+        "    DEFAULT_MAX_WORKERS,",
+        "    HigherGovClient,",
+        "    call_endpoint_spec,",
+        "    iter_endpoint_records",
+        ")",
+        "",
+        "DEFAULT_PAGE_SIZE = 100",
+        "",
+        render_specs(endpoints),
+        "",
+        "",
+    ]
+    return "\n".join(header) + "".join(render_endpoint(e) for e in endpoints).rstrip() + "\n"
+
+
+def main():
+    endpoints = load_endpoints()
+    with open(OUTPUT_PATH, "w") as f:
+        f.write(render_module(endpoints))
+    print(f"Generated {len(endpoints)} endpoints into {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
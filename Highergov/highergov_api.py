@@ -17,6 +17,10 @@ from itertools import chain
 import pandas as pd
 import json
 
+from highergov_client import DEFAULT_MAX_WORKERS, HigherGovClient, call_endpoint_spec, get_default_client, iter_records
+from highergov_endpoints import ENDPOINT_SPECS
+from highergov_export import export_pages, merge_export
+
 # ---------------- Global Constants ----------------
 DEFAULT_PAGE_SIZE = 25
 DEFAULT_MAX_PAGE_NUMBER = 1
@@ -26,13 +30,14 @@ HIGHERGOV_KEY = "ddc5a2a906de4dc2980c5c727a3ecf37"
 BASE_URL = "https://www.highergov.com"
 
 
-def call_endpoint(endpoint: str, params: dict) -> dict:
+def call_endpoint(endpoint: str, params: dict, client: HigherGovClient = None) -> dict:
     """
     Helper function to call the API endpoint.
 
     Args:
         endpoint: API endpoint path (e.g. "/api-external/agency/")
         params: Dictionary of query parameters.
+        client: HigherGovClient to send the request through; defaults to the shared client.
 
     Returns:
         Parsed JSON response.
@@ -40,12 +45,8 @@ def call_endpoint(endpoint: str, params: dict) -> dict:
     Raises:
         requests.HTTPError if the response status is not 200.
     """
-    url = BASE_URL + endpoint
-    # Remove any parameters that are None.
-    clean_params = {k: v for k, v in params.items() if v is not None}
-    response = requests.get(url, params=clean_params)
-    response.raise_for_status()
-    return response.json()
+    client = client or get_default_client()
+    return client.get(endpoint, params)
 
 def get_opportunities(
     api_key: str,
@@ -67,6 +68,8 @@ def get_opportunities(
     Update Frequency: Every 30 minutes.
 
     Endpoint: /api-external/opportunity/
+
+    Parameters are validated against the OpenAPI spec before the request is sent.
     """
     params = {
         "api_key": api_key,
@@ -82,53 +85,133 @@ def get_opportunities(
         "source_type": source_type,
         "version_key": version_key
     }
-    return call_endpoint("/api-external/opportunity/", params)
+    return call_endpoint_spec(ENDPOINT_SPECS["opportunity"], params)
+
+def iter_opportunities_for_searchid(
+    api_key: str,
+    search_id: str,
+    max_page_number: int = DEFAULT_MAX_PAGE_NUMBER,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS
+):
+    """
+    Lazily yield all opportunities for a given search_id from the
+    /api-external/opportunity/ endpoint, in page order.
+
+    The first page is read to learn the page count, then the remaining pages are
+    fetched concurrently a few pages ahead of the consumer, so records can be
+    processed before the last page arrives without holding the whole result set.
+
+    Args:
+        api_key (str): Your HigherGov API Key.
+        search_id (str): The HigherGov search id to filter opportunities.
+        max_page_number (int): Maximum number of pages to retrieve; defaults to DEFAULT_MAX_PAGE_NUMBER.
+        page_size (int): Number of records per page; defaults to DEFAULT_PAGE_SIZE.
+        max_workers (int): Number of pages fetched concurrently; defaults to DEFAULT_MAX_WORKERS.
+
+    Yields:
+        dict: Opportunity records.
+    """
+    def fetch_page(page_number: int) -> dict:
+        return get_opportunities(
+            api_key=api_key,
+            search_id=search_id,
+            page_number=page_number,
+            page_size=page_size
+        )
+
+    return iter_records(
+        fetch_page,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers
+    )
 
 def get_all_opportunities_for_searchid(
     api_key: str,
     search_id: str,
     max_page_number: int = DEFAULT_MAX_PAGE_NUMBER,
-    page_size: int = DEFAULT_PAGE_SIZE
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS
 ) -> list:
     """
     Retrieve all opportunities for a given search_id from the 
     /api-external/opportunity/ endpoint by paginating through all pages.
 
+    The first page is read to learn the page count, then the remaining pages are
+    fetched concurrently. Records are returned in page order.
+
     Args:
         api_key (str): Your HigherGov API Key.
         search_id (str): The HigherGov search id to filter opportunities.
         max_page_number (int): Maximum number of pages to retrieve; defaults to DEFAULT_MAX_PAGE_NUMBER.
         page_size (int): Number of records per page; defaults to DEFAULT_PAGE_SIZE.
+        max_workers (int): Number of pages fetched concurrently; defaults to DEFAULT_MAX_WORKERS.
 
     Returns:
         list: A list of opportunity records.
     """
-    page_number = 1
-    all_opportunities = []
-    
-    while True:
-        resp = get_opportunities(
+    return list(iter_opportunities_for_searchid(
+        api_key=api_key,
+        search_id=search_id,
+        max_page_number=max_page_number,
+        page_size=page_size,
+        max_workers=max_workers
+    ))
+
+def export_all_opportunities_for_searchid(
+    api_key: str,
+    search_id: str,
+    export_dir: str,
+    max_page_number: int = DEFAULT_MAX_PAGE_NUMBER,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> dict:
+    """
+    Resumable version of get_all_opportunities_for_searchid.
+
+    Every page is written to export_dir as it arrives, together with a checkpoint of the
+    completed pages. If the run is interrupted, calling this again with the same
+    export_dir only fetches the missing pages. Use merge_export to combine the pages.
+
+    Args:
+        api_key (str): Your HigherGov API Key.
+        search_id (str): The HigherGov search id to filter opportunities.
+        export_dir (str): Directory holding the exported pages and checkpoint.
+        max_page_number (int): Maximum number of pages to retrieve; defaults to DEFAULT_MAX_PAGE_NUMBER.
+        page_size (int): Number of records per page; defaults to DEFAULT_PAGE_SIZE.
+        max_workers (int): Number of pages fetched concurrently; defaults to DEFAULT_MAX_WORKERS.
+
+    Returns:
+        dict: The export checkpoint (total_pages, completed_pages, last_completed_page).
+    """
+    def fetch_page(page_number: int) -> dict:
+        return get_opportunities(
             api_key=api_key,
             search_id=search_id,
             page_number=page_number,
             page_size=page_size
         )
-        results = resp.get("results", [])
-        if not results:
-            break
-        
-        all_opportunities.extend(results)
-        
-        # Check for a next page
-        next_link = resp.get("links", {}).get("next")
-        if not next_link or page_number >= max_page_number:
-            break
-        
-        page_number += 1
-        
-    return all_opportunities
-
-all_data = get_all_opportunities_for_searchid(api_key=HIGHERGOV_KEY, search_id="I1sN-gdKpKyZgXqIqATxh", max_page_number=100, page_size=10)
-print(json.dumps(all_data, indent=4))
-with open("highergov_api_full_data.json", "w") as file:
-    json.dump(all_data, file, indent=4)
\ No newline at end of file
+
+    signature = {"endpoint": "/api-external/opportunity/", "search_id": search_id, "page_size": page_size}
+    return export_pages(
+        fetch_page,
+        export_dir=export_dir,
+        page_size=page_size,
+        signature=signature,
+        max_page_number=max_page_number,
+        max_workers=max_workers
+    )
+
+
+if __name__ == "__main__":
+    search_id = "I1sN-gdKpKyZgXqIqATxh"
+    export_all_opportunities_for_searchid(
+        api_key=HIGHERGOV_KEY,
+        search_id=search_id,
+        export_dir=f"export_{search_id}",
+        max_page_number=100,
+        page_size=10
+    )
+    record_count = merge_export(f"export_{search_id}", "highergov_api_full_data.json", indent=4)
+    print(f"Saved {record_count} records to highergov_api_full_data.json")
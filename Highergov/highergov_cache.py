@@ -0,0 +1,163 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "highergov", "responses.sqlite3")
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Time-to-live per endpoint, following the update frequency documented in HigherGov API.yaml.
+# Real-time endpoints are not cached.
+ENDPOINT_TTLS = {
+    "/api-external/agency/": DAY,               # Ad hoc as new agencies are created
+    "/api-external/awardee/": DAY,              # Monthly
+    "/api-external/awardee-mp/": DAY,           # Not documented
+    "/api-external/awardee-partnership/": DAY,  # Weekly
+    "/api-external/contract/": 6 * HOUR,        # Daily by 2am
+    "/api-external/document/": 0,               # Real time
+    "/api-external/grant/": 6 * HOUR,           # Daily by 2am
+    "/api-external/grant-program/": DAY,        # Ad hoc, typically monthly
+    "/api-external/idv/": 6 * HOUR,             # Daily by 2am
+    "/api-external/naics/": 7 * DAY,            # Ad hoc when codes change
+    "/api-external/opportunity/": 30 * MINUTE,  # Every 30 minutes
+    "/api-external/people/": 0,                 # Real time
+    "/api-external/psc/": 7 * DAY,              # Ad hoc when codes change
+    "/api-external/subcontract/": DAY,          # Weekly
+    "/api-external/subgrant/": DAY,             # Weekly
+    "/api-external/vehicle/": DAY,              # Ad hoc as new awards are made
+}
+
+# Parameters that do not change the response and must not end up in cache keys.
+_UNCACHED_PARAMS = {"api_key"}
+
+# Newest-first orderings: their first pages change whenever records are added or
+# updated, and incremental syncs rely on them being current, so they are never cached.
+FRESHNESS_ORDERINGS = {"-captured_date", "-last_modified_date", "-posted_date"}
+
+
+def is_cacheable(endpoint: str, params: Dict[str, Any], ttls: Dict[str, int] = ENDPOINT_TTLS) -> bool:
+    """Whether a request may be served from and stored in the cache."""
+    return ttls.get(endpoint, 0) > 0 and params.get("ordering") not in FRESHNESS_ORDERINGS
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Build a cache key from the endpoint and its params, ignoring order, None values and the API key."""
+    normalized = {
+        k: str(v) for k, v in params.items()
+        if v is not None and k not in _UNCACHED_PARAMS
+    }
+    return endpoint + "?" + json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache of HigherGov responses, stored in SQLite.
+
+    Entries expire after the endpoint's TTL (see ENDPOINT_TTLS) and the cache is kept
+    under max_entries / max_bytes by evicting the least recently used entries.
+    Response bodies are stored zlib-compressed.
+
+    Args:
+        path: SQLite database file.
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of the compressed responses.
+        ttls: Time-to-live in seconds per endpoint; endpoints missing from it are not cached.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Dict[str, int]] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = ENDPOINT_TTLS if ttls is None else ttls
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._conn.commit()
+
+    def ttl_for(self, endpoint: str) -> int:
+        return self.ttls.get(endpoint, 0)
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached response, or None if it is missing, expired or not cacheable."""
+        if not is_cacheable(endpoint, params, self.ttls):
+            return None
+        key = make_cache_key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(body))
+
+    def set(self, endpoint: str, params: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store a response, then evict least recently used entries if over the size limits."""
+        if not is_cacheable(endpoint, params, self.ttls):
+            return
+        ttl = self.ttl_for(endpoint)
+        key = make_cache_key(endpoint, params)
+        body = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now + ttl, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        count, total_bytes = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        evicted = []
+        for key, size in rows:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
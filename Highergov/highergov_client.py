@@ -0,0 +1,618 @@
+import asyncio
+import math
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import date, datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from highergov_cache import ResponseCache
+
+# ---------------- Global Constants ----------------
+BASE_URL = "https://www.highergov.com"
+
+DEFAULT_MAX_WORKERS = 4
+MAX_CONCURRENT_REQUESTS_PER_HOST = 4
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_BURST_SIZE = 10
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+MAX_PAGE_SIZE = 100
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+@contextmanager
+def host_slot(url: str) -> Iterator[None]:
+    """
+    Hold one of the MAX_CONCURRENT_REQUESTS_PER_HOST request slots for the host of `url`.
+
+    Every request to HigherGov goes through this, so the total number of in-flight
+    requests per host stays capped no matter how many worker pools are running.
+    """
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS_PER_HOST)
+            _host_semaphores[host] = semaphore
+    with semaphore:
+        yield
+
+
+def get_page_count(response: Dict[str, Any], page_size: int) -> Optional[int]:
+    """
+    Work out the total number of pages from a HigherGov paginated response.
+
+    Uses meta.pagination.pages when present, otherwise derives it from meta.pagination.count.
+    Returns None when the response does not carry pagination metadata.
+    """
+    pagination = (response.get("meta") or {}).get("pagination") or {}
+    if pagination.get("pages") is not None:
+        return int(pagination["pages"])
+    if pagination.get("count") is not None:
+        return math.ceil(int(pagination["count"]) / page_size)
+    return None
+
+
+def _has_next_page(response: Dict[str, Any], page_size: int, page_number: int, max_page_number: Optional[int]) -> bool:
+    """Decide whether to keep walking pages when the response carries no page count."""
+    if max_page_number is not None and page_number >= max_page_number:
+        return False
+    if len(response.get("results", [])) < page_size:
+        return False
+    return response.get("links", {}).get("next", True) is not None
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    page_size: int,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield every page of a paginated HigherGov endpoint, in page order.
+
+    The first page is read on its own to learn how many pages there are, then the
+    remaining pages are fetched on a thread pool. At most 2 * max_workers pages are
+    fetched ahead of the consumer, so memory stays flat however many pages there are.
+    When the response has no pagination metadata we fall back to walking the pages
+    one at a time.
+
+    Args:
+        fetch_page: Callable taking a 1-based page number and returning the parsed JSON response.
+        page_size: Number of records per page.
+        max_page_number: Maximum number of pages to retrieve (None for all).
+        max_workers: Number of pages fetched concurrently.
+
+    Yields:
+        dict: Page responses, in page order.
+    """
+    response = fetch_page(1)
+    yield response
+    if not response.get("results"):
+        return
+
+    total_pages = get_page_count(response, page_size)
+    if total_pages is None:
+        page_number = 1
+        while _has_next_page(response, page_size, page_number, max_page_number):
+            page_number += 1
+            response = fetch_page(page_number)
+            if not response.get("results"):
+                return
+            yield response
+        return
+
+    if max_page_number is not None:
+        total_pages = min(total_pages, max_page_number)
+    window = 2 * max(1, max_workers)
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    pending = deque()
+    try:
+        next_page = 2
+        while next_page <= total_pages or pending:
+            while next_page <= total_pages and len(pending) < window:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+            yield pending.popleft().result()
+    finally:
+        # Stop queued fetches if the consumer stops early.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def iter_records(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    page_size: int,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page, in order. See iter_pages."""
+    for page in iter_pages(fetch_page, page_size, max_page_number, max_workers):
+        yield from page.get("results", [])
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    page_size: int,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async version of iter_pages.
+
+    fetch_page stays a blocking callable and runs in worker threads, with at most
+    max_workers pages in flight ahead of the consumer.
+    """
+    response = await asyncio.to_thread(fetch_page, 1)
+    yield response
+    if not response.get("results"):
+        return
+
+    total_pages = get_page_count(response, page_size)
+    if total_pages is None:
+        page_number = 1
+        while _has_next_page(response, page_size, page_number, max_page_number):
+            page_number += 1
+            response = await asyncio.to_thread(fetch_page, page_number)
+            if not response.get("results"):
+                return
+            yield response
+        return
+
+    if max_page_number is not None:
+        total_pages = min(total_pages, max_page_number)
+    window = max(1, max_workers)
+    pending = deque()
+    try:
+        next_page = 2
+        while next_page <= total_pages or pending:
+            while next_page <= total_pages and len(pending) < window:
+                pending.append(asyncio.ensure_future(asyncio.to_thread(fetch_page, next_page)))
+                next_page += 1
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aiter_records(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    page_size: int,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async version of iter_records."""
+    async for page in aiter_pages(fetch_page, page_size, max_page_number, max_workers):
+        for record in page.get("results", []):
+            yield record
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    page_size: int,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every page of a paginated HigherGov endpoint into a list.
+
+    Returns:
+        list: The page responses, in page order. See iter_pages.
+    """
+    return list(iter_pages(fetch_page, page_size, max_page_number, max_workers))
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when HigherGov has failed repeatedly and the circuit breaker stays open."""
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for throttled (429) and server error (5xx) responses.
+
+    A Retry-After header on the response always takes precedence over the computed delay.
+    """
+    max_retries: int = 5
+    backoff_base: float = 1.0
+    backoff_max: float = 60.0
+    retry_status_codes: frozenset = RETRY_STATUS_CODES
+
+    def backoff(self, attempt: int) -> float:
+        """Delay in seconds before retry number `attempt` (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+@dataclass
+class ClientStats:
+    """Thread-safe counters describing how a HigherGovClient spent its time."""
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    server_errors: int = 0
+    circuit_opens: int = 0
+    cache_hits: int = 0
+    wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counts: float) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "server_errors": self.server_errors,
+                "circuit_opens": self.circuit_opens,
+                "cache_hits": self.cache_hits,
+                "wait_seconds": round(self.wait_seconds, 3)
+            }
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by every thread sending requests through a client.
+
+    Args:
+        rate: Tokens added per second (sustained requests per second).
+        capacity: Maximum number of tokens, i.e. the largest burst allowed.
+    """
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, capacity: int = DEFAULT_BURST_SIZE):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests after `failure_threshold` consecutive failures.
+
+    While open, callers wait; after `reset_timeout` seconds a single probe request is let
+    through. A successful probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 10, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def time_until_allowed(self) -> float:
+        """Seconds the caller must wait before sending; 0 means go ahead."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                return remaining
+            if self._probe_in_flight:
+                return 1.0
+            self._probe_in_flight = True
+            return 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Record a failed request. Returns True if this failure opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            reopened = self._probe_in_flight
+            self._probe_in_flight = False
+            if reopened or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HigherGovClient:
+    """
+    Shared HTTP client for the HigherGov API.
+
+    Owns a pooled keep-alive requests.Session, so bulk pulls reuse TCP/TLS connections
+    to www.highergov.com instead of paying a handshake on every page. Requests are paced
+    by a token bucket, and 429/5xx responses and connection errors are retried with
+    backoff, so one bad page does not abort a long pull. When a ResponseCache is given,
+    responses are served from it until their endpoint's TTL runs out. Counters are kept
+    in `stats`.
+
+    Args:
+        base_url: HigherGov base URL.
+        pool_size: Number of keep-alive connections kept per host. Should be at least
+            the number of pagination workers.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
+        retry_policy: Backoff settings for retried requests.
+        rate_limiter: Token bucket pacing requests; None disables rate limiting.
+        circuit_breaker: Breaker guarding against a failing API; None disables it.
+        max_circuit_wait: Longest time in seconds to wait on an open circuit before
+            raising CircuitOpenError.
+        cache: Persistent response cache; None disables caching.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_circuit_wait: float = 300.0,
+        cache: Optional[ResponseCache] = None
+    ):
+        self.base_url = base_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else TokenBucket()
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self.max_circuit_wait = max_circuit_wait
+        self.cache = cache
+        self.stats = ClientStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+
+    def get(self, endpoint: str, params: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Call a HigherGov endpoint and return the parsed JSON response.
+
+        Args:
+            endpoint: API endpoint path (e.g. "/api-external/agency/")
+            params: Dictionary of query parameters. None values are dropped.
+            use_cache: Serve from and store into the response cache, if the client has one.
+
+        Raises:
+            requests.HTTPError if the response status is not 200 once retries are exhausted.
+            CircuitOpenError if the circuit breaker stays open longer than max_circuit_wait.
+        """
+        clean_params = {k: v for k, v in params.items() if v is not None}
+        cache = self.cache if use_cache else None
+        if cache is not None:
+            cached = cache.get(endpoint, clean_params)
+            if cached is not None:
+                self.stats.add(cache_hits=1)
+                return cached
+
+        data = self._request(endpoint, clean_params)
+        if cache is not None:
+            cache.set(endpoint, clean_params, data)
+        return data
+
+    def _request(self, endpoint: str, clean_params: Dict[str, Any]) -> Dict[str, Any]:
+        url = self.base_url + endpoint
+        policy = self.retry_policy
+
+        for attempt in range(policy.max_retries + 1):
+            self._wait_for_circuit()
+            if self.rate_limiter is not None:
+                self.stats.add(wait_seconds=self.rate_limiter.acquire())
+
+            self.stats.add(requests=1)
+            try:
+                with host_slot(url):
+                    response = self.session.get(url, params=clean_params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record_failure()
+                if attempt == policy.max_retries:
+                    raise
+                self._sleep_before_retry(policy.backoff(attempt))
+                continue
+            except requests.RequestException:
+                self._record_failure()
+                raise
+
+            if response.status_code not in policy.retry_status_codes:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                response.raise_for_status()
+                return response.json()
+
+            if response.status_code == 429:
+                self.stats.add(throttled=1)
+            else:
+                self.stats.add(server_errors=1)
+            self._record_failure()
+            if attempt == policy.max_retries:
+                response.raise_for_status()
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self._sleep_before_retry(retry_after if retry_after is not None else policy.backoff(attempt))
+
+    def _wait_for_circuit(self) -> None:
+        if self.circuit_breaker is None:
+            return
+        waited = 0.0
+        delay = self.circuit_breaker.time_until_allowed()
+        while delay > 0:
+            if waited + delay > self.max_circuit_wait:
+                raise CircuitOpenError("HigherGov circuit breaker is open; giving up after %.0fs" % waited)
+            time.sleep(delay)
+            waited += delay
+            delay = self.circuit_breaker.time_until_allowed()
+        self.stats.add(wait_seconds=waited)
+
+    def _record_failure(self) -> None:
+        if self.circuit_breaker is not None and self.circuit_breaker.record_failure():
+            self.stats.add(circuit_opens=1)
+
+    def _sleep_before_retry(self, delay: float) -> None:
+        self.stats.add(retries=1, wait_seconds=delay)
+        time.sleep(delay)
+
+    def close(self) -> None:
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> "HigherGovClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default_client: Optional[HigherGovClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HigherGovClient:
+    """Return the process-wide HigherGovClient, with the on-disk response cache, creating it on first use."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HigherGovClient(cache=ResponseCache())
+        return _default_client
+
+
+def validate_params(spec: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check query params against an endpoint spec from highergov_endpoints.ENDPOINT_SPECS.
+
+    Catches unknown parameters, wrong types, values outside an enum, malformed dates,
+    oversized pages and missing required parameters before a request is sent.
+
+    Returns:
+        dict: The params with None values dropped and date objects converted to YYYY-MM-DD.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    path = spec["path"]
+    param_specs = spec["params"]
+    clean_params = {}
+    for name, value in params.items():
+        if name not in param_specs:
+            raise ValueError(f"{path} does not accept parameter '{name}'")
+        if value is None:
+            continue
+        param_spec = param_specs[name]
+
+        if name == "page_size":
+            if isinstance(value, bool) or not isinstance(value, int) or not 1 <= value <= MAX_PAGE_SIZE:
+                raise ValueError(f"page_size must be an integer between 1 and {MAX_PAGE_SIZE}, got {value!r}")
+        elif param_spec["type"] == "integer":
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError(f"{path} parameter '{name}' must be an integer, got {value!r}")
+        elif param_spec.get("format") == "date":
+            if isinstance(value, datetime):
+                value = value.date().isoformat()
+            elif isinstance(value, date):
+                value = value.isoformat()
+            elif not isinstance(value, str) or not _DATE_PATTERN.match(value):
+                raise ValueError(f"{path} parameter '{name}' must be a date in YYYY-MM-DD format, got {value!r}")
+        elif not isinstance(value, str):
+            raise ValueError(f"{path} parameter '{name}' must be a string, got {value!r}")
+
+        if param_spec.get("enum") and value not in param_spec["enum"]:
+            raise ValueError(f"{path} parameter '{name}' must be one of {param_spec['enum']}, got {value!r}")
+        clean_params[name] = value
+
+    missing = [name for name, param_spec in param_specs.items() if param_spec["required"] and name not in clean_params]
+    if missing:
+        raise ValueError(f"{path} is missing required parameters: {', '.join(missing)}")
+    return clean_params
+
+
+def call_endpoint_spec(
+    spec: Dict[str, Any],
+    params: Dict[str, Any],
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """Validate params against the endpoint spec and fetch a single page."""
+    clean_params = validate_params(spec, params)
+    return (client or get_default_client()).get(spec["path"], clean_params)
+
+
+def iter_endpoint_records(
+    spec: Dict[str, Any],
+    params: Dict[str, Any],
+    page_size: int,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate params against the endpoint spec, then lazily yield the records of every page.
+
+    Validation happens before the first request, so bad parameters fail immediately.
+    """
+    clean_params = validate_params(spec, dict(params, page_size=page_size))
+    client = client or get_default_client()
+
+    def fetch_page(page_number: int) -> Dict[str, Any]:
+        return client.get(spec["path"], dict(clean_params, page_number=page_number))
+
+    return iter_records(fetch_page, page_size, max_page_number, max_workers)
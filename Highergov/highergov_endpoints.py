@@ -0,0 +1,1805 @@
+# Generated by generate_endpoints.py from "HigherGov API.yaml". Do not edit by hand.
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from highergov_client import (
+    DEFAULT_MAX_WORKERS,
+    HigherGovClient,
+    call_endpoint_spec,
+    iter_endpoint_records
+)
+
+DEFAULT_PAGE_SIZE = 100
+
+ENDPOINT_SPECS = {
+    "agency": {
+        "path": "/api-external/agency/",
+        "update_frequency": "Ad Hoc as new agencies are created or become relevant.",
+        "params": {
+            "agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "awardee": {
+        "path": "/api-external/awardee/",
+        "update_frequency": "Updated Monthly.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "awardee_key_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "cage_code": {"type": "string", "format": None, "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-last_update_date", "last_update_date"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "primary_naics": {"type": "string", "format": None, "enum": None, "required": False},
+            "registration_last_update_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "uei": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "awardee_mp": {
+        "path": "/api-external/awardee-mp/",
+        "update_frequency": "",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "awardee_key_mentor": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_mentor_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_protege": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_protege_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "awardee_partnership": {
+        "path": "/api-external/awardee-partnership/",
+        "update_frequency": "Updated Weekly with new subaward data.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "awardee_key_prime": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_prime_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_sub": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_sub_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "contract": {
+        "path": "/api-external/contract/",
+        "update_frequency": "Daily by 2am (for two days prior)",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "award_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_uei": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_uei_parent": {"type": "string", "format": None, "enum": None, "required": False},
+            "awarding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "funding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "last_modified_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "naics_code": {"type": "string", "format": None, "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-action_date", "-current_total_value_of_award", "-last_modified_date", "-period_of_performance_potential_end_date", "-potential_total_value_of_award", "-total_dollars_obligated", "action_date", "current_total_value_of_award", "last_modified_date", "period_of_performance_potential_end_date", "potential_total_value_of_award", "total_dollars_obligated"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "parent_award_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "psc_code": {"type": "string", "format": None, "enum": None, "required": False},
+            "search_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "vehicle_key": {"type": "integer", "format": None, "enum": None, "required": False}
+        }
+    },
+    "document": {
+        "path": "/api-external/document/",
+        "update_frequency": "Real time.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "ordering": {"type": "string", "format": None, "enum": None, "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "related_key": {"type": "string", "format": None, "enum": None, "required": True}
+        }
+    },
+    "grant": {
+        "path": "/api-external/grant/",
+        "update_frequency": "Daily by 2am (for two days prior)",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "awardee_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_uei": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_uei_parent": {"type": "string", "format": None, "enum": None, "required": False},
+            "awarding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "cfda_program_number": {"type": "string", "format": None, "enum": None, "required": False},
+            "funding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "last_modified_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-action_date", "-last_modified_date", "-total_obligated_amount", "action_date", "last_modified_date", "total_obligated_amount"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "search_id": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "grant_program": {
+        "path": "/api-external/grant-program/",
+        "update_frequency": "Ad hoc as new programs are released, typically monthly.",
+        "params": {
+            "agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "cfda_program_number": {"type": "string", "format": None, "enum": None, "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "idv": {
+        "path": "/api-external/idv/",
+        "update_frequency": "Daily by 2am (for two days prior)",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "award_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_uei": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_uei_parent": {"type": "string", "format": None, "enum": None, "required": False},
+            "awarding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "funding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "last_modified_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "naics_code": {"type": "string", "format": None, "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-action_date", "-last_modified_date_ordering", "-ordering_period_end_date", "-potential_total_value_of_award", "action_date", "last_modified_date_ordering", "ordering_period_end_date", "potential_total_value_of_award"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "parent_award_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "psc_code": {"type": "string", "format": None, "enum": None, "required": False},
+            "vehicle_key": {"type": "integer", "format": None, "enum": None, "required": False}
+        }
+    },
+    "naics": {
+        "path": "/api-external/naics/",
+        "update_frequency": "Updated Ad Hoc when codes added or removed by the Census Bureau or the SBA changes size standards",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "naics_code": {"type": "string", "format": None, "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-naics_code", "naics_code"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "opportunity": {
+        "path": "/api-external/opportunity/",
+        "update_frequency": "Updated every 30 minutes",
+        "params": {
+            "agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "captured_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "opp_key": {"type": "string", "format": None, "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-captured_date", "-due_date", "-posted_date", "captured_date", "due_date", "posted_date"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "posted_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "search_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "source_id": {"type": "string", "format": None, "enum": None, "required": False},
+            "source_type": {"type": "string", "format": None, "enum": None, "required": False},
+            "version_key": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "people": {
+        "path": "/api-external/people/",
+        "update_frequency": "Updated in real time.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "contact_email": {"type": "string", "format": None, "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-last_seen", "last_seen"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "psc": {
+        "path": "/api-external/psc/",
+        "update_frequency": "Updated Ad Hoc when codes added or removed",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "psc_code": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "subcontract": {
+        "path": "/api-external/subcontract/",
+        "update_frequency": "Updated weekly.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "awardee_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_uei": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_uei_parent": {"type": "string", "format": None, "enum": None, "required": False},
+            "awarding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "funding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "last_modified_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-last_modified_date", "-subaward_action_date", "-subaward_amount_total", "last_modified_date", "subaward_action_date", "subaward_amount_total"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "subgrant": {
+        "path": "/api-external/subgrant/",
+        "update_frequency": "Updated weekly.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "awardee_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_key_parent": {"type": "integer", "format": None, "enum": None, "required": False},
+            "awardee_uei": {"type": "string", "format": None, "enum": None, "required": False},
+            "awardee_uei_parent": {"type": "string", "format": None, "enum": None, "required": False},
+            "awarding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "funding_agency_key": {"type": "integer", "format": None, "enum": None, "required": False},
+            "last_modified_date": {"type": "string", "format": "date", "enum": None, "required": False},
+            "ordering": {"type": "string", "format": None, "enum": ["-last_modified_date", "-subaward_action_date", "-subaward_amount_total", "last_modified_date", "subaward_action_date", "subaward_amount_total"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False}
+        }
+    },
+    "vehicle": {
+        "path": "/api-external/vehicle/",
+        "update_frequency": "Updated ad hoc as new awards are made.",
+        "params": {
+            "api_key": {"type": "string", "format": None, "enum": None, "required": True},
+            "ordering": {"type": "string", "format": None, "enum": ["-award_date", "award_date"], "required": False},
+            "page_number": {"type": "integer", "format": None, "enum": None, "required": False},
+            "page_size": {"type": "string", "format": None, "enum": None, "required": False},
+            "vehicle_key": {"type": "integer", "format": None, "enum": None, "required": False}
+        }
+    }
+}
+
+def get_agency(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal and State and Local Agencies and hierarchies.
+
+    Update Frequency: Ad Hoc as new agencies are created or become relevant.
+
+    Endpoint: /api-external/agency/
+
+    Args:
+        agency_key: HigherGov Agency key
+        api_key: API Key for authentication
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "agency_key": agency_key,
+        "api_key": api_key,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["agency"], params, client)
+
+
+def iter_agency(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/agency/, in page order. See get_agency."""
+    params = {
+        "agency_key": agency_key,
+        "api_key": api_key
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["agency"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_agency(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/agency/ into a list. See get_agency."""
+    return list(iter_agency(
+        agency_key=agency_key,
+        api_key=api_key,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_awardee(
+    api_key: str,
+    awardee_key_parent: Optional[int] = None,
+    cage_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    primary_naics: Optional[str] = None,
+    registration_last_update_date: Optional[Union[str, date]] = None,
+    uei: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal Awardees registered in SAM and DSBS.
+
+    Update Frequency: Updated Monthly.
+
+    Endpoint: /api-external/awardee/
+
+    Args:
+        api_key: API Key for authentication
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        cage_code: CAGE Code
+        ordering: Which field to use when ordering the results. One of: -last_update_date, last_update_date.
+        page_size: Number of records returned per page (max 100)
+        primary_naics: Primary registered NAICS Code
+        registration_last_update_date: The date the awardee last updated their registration in SAM
+        uei: UEI
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "awardee_key_parent": awardee_key_parent,
+        "cage_code": cage_code,
+        "ordering": ordering,
+        "primary_naics": primary_naics,
+        "registration_last_update_date": registration_last_update_date,
+        "uei": uei,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["awardee"], params, client)
+
+
+def iter_awardee(
+    api_key: str,
+    awardee_key_parent: Optional[int] = None,
+    cage_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    primary_naics: Optional[str] = None,
+    registration_last_update_date: Optional[Union[str, date]] = None,
+    uei: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/awardee/, in page order. See get_awardee."""
+    params = {
+        "api_key": api_key,
+        "awardee_key_parent": awardee_key_parent,
+        "cage_code": cage_code,
+        "ordering": ordering,
+        "primary_naics": primary_naics,
+        "registration_last_update_date": registration_last_update_date,
+        "uei": uei
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["awardee"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_awardee(
+    api_key: str,
+    awardee_key_parent: Optional[int] = None,
+    cage_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    primary_naics: Optional[str] = None,
+    registration_last_update_date: Optional[Union[str, date]] = None,
+    uei: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/awardee/ into a list. See get_awardee."""
+    return list(iter_awardee(
+        api_key=api_key,
+        awardee_key_parent=awardee_key_parent,
+        cage_code=cage_code,
+        ordering=ordering,
+        primary_naics=primary_naics,
+        registration_last_update_date=registration_last_update_date,
+        uei=uei,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_awardee_mp(
+    api_key: str,
+    awardee_key_mentor: Optional[int] = None,
+    awardee_key_mentor_parent: Optional[int] = None,
+    awardee_key_protege: Optional[int] = None,
+    awardee_key_protege_parent: Optional[int] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    awardee_mp
+
+    Endpoint: /api-external/awardee-mp/
+
+    Args:
+        api_key: API Key for authentication
+        awardee_key_mentor: HigherGov Awardee Key of the Mentor
+        awardee_key_mentor_parent: HigherGov Awardee Key of the Mentor Parent
+        awardee_key_protege: HigherGov Awardee Key of the Protege
+        awardee_key_protege_parent: HigherGov Awardee Key of the Protege parent
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "awardee_key_mentor": awardee_key_mentor,
+        "awardee_key_mentor_parent": awardee_key_mentor_parent,
+        "awardee_key_protege": awardee_key_protege,
+        "awardee_key_protege_parent": awardee_key_protege_parent,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["awardee_mp"], params, client)
+
+
+def iter_awardee_mp(
+    api_key: str,
+    awardee_key_mentor: Optional[int] = None,
+    awardee_key_mentor_parent: Optional[int] = None,
+    awardee_key_protege: Optional[int] = None,
+    awardee_key_protege_parent: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/awardee-mp/, in page order. See get_awardee_mp."""
+    params = {
+        "api_key": api_key,
+        "awardee_key_mentor": awardee_key_mentor,
+        "awardee_key_mentor_parent": awardee_key_mentor_parent,
+        "awardee_key_protege": awardee_key_protege,
+        "awardee_key_protege_parent": awardee_key_protege_parent
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["awardee_mp"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_awardee_mp(
+    api_key: str,
+    awardee_key_mentor: Optional[int] = None,
+    awardee_key_mentor_parent: Optional[int] = None,
+    awardee_key_protege: Optional[int] = None,
+    awardee_key_protege_parent: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/awardee-mp/ into a list. See get_awardee_mp."""
+    return list(iter_awardee_mp(
+        api_key=api_key,
+        awardee_key_mentor=awardee_key_mentor,
+        awardee_key_mentor_parent=awardee_key_mentor_parent,
+        awardee_key_protege=awardee_key_protege,
+        awardee_key_protege_parent=awardee_key_protege_parent,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_awardee_partnership(
+    api_key: str,
+    awardee_key_prime: Optional[int] = None,
+    awardee_key_prime_parent: Optional[int] = None,
+    awardee_key_sub: Optional[int] = None,
+    awardee_key_sub_parent: Optional[int] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Teaming partnerships between different Awardees.
+
+    Update Frequency: Updated Weekly with new subaward data.
+
+    Endpoint: /api-external/awardee-partnership/
+
+    Args:
+        api_key: API Key for authentication
+        awardee_key_prime: HigherGov Awardee Key of the prime recipient
+        awardee_key_prime_parent: HigherGov Awardee Key of the prime recipient parent
+        awardee_key_sub: HigherGov Awardee Key of the subawardee
+        awardee_key_sub_parent: HigherGov Awardee Key of the subawardee parent
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "awardee_key_prime": awardee_key_prime,
+        "awardee_key_prime_parent": awardee_key_prime_parent,
+        "awardee_key_sub": awardee_key_sub,
+        "awardee_key_sub_parent": awardee_key_sub_parent,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["awardee_partnership"], params, client)
+
+
+def iter_awardee_partnership(
+    api_key: str,
+    awardee_key_prime: Optional[int] = None,
+    awardee_key_prime_parent: Optional[int] = None,
+    awardee_key_sub: Optional[int] = None,
+    awardee_key_sub_parent: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/awardee-partnership/, in page order. See get_awardee_partnership."""
+    params = {
+        "api_key": api_key,
+        "awardee_key_prime": awardee_key_prime,
+        "awardee_key_prime_parent": awardee_key_prime_parent,
+        "awardee_key_sub": awardee_key_sub,
+        "awardee_key_sub_parent": awardee_key_sub_parent
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["awardee_partnership"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_awardee_partnership(
+    api_key: str,
+    awardee_key_prime: Optional[int] = None,
+    awardee_key_prime_parent: Optional[int] = None,
+    awardee_key_sub: Optional[int] = None,
+    awardee_key_sub_parent: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/awardee-partnership/ into a list. See get_awardee_partnership."""
+    return list(iter_awardee_partnership(
+        api_key=api_key,
+        awardee_key_prime=awardee_key_prime,
+        awardee_key_prime_parent=awardee_key_prime_parent,
+        awardee_key_sub=awardee_key_sub,
+        awardee_key_sub_parent=awardee_key_sub_parent,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_contract(
+    api_key: str,
+    award_id: Optional[str] = None,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    parent_award_id: Optional[str] = None,
+    psc_code: Optional[str] = None,
+    search_id: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal prime contract awards.
+
+    Update Frequency: Daily by 2am (for two days prior)
+
+    Endpoint: /api-external/contract/
+
+    Args:
+        api_key: API Key for authentication
+        award_id: The government Award ID
+        awardee_key: HigherGov Awardee Key
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        awardee_uei: Awardee UEI
+        awardee_uei_parent: Awardee UEI Parent
+        awarding_agency_key: HigherGov Awarding Agency key
+        funding_agency_key: HigherGov Funding Agency key
+        last_modified_date: Last modified date filter (format: YYYY-MM-DD)
+        naics_code: Awards NAICS code
+        ordering: Which field to use when ordering the results. One of: -action_date, -current_total_value_of_award, -last_modified_date, -period_of_performance_potential_end_date, -potential_total_value_of_award, -total_dollars_obligated, action_date, current_total_value_of_award, last_modified_date, period_of_performance_potential_end_date, potential_total_value_of_award, total_dollars_obligated.
+        page_size: Number of records returned per page (max 100)
+        parent_award_id: The government Award ID of the parent Award
+        psc_code: PSC code
+        search_id: HigherGov SearchID
+        vehicle_key: HigherGov Vehicle key
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "award_id": award_id,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "naics_code": naics_code,
+        "ordering": ordering,
+        "parent_award_id": parent_award_id,
+        "psc_code": psc_code,
+        "search_id": search_id,
+        "vehicle_key": vehicle_key,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["contract"], params, client)
+
+
+def iter_contract(
+    api_key: str,
+    award_id: Optional[str] = None,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    parent_award_id: Optional[str] = None,
+    psc_code: Optional[str] = None,
+    search_id: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/contract/, in page order. See get_contract."""
+    params = {
+        "api_key": api_key,
+        "award_id": award_id,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "naics_code": naics_code,
+        "ordering": ordering,
+        "parent_award_id": parent_award_id,
+        "psc_code": psc_code,
+        "search_id": search_id,
+        "vehicle_key": vehicle_key
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["contract"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_contract(
+    api_key: str,
+    award_id: Optional[str] = None,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    parent_award_id: Optional[str] = None,
+    psc_code: Optional[str] = None,
+    search_id: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/contract/ into a list. See get_contract."""
+    return list(iter_contract(
+        api_key=api_key,
+        award_id=award_id,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        naics_code=naics_code,
+        ordering=ordering,
+        parent_award_id=parent_award_id,
+        psc_code=psc_code,
+        search_id=search_id,
+        vehicle_key=vehicle_key,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_document(
+    api_key: str,
+    related_key: str,
+    ordering: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Returns paths for downloading the documents associated with the opportunity. The related_key is required and is found in the document_path field in the Opportunity endpoint.
+
+    Update Frequency: Real time.
+
+    Endpoint: /api-external/document/
+
+    Args:
+        api_key: API Key for authentication
+        ordering: Which field to use when ordering the results.
+        page_size: Number of records returned per page (max 100)
+        related_key: Document Key
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "ordering": ordering,
+        "related_key": related_key,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["document"], params, client)
+
+
+def iter_document(
+    api_key: str,
+    related_key: str,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/document/, in page order. See get_document."""
+    params = {
+        "api_key": api_key,
+        "ordering": ordering,
+        "related_key": related_key
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["document"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_document(
+    api_key: str,
+    related_key: str,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/document/ into a list. See get_document."""
+    return list(iter_document(
+        api_key=api_key,
+        ordering=ordering,
+        related_key=related_key,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_grant(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    cfda_program_number: Optional[str] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    search_id: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal prime grant awards.
+
+    Update Frequency: Daily by 2am (for two days prior)
+
+    Endpoint: /api-external/grant/
+
+    Args:
+        api_key: API Key for authentication
+        awardee_key: HigherGov Awardee Key
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        awardee_uei: Awardee UEI
+        awardee_uei_parent: Awardee UEI Parent
+        awarding_agency_key: HigherGov Awarding Agency key
+        cfda_program_number: Grant Program Number (CFDA)
+        funding_agency_key: HigherGov Funding Agency key
+        last_modified_date: Last modified date filter (format: YYYY-MM-DD)
+        ordering: Which field to use when ordering the results. One of: -action_date, -last_modified_date, -total_obligated_amount, action_date, last_modified_date, total_obligated_amount.
+        page_size: Number of records returned per page (max 100)
+        search_id: HigherGov SearchID
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "cfda_program_number": cfda_program_number,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "ordering": ordering,
+        "search_id": search_id,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["grant"], params, client)
+
+
+def iter_grant(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    cfda_program_number: Optional[str] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    search_id: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/grant/, in page order. See get_grant."""
+    params = {
+        "api_key": api_key,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "cfda_program_number": cfda_program_number,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "ordering": ordering,
+        "search_id": search_id
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["grant"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_grant(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    cfda_program_number: Optional[str] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    search_id: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/grant/ into a list. See get_grant."""
+    return list(iter_grant(
+        api_key=api_key,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        cfda_program_number=cfda_program_number,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        ordering=ordering,
+        search_id=search_id,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_grant_program(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    cfda_program_number: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Government Assistance Programs (Grant Programs or CFDAs).
+
+    Update Frequency: Ad hoc as new programs are released, typically monthly.
+
+    Endpoint: /api-external/grant-program/
+
+    Args:
+        agency_key: HigherGov Agency key
+        api_key: API Key for authentication
+        cfda_program_number: CFDA Program Number for the grant program
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "agency_key": agency_key,
+        "api_key": api_key,
+        "cfda_program_number": cfda_program_number,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["grant_program"], params, client)
+
+
+def iter_grant_program(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    cfda_program_number: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/grant-program/, in page order. See get_grant_program."""
+    params = {
+        "agency_key": agency_key,
+        "api_key": api_key,
+        "cfda_program_number": cfda_program_number
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["grant_program"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_grant_program(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    cfda_program_number: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/grant-program/ into a list. See get_grant_program."""
+    return list(iter_grant_program(
+        agency_key=agency_key,
+        api_key=api_key,
+        cfda_program_number=cfda_program_number,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_idv(
+    api_key: str,
+    award_id: Optional[str] = None,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    parent_award_id: Optional[str] = None,
+    psc_code: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal prime IDV awards.
+
+    Update Frequency: Daily by 2am (for two days prior)
+
+    Endpoint: /api-external/idv/
+
+    Args:
+        api_key: API Key for authentication
+        award_id: The government Award ID
+        awardee_key: HigherGov Awardee Key
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        awardee_uei: Awardee UEI
+        awardee_uei_parent: Awardee UEI Parent
+        awarding_agency_key: HigherGov Awarding Agency key
+        funding_agency_key: HigherGov Funding Agency key
+        last_modified_date: Last modified date filter (format: YYYY-MM-DD)
+        naics_code: Awards NAICS code
+        ordering: Which field to use when ordering the results. One of: -action_date, -last_modified_date_ordering, -ordering_period_end_date, -potential_total_value_of_award, action_date, last_modified_date_ordering, ordering_period_end_date, potential_total_value_of_award.
+        page_size: Number of records returned per page (max 100)
+        parent_award_id: The government Award ID of the parent Award
+        psc_code: PSC code
+        vehicle_key: HigherGov Vehicle key
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "award_id": award_id,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "naics_code": naics_code,
+        "ordering": ordering,
+        "parent_award_id": parent_award_id,
+        "psc_code": psc_code,
+        "vehicle_key": vehicle_key,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["idv"], params, client)
+
+
+def iter_idv(
+    api_key: str,
+    award_id: Optional[str] = None,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    parent_award_id: Optional[str] = None,
+    psc_code: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/idv/, in page order. See get_idv."""
+    params = {
+        "api_key": api_key,
+        "award_id": award_id,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "naics_code": naics_code,
+        "ordering": ordering,
+        "parent_award_id": parent_award_id,
+        "psc_code": psc_code,
+        "vehicle_key": vehicle_key
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["idv"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_idv(
+    api_key: str,
+    award_id: Optional[str] = None,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    parent_award_id: Optional[str] = None,
+    psc_code: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/idv/ into a list. See get_idv."""
+    return list(iter_idv(
+        api_key=api_key,
+        award_id=award_id,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        naics_code=naics_code,
+        ordering=ordering,
+        parent_award_id=parent_award_id,
+        psc_code=psc_code,
+        vehicle_key=vehicle_key,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_naics(
+    api_key: str,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    North American Industry Classification System (NAICS) codes.
+
+    Update Frequency: Updated Ad Hoc when codes added or removed by the Census Bureau or the SBA changes size standards
+
+    Endpoint: /api-external/naics/
+
+    Args:
+        api_key: API Key for authentication
+        naics_code: Awards NAICS code
+        ordering: Which field to use when ordering the results. One of: -naics_code, naics_code.
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "naics_code": naics_code,
+        "ordering": ordering,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["naics"], params, client)
+
+
+def iter_naics(
+    api_key: str,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/naics/, in page order. See get_naics."""
+    params = {
+        "api_key": api_key,
+        "naics_code": naics_code,
+        "ordering": ordering
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["naics"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_naics(
+    api_key: str,
+    naics_code: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/naics/ into a list. See get_naics."""
+    return list(iter_naics(
+        api_key=api_key,
+        naics_code=naics_code,
+        ordering=ordering,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_opportunity(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    captured_date: Optional[Union[str, date]] = None,
+    opp_key: Optional[str] = None,
+    ordering: Optional[str] = None,
+    posted_date: Optional[Union[str, date]] = None,
+    search_id: Optional[str] = None,
+    source_id: Optional[str] = None,
+    source_type: Optional[str] = None,
+    version_key: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Includes federal Contract, DIBBS, Grants, and State and Local Opportunities.
+
+    Update Frequency: Updated every 30 minutes
+
+    Endpoint: /api-external/opportunity/
+
+    Args:
+        agency_key: HigherGov Agency key
+        api_key: API Key for authentication
+        captured_date: Date the opportunity was added to HigherGov
+        opp_key: The HigherGov opportunity key
+        ordering: Which field to use when ordering the results. One of: -captured_date, -due_date, -posted_date, captured_date, due_date, posted_date.
+        page_size: Number of records returned per page (max 100)
+        posted_date: Date the opportunity was posted by the agency in YYYY-MM-DD format
+        search_id: HigherGov SearchID. The following search search fields are currently supported: Active, Applicant Type (Grant Only), Agency, Date Due, Date Posted, Funding Category (Grant Only), Funding Instrument (Grant Only), Grant Program, Keywords, NAICS, NSN, Place of Performance (Federal Contracts Only), PSC, Set Aside, State (State and Local Only), and Value Range
+        source_id: The source opportunity ID
+        source_type: Opportunity source type (sam, dibbs, sbir, grant, sled)
+        version_key: The HigherGov opportunity version key
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "agency_key": agency_key,
+        "api_key": api_key,
+        "captured_date": captured_date,
+        "opp_key": opp_key,
+        "ordering": ordering,
+        "posted_date": posted_date,
+        "search_id": search_id,
+        "source_id": source_id,
+        "source_type": source_type,
+        "version_key": version_key,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["opportunity"], params, client)
+
+
+def iter_opportunity(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    captured_date: Optional[Union[str, date]] = None,
+    opp_key: Optional[str] = None,
+    ordering: Optional[str] = None,
+    posted_date: Optional[Union[str, date]] = None,
+    search_id: Optional[str] = None,
+    source_id: Optional[str] = None,
+    source_type: Optional[str] = None,
+    version_key: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/opportunity/, in page order. See get_opportunity."""
+    params = {
+        "agency_key": agency_key,
+        "api_key": api_key,
+        "captured_date": captured_date,
+        "opp_key": opp_key,
+        "ordering": ordering,
+        "posted_date": posted_date,
+        "search_id": search_id,
+        "source_id": source_id,
+        "source_type": source_type,
+        "version_key": version_key
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["opportunity"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_opportunity(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    captured_date: Optional[Union[str, date]] = None,
+    opp_key: Optional[str] = None,
+    ordering: Optional[str] = None,
+    posted_date: Optional[Union[str, date]] = None,
+    search_id: Optional[str] = None,
+    source_id: Optional[str] = None,
+    source_type: Optional[str] = None,
+    version_key: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/opportunity/ into a list. See get_opportunity."""
+    return list(iter_opportunity(
+        agency_key=agency_key,
+        api_key=api_key,
+        captured_date=captured_date,
+        opp_key=opp_key,
+        ordering=ordering,
+        posted_date=posted_date,
+        search_id=search_id,
+        source_id=source_id,
+        source_type=source_type,
+        version_key=version_key,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_people(
+    api_key: str,
+    contact_email: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal and State and Local People.
+
+    Update Frequency: Updated in real time.
+
+    Endpoint: /api-external/people/
+
+    Args:
+        api_key: API Key for authentication
+        contact_email: Email address
+        ordering: Which field to use when ordering the results. One of: -last_seen, last_seen.
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "contact_email": contact_email,
+        "ordering": ordering,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["people"], params, client)
+
+
+def iter_people(
+    api_key: str,
+    contact_email: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/people/, in page order. See get_people."""
+    params = {
+        "api_key": api_key,
+        "contact_email": contact_email,
+        "ordering": ordering
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["people"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_people(
+    api_key: str,
+    contact_email: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/people/ into a list. See get_people."""
+    return list(iter_people(
+        api_key=api_key,
+        contact_email=contact_email,
+        ordering=ordering,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_psc(
+    api_key: str,
+    psc_code: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Product Service Codes (PSC) Codes.
+
+    Update Frequency: Updated Ad Hoc when codes added or removed
+
+    Endpoint: /api-external/psc/
+
+    Args:
+        api_key: API Key for authentication
+        page_size: Number of records returned per page (max 100)
+        psc_code: PSC code
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "psc_code": psc_code,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["psc"], params, client)
+
+
+def iter_psc(
+    api_key: str,
+    psc_code: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/psc/, in page order. See get_psc."""
+    params = {
+        "api_key": api_key,
+        "psc_code": psc_code
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["psc"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_psc(
+    api_key: str,
+    psc_code: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/psc/ into a list. See get_psc."""
+    return list(iter_psc(
+        api_key=api_key,
+        psc_code=psc_code,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_subcontract(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal prime subcontract award data.
+
+    Update Frequency: Updated weekly.
+
+    Endpoint: /api-external/subcontract/
+
+    Args:
+        api_key: API Key for authentication
+        awardee_key: HigherGov Awardee Key
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        awardee_uei: Awardee UEI
+        awardee_uei_parent: Awardee UEI Parent
+        awarding_agency_key: HigherGov Awarding Agency key
+        funding_agency_key: HigherGov Funding Agency key
+        last_modified_date: Last modified date filter (format: YYYY-MM-DD)
+        ordering: Which field to use when ordering the results. One of: -last_modified_date, -subaward_action_date, -subaward_amount_total, last_modified_date, subaward_action_date, subaward_amount_total.
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "ordering": ordering,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["subcontract"], params, client)
+
+
+def iter_subcontract(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/subcontract/, in page order. See get_subcontract."""
+    params = {
+        "api_key": api_key,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "ordering": ordering
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["subcontract"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_subcontract(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/subcontract/ into a list. See get_subcontract."""
+    return list(iter_subcontract(
+        api_key=api_key,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        ordering=ordering,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_subgrant(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal prime subgrant award data.
+
+    Update Frequency: Updated weekly.
+
+    Endpoint: /api-external/subgrant/
+
+    Args:
+        api_key: API Key for authentication
+        awardee_key: HigherGov Awardee Key
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        awardee_uei: Awardee UEI
+        awardee_uei_parent: Awardee UEI Parent
+        awarding_agency_key: HigherGov Awarding Agency key
+        funding_agency_key: HigherGov Funding Agency key
+        last_modified_date: Last modified date filter (format: YYYY-MM-DD)
+        ordering: Which field to use when ordering the results. One of: -last_modified_date, -subaward_action_date, -subaward_amount_total, last_modified_date, subaward_action_date, subaward_amount_total.
+        page_size: Number of records returned per page (max 100)
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "ordering": ordering,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["subgrant"], params, client)
+
+
+def iter_subgrant(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/subgrant/, in page order. See get_subgrant."""
+    params = {
+        "api_key": api_key,
+        "awardee_key": awardee_key,
+        "awardee_key_parent": awardee_key_parent,
+        "awardee_uei": awardee_uei,
+        "awardee_uei_parent": awardee_uei_parent,
+        "awarding_agency_key": awarding_agency_key,
+        "funding_agency_key": funding_agency_key,
+        "last_modified_date": last_modified_date,
+        "ordering": ordering
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["subgrant"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_subgrant(
+    api_key: str,
+    awardee_key: Optional[int] = None,
+    awardee_key_parent: Optional[int] = None,
+    awardee_uei: Optional[str] = None,
+    awardee_uei_parent: Optional[str] = None,
+    awarding_agency_key: Optional[int] = None,
+    funding_agency_key: Optional[int] = None,
+    last_modified_date: Optional[Union[str, date]] = None,
+    ordering: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/subgrant/ into a list. See get_subgrant."""
+    return list(iter_subgrant(
+        api_key=api_key,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        ordering=ordering,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
+
+def get_vehicle(
+    api_key: str,
+    ordering: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_number: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Federal multi-award contract vehicles.
+
+    Update Frequency: Updated ad hoc as new awards are made.
+
+    Endpoint: /api-external/vehicle/
+
+    Args:
+        api_key: API Key for authentication
+        ordering: Which field to use when ordering the results. One of: -award_date, award_date.
+        page_size: Number of records returned per page (max 100)
+        vehicle_key: HigherGov Vehicle key
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Raises:
+        ValueError: If a parameter does not match the spec.
+    """
+    params = {
+        "api_key": api_key,
+        "ordering": ordering,
+        "vehicle_key": vehicle_key,
+        "page_number": page_number,
+        "page_size": page_size
+    }
+    return call_endpoint_spec(ENDPOINT_SPECS["vehicle"], params, client)
+
+
+def iter_vehicle(
+    api_key: str,
+    ordering: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the records of every page of /api-external/vehicle/, in page order. See get_vehicle."""
+    params = {
+        "api_key": api_key,
+        "ordering": ordering,
+        "vehicle_key": vehicle_key
+    }
+    return iter_endpoint_records(ENDPOINT_SPECS["vehicle"], params, page_size, max_page_number, max_workers, client)
+
+
+def get_all_vehicle(
+    api_key: str,
+    ordering: Optional[str] = None,
+    vehicle_key: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[HigherGovClient] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the records of every page of /api-external/vehicle/ into a list. See get_vehicle."""
+    return list(iter_vehicle(
+        api_key=api_key,
+        ordering=ordering,
+        vehicle_key=vehicle_key,
+        page_size=page_size,
+        max_page_number=max_page_number,
+        max_workers=max_workers,
+        client=client
+    ))
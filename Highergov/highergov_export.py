@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from highergov_client import DEFAULT_MAX_WORKERS, get_page_count
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+def _page_path(export_dir: str, page_number: int) -> str:
+    return os.path.join(export_dir, f"page_{page_number:05d}.json")
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temp file and rename it into place, so a crash never leaves a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(export_dir: str) -> Optional[Dict[str, Any]]:
+    """Return the checkpoint stored in export_dir, or None if the export has not started."""
+    path = os.path.join(export_dir, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def export_pages(
+    fetch_page: Callable[[int], Dict[str, Any]],
+    export_dir: str,
+    page_size: int,
+    signature: Dict[str, Any],
+    max_page_number: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Any]:
+    """
+    Export every page of a paginated HigherGov endpoint to disk, resuming a previous run.
+
+    Each page is written to its own file in export_dir as soon as it arrives, and
+    checkpoint.json records which pages are done. Re-running with the same export_dir
+    only fetches the pages that are still missing. Nothing is held in memory beyond
+    the pages currently in flight.
+
+    Args:
+        fetch_page: Callable taking a 1-based page number and returning the parsed JSON response.
+        export_dir: Directory holding the page files and the checkpoint.
+        page_size: Number of records per page.
+        signature: Parameters identifying the export (endpoint, search_id, page_size...).
+            A checkpoint written for different parameters is rejected.
+        max_page_number: Maximum number of pages to retrieve (None for all).
+        max_workers: Number of pages fetched concurrently.
+
+    Returns:
+        dict: The final checkpoint.
+
+    Raises:
+        ValueError: If export_dir holds a checkpoint for a different export.
+    """
+    os.makedirs(export_dir, exist_ok=True)
+    checkpoint = load_checkpoint(export_dir)
+    resumed = checkpoint is not None
+    if checkpoint is None:
+        checkpoint = {"signature": signature, "total_pages": None, "completed_pages": [], "last_completed_page": 0}
+    elif checkpoint["signature"] != signature:
+        raise ValueError(f"{export_dir} holds a checkpoint for a different export: {checkpoint['signature']}")
+
+    completed = set(checkpoint["completed_pages"])
+    lock = threading.Lock()
+
+    def save_page(page_number: int, response: Dict[str, Any]) -> None:
+        write_json_atomic(_page_path(export_dir, page_number), response.get("results", []))
+        with lock:
+            completed.add(page_number)
+            last = checkpoint["last_completed_page"]
+            while last + 1 in completed:
+                last += 1
+            checkpoint["completed_pages"] = sorted(completed)
+            checkpoint["last_completed_page"] = last
+            write_json_atomic(os.path.join(export_dir, CHECKPOINT_FILE), checkpoint)
+
+    if checkpoint["total_pages"] is None:
+        page_number = checkpoint["last_completed_page"] + 1
+        response = fetch_page(page_number)
+        total_pages = get_page_count(response, page_size)
+        if total_pages is None:
+            # No pagination metadata: walk the pages one at a time until a short page.
+            while True:
+                save_page(page_number, response)
+                if len(response.get("results", [])) < page_size:
+                    break
+                if max_page_number is not None and page_number >= max_page_number:
+                    break
+                page_number += 1
+                response = fetch_page(page_number)
+            checkpoint["total_pages"] = page_number
+            write_json_atomic(os.path.join(export_dir, CHECKPOINT_FILE), checkpoint)
+            return checkpoint
+        checkpoint["total_pages"] = total_pages
+        save_page(page_number, response)
+
+    total_pages = checkpoint["total_pages"]
+    if max_page_number is not None:
+        total_pages = min(total_pages, max_page_number)
+    remaining = [p for p in range(1, total_pages + 1) if p not in completed]
+    if resumed and remaining:
+        print(f"Resuming export: {len(completed)} of {total_pages} pages already on disk")
+
+    def fetch_and_save(page_number: int) -> None:
+        save_page(page_number, fetch_page(page_number))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        # list() surfaces the first worker exception; completed pages stay checkpointed.
+        list(executor.map(fetch_and_save, remaining))
+
+    return checkpoint
+
+
+def iter_exported_records(export_dir: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a finished export, in page order, one page file at a time."""
+    checkpoint = load_checkpoint(export_dir)
+    if checkpoint is None:
+        return
+    for page_number in checkpoint["completed_pages"]:
+        with open(_page_path(export_dir, page_number), "r") as f:
+            yield from json.load(f)
+
+
+def merge_export(export_dir: str, output_file: str, indent: Optional[int] = None) -> int:
+    """
+    Stream a finished export into a single JSON array file without loading it all at once.
+
+    Returns:
+        int: Number of records written.
+    """
+    count = 0
+    with open(output_file, "w") as out:
+        out.write("[")
+        for record in iter_exported_records(export_dir):
+            out.write(",\n" if count else "\n")
+            out.write(json.dumps(record, indent=indent))
+            count += 1
+        out.write("\n]" if count else "]")
+    return count
@@ -0,0 +1,141 @@
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from highergov_client import HigherGovClient, get_default_client, iter_records
+from highergov_export import write_json_atomic
+
+DEFAULT_STORE_DIR = "highergov_store"
+WATERMARKS_FILE = "watermarks.json"
+
+# How each endpoint is synced: the field HigherGov documents as its "Update Check Field",
+# the ordering that returns the newest records first, and the field identifying a record.
+SYNC_ENDPOINTS = {
+    "/api-external/opportunity/": {
+        "watermark_field": "captured_date",
+        "ordering": "-captured_date",
+        "key_field": "opp_key"
+    },
+    "/api-external/contract/": {
+        "watermark_field": "last_modified_date",
+        "ordering": "-last_modified_date",
+        "key_field": "award_id"
+    }
+}
+
+
+def _store_path(store_dir: str, search_id: str, endpoint: str) -> str:
+    endpoint_name = endpoint.strip("/").split("/")[-1]
+    return os.path.join(store_dir, f"{search_id}_{endpoint_name}.json")
+
+
+def load_watermarks(store_dir: str = DEFAULT_STORE_DIR) -> Dict[str, Dict[str, Any]]:
+    """Return the stored high-water marks, keyed by "<search_id>|<endpoint>"."""
+    path = os.path.join(store_dir, WATERMARKS_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def load_store(store_dir: str, search_id: str, endpoint: str) -> Dict[str, Dict[str, Any]]:
+    """Return the locally stored records for a search, keyed by the endpoint's key field."""
+    path = _store_path(store_dir, search_id, endpoint)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def sync_search(
+    api_key: str,
+    search_id: str,
+    endpoint: str = "/api-external/opportunity/",
+    store_dir: str = DEFAULT_STORE_DIR,
+    page_size: int = 100,
+    max_workers: int = 2,
+    client: Optional[HigherGovClient] = None
+) -> Dict[str, Any]:
+    """
+    Incrementally sync the records of a HigherGov search into a local store.
+
+    The first run pulls the whole search. Later runs request the search newest-first
+    (by captured_date for opportunities, last_modified_date for contracts) and stop
+    paging as soon as records fall below the stored high-water mark, so a refresh
+    only downloads what changed since the previous run. Records are merged into the
+    store by key, replacing older copies.
+
+    The watermark date itself is re-read on every run, because HigherGov dates have
+    day granularity and more records can land on the same day.
+
+    Args:
+        api_key: HigherGov API key.
+        search_id: HigherGov SearchID.
+        endpoint: Endpoint to sync; one of SYNC_ENDPOINTS.
+        store_dir: Directory holding the record stores and watermarks.json.
+        page_size: Number of records per page (max 100).
+        max_workers: Number of pages fetched ahead of the watermark check.
+        client: HigherGovClient to use; defaults to the shared client.
+
+    Returns:
+        dict: fetched (records downloaded), total (records in the store) and the new watermark.
+
+    Raises:
+        ValueError: If the endpoint does not support incremental sync.
+    """
+    if endpoint not in SYNC_ENDPOINTS:
+        raise ValueError(f"Incremental sync is not supported for {endpoint}")
+
+    config = SYNC_ENDPOINTS[endpoint]
+    watermark_field = config["watermark_field"]
+    key_field = config["key_field"]
+    client = client or get_default_client()
+
+    os.makedirs(store_dir, exist_ok=True)
+    watermarks = load_watermarks(store_dir)
+    watermark_key = f"{search_id}|{endpoint}"
+    watermark = (watermarks.get(watermark_key) or {}).get("watermark")
+    store = load_store(store_dir, search_id, endpoint)
+
+    def fetch_page(page_number: int) -> Dict[str, Any]:
+        params = {
+            "api_key": api_key,
+            "search_id": search_id,
+            "ordering": config["ordering"],
+            "page_number": page_number,
+            "page_size": page_size
+        }
+        # Always hit the API: a cached newest-first page would end the sync early.
+        return client.get(endpoint, params, use_cache=False)
+
+    fetched = 0
+    new_watermark = watermark
+    records = iter_records(fetch_page, page_size=page_size, max_workers=max_workers)
+    for record in records:
+        changed_on = record.get(watermark_field)
+        if watermark and changed_on and changed_on < watermark:
+            # Everything after this point was already synced on a previous run.
+            records.close()
+            break
+        key = record.get(key_field)
+        if key is None:
+            continue
+        store[key] = record
+        fetched += 1
+        if changed_on and (new_watermark is None or changed_on > new_watermark):
+            new_watermark = changed_on
+
+    write_json_atomic(_store_path(store_dir, search_id, endpoint), store)
+    watermarks[watermark_key] = {
+        "watermark": new_watermark,
+        "synced_at": datetime.now(timezone.utc).isoformat()
+    }
+    write_json_atomic(os.path.join(store_dir, WATERMARKS_FILE), watermarks)
+
+    print(f"Synced {fetched} changed records for {search_id} ({endpoint}); store holds {len(store)}")
+    return {"fetched": fetched, "total": len(store), "watermark": new_watermark}
+
+
+if __name__ == "__main__":
+    sync_search(api_key=os.getenv("HIGHERGOV_KEY"), search_id="I1sN-gdKpKyZgXqIqATxh")
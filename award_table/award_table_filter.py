@@ -1,4 +1,5 @@
 import os
+import sys
 import json
 from datetime import datetime, timezone, date, timedelta
 from typing import List, Dict, Optional
@@ -6,6 +7,15 @@ from supabase import create_client, Client
 from dotenv import load_dotenv
 from dataclasses import dataclass
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from columnar_store import write_parquet
+from fulltext_search import FULLTEXT_COLUMNS, FULLTEXT_CONFIG
+from keyword_compiler import compile_keyword_query
+from partitioned_scan import apply_bounds, scan_partitions, split_int_range
+from projection import build_select
+from query_compiler import FilterSpec, get_plan
+from reference_data import warn_unknown_codes
+
 @dataclass
 class AwardsQuery:
     INCLUDE_RECIPIENT_UEI: Optional[List[str]] = None
@@ -27,115 +37,128 @@ class AwardsQuery:
     KEYWORD_QUERY: Optional[str] = None
 
 
-def get_filtered_awards(supabase: Client, aq: AwardsQuery) -> List[Dict[str, any]]:
-    all_awards = []
+def _keyset_condition(usa_spending_id: int, piid: str) -> str:
+    """PostgREST condition selecting rows after (usa_spending_id, piid) in primary key order."""
+    quoted_piid = '"' + piid.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return f"usa_spending_id.gt.{usa_spending_id},and(usa_spending_id.eq.{usa_spending_id},piid.gt.{quoted_piid})"
+
+
+def _usa_spending_id_bounds(supabase: Client) -> Optional[tuple]:
+    """Return the smallest and largest usa_spending_id in the awards table, or None if it is empty."""
+    lowest = supabase.from_("awards").select("usa_spending_id").order("usa_spending_id").limit(1).execute()
+    if not lowest.data:
+        return None
+    highest = supabase.from_("awards").select("usa_spending_id").order("usa_spending_id", desc=True).limit(1).execute()
+    return lowest.data[0]["usa_spending_id"], highest.data[0]["usa_spending_id"]
+
+
+def _resolve_fpds_codes(supabase: Client, organization_keys: List[str]) -> List[str]:
+    """Return the fpds_codes of the given organizations, which awards reference as funding_agency_subtier_agency_code."""
+    org_res = supabase.from_("organizations")\
+        .select("fpds_code")\
+        .in_("organization_key", organization_keys)\
+        .execute()
+    fpds_codes = [org["fpds_code"] for org in org_res.data or [] if org.get("fpds_code")]
+    print(f"Resolved fpds_codes for organization keys {organization_keys}:", fpds_codes)
+    return fpds_codes
+
+
+# How each AwardsQuery field filters the awards table.
+AWARDS_FILTER_SPECS = (
+    FilterSpec("INCLUDE_RECIPIENT_UEI", ("recipient_uei", "parent_recipient_uei"), "in_any"),
+    FilterSpec("EXCLUDE_RECIPIENT_UEI", "recipient_uei", "not_in"),
+    FilterSpec("EXCLUDE_RECIPIENT_UEI", "parent_recipient_uei", "not_in"),
+    FilterSpec("POTENTIAL_END_DATE_START", "period_of_performance_potential_end_date", "gte"),
+    FilterSpec("POTENTIAL_END_DATE_END", "period_of_performance_potential_end_date", "lte"),
+    FilterSpec("INCLUDE_NAICS", "naics", "in"),
+    FilterSpec("EXCLUDE_NAICS", "naics", "not_in"),
+    FilterSpec("INCLUDE_PSC", "product_or_service_code", "in"),
+    FilterSpec("EXCLUDE_PSC", "product_or_service_code", "not_in"),
+    FilterSpec("INCLUDE_SET_ASIDE_IDS", "type_set_aside", "in"),
+    FilterSpec("EXCLUDE_SET_ASIDE_IDS", "type_set_aside", "not_in"),
+    FilterSpec("INCLUDE_ORGANIZATION_KEYS", "funding_agency_subtier_agency_code", "in", resolve=_resolve_fpds_codes,
+               needs_client=True),
+    FilterSpec("EXCLUDE_ORGANIZATION_KEYS", "funding_agency_subtier_agency_code", "not_in", resolve=_resolve_fpds_codes,
+               needs_client=True),
+    FilterSpec("INCLUDE_EXTENT_COMPETED", "extent_competed_description", "in"),
+    FilterSpec("EXCLUDE_EXTENT_COMPETED", "extent_competed_description", "not_in"),
+    FilterSpec("AMOUNT_OBLIGATED_MINIMUM", "total_obligation", "gte"),
+    FilterSpec("AMOUNT_OBLIGATED_MAXIMUM", "total_obligation", "lte"),
+    FilterSpec("KEYWORD_QUERY", FULLTEXT_COLUMNS["awards"][0], "text_search", resolve=compile_keyword_query,
+               options=(("config", FULLTEXT_CONFIG),))
+)
+
+
+def get_filtered_awards(
+    supabase: Client,
+    aq: AwardsQuery,
+    partitions: int = 1,
+    max_workers: Optional[int] = None,
+    projection: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> List[Dict[str, any]]:
+    """
+    Retrieve the awards matching the query.
+
+    The query is compiled once into a QueryPlan following AWARDS_FILTER_SPECS (and reused
+    for an equal query within PLAN_CACHE_TTL), then applied to every page.
+
+    With partitions > 1 the usa_spending_id key space is split into that many ranges,
+    which are paged through concurrently and merged back in key order, so the result
+    is the same as a serial pull.
+
+    projection names a profile of common/projection.py (summary, detail, export) and fields
+    lists extra columns; by default every column is selected. The key columns
+    usa_spending_id and piid are always included.
+    """
     limit = 1000
-    offset = 0
-
-    fpds_codes_include = []
-    if aq.INCLUDE_ORGANIZATION_KEYS:
-        print("Applying INCLUDE_ORGANIZATION_KEYS filter with values:", aq.INCLUDE_ORGANIZATION_KEYS)
-        org_res = supabase.from_("organizations")\
-            .select("fpds_code")\
-            .in_("organization_key", aq.INCLUDE_ORGANIZATION_KEYS)\
-            .execute()
-        if org_res.data:
-            fpds_codes_include = [org["fpds_code"] for org in org_res.data if org.get("fpds_code")]
-            print("Resolved fpds_codes for include:", fpds_codes_include)
-
-    fpds_codes_exclude = []
-    if aq.EXCLUDE_ORGANIZATION_KEYS:
-        print("Applying EXCLUDE_ORGANIZATION_KEYS filter with values:", aq.EXCLUDE_ORGANIZATION_KEYS)
-        org_res = supabase.from_("organizations")\
-            .select("fpds_code")\
-            .in_("organization_key", aq.EXCLUDE_ORGANIZATION_KEYS)\
-            .execute()
-        if org_res.data:
-            fpds_codes_exclude = [org["fpds_code"] for org in org_res.data if org.get("fpds_code")]
-            print("Resolved fpds_codes for exclude:", fpds_codes_exclude)
-
-    while True:
-        query = supabase.from_("awards").select("*")
-        
-        if aq.INCLUDE_RECIPIENT_UEI:
-            print("Applying INCLUDE_RECIPIENT_UEI filter with values:", aq.INCLUDE_RECIPIENT_UEI)
-            uei_values = ",".join(aq.INCLUDE_RECIPIENT_UEI)
-            condition = f"recipient_uei.in.({uei_values}),parent_recipient_uei.in.({uei_values})"
-            query = query.or_(condition)
-        
-        if aq.EXCLUDE_RECIPIENT_UEI:
-            for uei in aq.EXCLUDE_RECIPIENT_UEI:
-                print("Excluding RECIPIENT_UEI:", uei)
-                query = query.neq("recipient_uei", uei)
-                query = query.neq("parent_recipient_uei", uei)
-        
-        if aq.POTENTIAL_END_DATE_START:
-            print("Applying POTENTIAL_END_DATE_START filter with value:", aq.POTENTIAL_END_DATE_START)
-            query = query.gte("period_of_performance_potential_end_date", aq.POTENTIAL_END_DATE_START)
-        if aq.POTENTIAL_END_DATE_END:
-            print("Applying POTENTIAL_END_DATE_END filter with value:", aq.POTENTIAL_END_DATE_END)
-            query = query.lte("period_of_performance_potential_end_date", aq.POTENTIAL_END_DATE_END)
-        
-        if aq.INCLUDE_NAICS:
-            print("Applying INCLUDE_NAICS filter with values:", aq.INCLUDE_NAICS)
-            query = query.in_("naics", aq.INCLUDE_NAICS)
-        if aq.EXCLUDE_NAICS:
-            for code in aq.EXCLUDE_NAICS:
-                print("Excluding NAICS code:", code)
-                query = query.neq("naics", code)
-        
-        if aq.INCLUDE_PSC:
-            print("Applying INCLUDE_PSC filter with values:", aq.INCLUDE_PSC)
-            query = query.in_("product_or_service_code", aq.INCLUDE_PSC)
-        if aq.EXCLUDE_PSC:
-            for psc in aq.EXCLUDE_PSC:
-                print("Excluding PSC code:", psc)
-                query = query.neq("product_or_service_code", psc)
-        
-        if aq.INCLUDE_SET_ASIDE_IDS:
-            print("Applying INCLUDE_SET_ASIDE_IDS filter with values:", aq.INCLUDE_SET_ASIDE_IDS)
-            query = query.in_("type_set_aside", aq.INCLUDE_SET_ASIDE_IDS)
-        if aq.EXCLUDE_SET_ASIDE_IDS:
-            for sid in aq.EXCLUDE_SET_ASIDE_IDS:
-                print("Excluding SET_ASIDE_ID:", sid)
-                query = query.neq("type_set_aside", sid)
-        
-        if fpds_codes_include:
-            print("Applying organization include filter with fpds_codes:", fpds_codes_include)
-            query = query.in_("funding_agency_subtier_agency_code", fpds_codes_include)
-        if fpds_codes_exclude:
-            for code in fpds_codes_exclude:
-                print("Excluding organization fpds_code:", code)
-                query = query.neq("funding_agency_subtier_agency_code", code)
-        
-        if aq.INCLUDE_EXTENT_COMPETED:
-            print("Applying INCLUDE_EXTENT_COMPETED filter with values:", aq.INCLUDE_EXTENT_COMPETED)
-            query = query.in_("extent_competed_description", aq.INCLUDE_EXTENT_COMPETED)
-        if aq.EXCLUDE_EXTENT_COMPETED:
-            for val in aq.EXCLUDE_EXTENT_COMPETED:
-                print("Excluding EXTENT_COMPETED value:", val)
-                query = query.neq("extent_competed_description", val)
-        
-        if aq.AMOUNT_OBLIGATED_MINIMUM is not None:
-            print("Applying AMOUNT_OBLIGATED_MINIMUM filter with value:", aq.AMOUNT_OBLIGATED_MINIMUM)
-            query = query.gte("total_obligation", aq.AMOUNT_OBLIGATED_MINIMUM)
-        if aq.AMOUNT_OBLIGATED_MAXIMUM is not None:
-            print("Applying AMOUNT_OBLIGATED_MAXIMUM filter with value:", aq.AMOUNT_OBLIGATED_MAXIMUM)
-            query = query.lte("total_obligation", aq.AMOUNT_OBLIGATED_MAXIMUM)
-
-        query = query.range(offset, offset + limit - 1)
-        
-        if aq.KEYWORD_QUERY:
-            print("Applying KEYWORD_QUERY filter with value:", aq.KEYWORD_QUERY)
-            query = query.text_search("description", aq.KEYWORD_QUERY, {'config': 'english', 'type': 'websearch'})
-        
-        result = query.execute()
-        if not result.data:
-            break
-        all_awards.extend(result.data)
-        offset += limit
-
-    return all_awards
+    select = build_select("awards", projection, fields)
+
+    # Catch typos in code filters before they silently empty the result.
+    warn_unknown_codes(supabase, "naics", aq.INCLUDE_NAICS, "Included NAICS codes")
+    warn_unknown_codes(supabase, "psc", aq.INCLUDE_PSC, "Included PSC codes")
+
+    plan = get_plan(AWARDS_FILTER_SPECS, aq, supabase)
+    if plan.matches_nothing:
+        return []
+
+    # Keyset pagination on the primary key (usa_spending_id, piid): each page starts
+    # after the last row of the previous one, so Postgres never scans skipped rows and
+    # rows inserted behind the cursor cannot shift later pages.
+    def fetch_partition(partition) -> List[Dict[str, any]]:
+        awards = []
+        last_key = None
+        while True:
+            query = plan.query(supabase, "awards", select)
+            query = apply_bounds(query, "usa_spending_id", partition)
+
+            if last_key is not None:
+                query = query.or_(_keyset_condition(*last_key))
+
+            query = query.order("usa_spending_id").order("piid").limit(limit)
+
+            # text_search must come last: it returns a builder that takes no further filters.
+            query = plan.apply_text_search(query)
+
+            result = query.execute()
+            if not result.data:
+                break
+            awards.extend(result.data)
+            if len(result.data) < limit:
+                break
+            last_row = result.data[-1]
+            last_key = (last_row["usa_spending_id"], last_row["piid"])
+        return awards
+
+    key_partitions = [(None, None)]
+    if partitions > 1:
+        bounds = _usa_spending_id_bounds(supabase)
+        if bounds is None:
+            return []
+        key_partitions = split_int_range(bounds[0], bounds[1], partitions)
+        print(f"Scanning {len(key_partitions)} usa_spending_id partitions concurrently")
+
+    return scan_partitions(fetch_partition, key_partitions, max_workers)
 
 
 def main():
@@ -207,11 +230,16 @@ def main():
                      "'Contractor Logistic Support' | 'Cyber RMF'"
     )
 
-    awards = get_filtered_awards(supabase, aq)
+    awards = get_filtered_awards(supabase, aq, partitions=4)
     print("Number of awards results:", len(awards))
-    with open("results/awards_filtered_results.json", "w") as f:
-        json.dump(awards, f, indent=2, default=str)
-    print("Saved results to results/awards_filtered_results.json")
+    try:
+        write_parquet(awards, "results/awards_filtered_results.parquet", "awards")
+        print("Saved results to results/awards_filtered_results.parquet")
+    except ImportError as e:
+        print(f"WARNING: {e}; writing JSON instead")
+        with open("results/awards_filtered_results.json", "w") as f:
+            json.dump(awards, f, separators=(",", ":"), default=str)
+        print("Saved results to results/awards_filtered_results.json")
 
 
 if __name__ == "__main__":
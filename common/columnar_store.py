@@ -0,0 +1,150 @@
+"""
+Columnar storage for Supabase query results.
+
+Results are written as Parquet (compressed, for storage and sharing) or Arrow IPC
+(uncompressed, for zero-copy memory-mapped reads), with an Arrow schema derived from
+award_table/DB_Schema/schema.json. Reading back with read_columns only loads the
+columns asked for, so analysis of a large pull does not have to parse the whole file.
+
+Columns that are not plain scalars in Postgres (ARRAY, jsonb) and embedded relations
+such as naics_details are stored as JSON strings.
+"""
+import json
+import os
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "award_table", "DB_Schema", "schema.json")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar output: pip install pyarrow")
+
+
+def load_table_columns(table_name: str, schema_path: str = SCHEMA_PATH) -> Dict[str, str]:
+    """Return {column_name: postgres data_type} for a table of the database schema dump."""
+    with open(schema_path, "r") as f:
+        tables = json.load(f)
+    for table in tables:
+        if table["table_name"] == table_name:
+            return {c["column_name"]: c["data_type"] for c in table["columns"]}
+    raise ValueError(f"Table {table_name} is not in {schema_path}")
+
+
+def _arrow_type(data_type: str):
+    types = {
+        "text": pa.string(),
+        "bigint": pa.int64(),
+        "boolean": pa.bool_(),
+        "double precision": pa.float64(),
+        "date": pa.date32(),
+        "timestamp with time zone": pa.timestamp("us", tz="UTC"),
+        "timestamp without time zone": pa.timestamp("us")
+    }
+    # ARRAY, jsonb and anything unknown are kept as JSON text.
+    return types.get(data_type, pa.string())
+
+
+def _converter(data_type: str) -> Callable[[Any], Any]:
+    """Return a function turning a value as returned by PostgREST into one Arrow accepts for the column."""
+    if data_type in ("timestamp with time zone", "timestamp without time zone"):
+        def to_timestamp(value):
+            if value is None or isinstance(value, datetime):
+                return value
+            parsed = datetime.fromisoformat(value)
+            return parsed.replace(tzinfo=None) if data_type == "timestamp without time zone" else parsed
+        return to_timestamp
+    if data_type == "date":
+        return lambda value: date.fromisoformat(value[:10]) if isinstance(value, str) else value
+    if data_type == "bigint":
+        return lambda value: int(value) if value is not None else None
+    if data_type == "double precision":
+        return lambda value: float(value) if value is not None else None
+    if data_type in ("text", "boolean"):
+        return lambda value: value
+    return lambda value: json.dumps(value, default=str) if value is not None else None
+
+
+def records_to_table(records: List[Dict[str, Any]], table_name: str, schema_path: str = SCHEMA_PATH):
+    """
+    Convert query result rows into an Arrow table typed from the database schema.
+
+    Columns of the schema come first, in schema order; keys found in the records but not
+    in the schema (embedded relations, computed fields) follow as JSON strings.
+    """
+    _require_pyarrow()
+    columns = load_table_columns(table_name, schema_path)
+    extra = []
+    seen = set(columns)
+    for record in records:
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                extra.append(key)
+
+    fields, arrays = [], []
+    for name, data_type in list(columns.items()) + [(key, "jsonb") for key in extra]:
+        convert = _converter(data_type)
+        arrow_type = _arrow_type(data_type)
+        fields.append(pa.field(name, arrow_type))
+        arrays.append(pa.array([convert(record.get(name)) for record in records], type=arrow_type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def write_parquet(
+    records: List[Dict[str, Any]],
+    path: str,
+    table_name: str,
+    compression: str = "zstd"
+) -> int:
+    """
+    Write query results to a Parquet file.
+
+    Returns:
+        int: Number of rows written.
+    """
+    table = records_to_table(records, table_name)
+    pq.write_table(table, path, compression=compression)
+    return table.num_rows
+
+
+def write_arrow_ipc(records: List[Dict[str, Any]], path: str, table_name: str) -> int:
+    """
+    Write query results to an uncompressed Arrow IPC file, which read_columns can memory-map without copying.
+
+    Returns:
+        int: Number of rows written.
+    """
+    table = records_to_table(records, table_name)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return table.num_rows
+
+
+def read_columns(path: str, columns: Optional[List[str]] = None, memory_map: bool = True):
+    """
+    Read a Parquet (.parquet) or Arrow IPC (.arrow, .feather) file, loading only the given columns.
+
+    Args:
+        path: File written by write_parquet or write_arrow_ipc.
+        columns: Columns to load (None for all).
+        memory_map: Memory-map the file instead of reading it into memory.
+
+    Returns:
+        pyarrow.Table: Use .to_pylist() for records or .to_pandas() for a DataFrame.
+    """
+    _require_pyarrow()
+    if path.endswith(".parquet"):
+        return pq.read_table(path, columns=columns, memory_map=memory_map)
+    source = pa.memory_map(path, "r") if memory_map else pa.OSFile(path, "rb")
+    table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
@@ -0,0 +1,76 @@
+"""
+Full-text search settings shared by the keyword filters, and checks that the GIN indexes
+of supabase/migrations/20261016150000_fulltext_search_indexes.sql serve them.
+
+explain_keyword_search and refresh_fts_statistics are not executable by anon or
+authenticated, so call them with a service role key.
+
+Usage:
+    python fulltext_search.py [awards|notices] [keyword query]
+"""
+import os
+import sys
+from typing import List
+
+# Text search configuration of the keyword filters. The indexes are built on
+# to_tsvector('english', column); a filter using another config cannot use them.
+FULLTEXT_CONFIG = "english"
+
+# Table -> (searched column, GIN index on to_tsvector(FULLTEXT_CONFIG, column)).
+FULLTEXT_COLUMNS = {
+    "awards": ("description", "awards_description_fts_idx"),
+    "notices": ("opportunity_text", "notices_opportunity_text_fts_idx")
+}
+
+
+def explain_keyword_search(supabase, table: str, keyword_query: str) -> List[str]:
+    """Return the Postgres plan of a keyword search on the table, one line per item."""
+    if table not in FULLTEXT_COLUMNS:
+        raise ValueError(f"{table} has no full-text index: {sorted(FULLTEXT_COLUMNS)}")
+    response = supabase.rpc("explain_keyword_search", {"p_table": table, "p_query": keyword_query}).execute()
+    return [row if isinstance(row, str) else next(iter(row.values())) for row in response.data or []]
+
+
+def verify_fulltext_index(supabase, table: str, keyword_query: str = "radar") -> bool:
+    """
+    Check that a keyword search on the table goes through its GIN index.
+
+    Returns:
+        bool: True if the plan uses the index; otherwise prints a warning with the plan.
+    """
+    index_name = FULLTEXT_COLUMNS.get(table, (None, None))[1]
+    plan = explain_keyword_search(supabase, table, keyword_query)
+    if any(index_name in line for line in plan):
+        print(f"INFO: Keyword search on {table} uses {index_name}")
+        return True
+    print(f"WARNING: Keyword search on {table} does not use {index_name}; "
+          f"check the migration ran and the filter config is '{FULLTEXT_CONFIG}'. Plan:")
+    for line in plan:
+        print("    " + line)
+    return False
+
+
+def refresh_fts_statistics(supabase) -> None:
+    """Re-analyze the searched tables so the planner has current statistics for the indexes."""
+    supabase.rpc("refresh_fts_statistics", {}).execute()
+
+
+def main():
+    from dotenv import load_dotenv
+    from supabase import create_client
+
+    load_dotenv()
+    SUPABASE_URL = os.getenv("SUPABASE_URL")
+    SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+    tables = [sys.argv[1]] if len(sys.argv) > 1 else list(FULLTEXT_COLUMNS)
+    keyword_query = sys.argv[2] if len(sys.argv) > 2 else "radar"
+    results = [verify_fulltext_index(supabase, table, keyword_query) for table in tables]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Compile keyword phrase lists into compact to_tsquery strings.
+
+The keyword filters send an OR of quoted phrases ('Digital Engineering' | 'radar' | ...)
+to PostgREST's fts operator, i.e. Postgres to_tsquery. Long hand-maintained lists repeat
+phrases, and a phrase containing a shorter listed phrase can never add a match to an OR.
+compile_keyword_query drops both, so every page request carries only the phrases that
+matter, while keeping each phrase's text for Postgres to tokenize and stem as before.
+
+Compiled queries can be stored by name in the keyword_searches table
+(supabase/migrations/20261016140000_keyword_searches.sql), where Postgres parses them
+once when they are saved, and reloaded with load_keyword_search.
+"""
+import re
+from typing import Iterable, List, Optional, Tuple, Union
+
+# Operators that make a query more than an OR of phrases; such queries are passed through.
+_OPERATOR_PATTERN = re.compile(r"[&!<>()]")
+_QUOTED_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_SIMPLE_WORD = re.compile(r"[a-z0-9]+")
+
+# Postgres' english stop words (tsearch_data/english.stop). to_tsquery drops them, so a
+# phrase made only of them matches nothing and must not stand in for longer phrases.
+ENGLISH_STOP_WORDS = frozenset("""
+    i me my myself we our ours ourselves you your yours yourself yourselves he him his
+    himself she her hers herself it its itself they them their theirs themselves what
+    which who whom this that these those am is are was were be been being have has had
+    having do does did doing a an the and but if or because as until while of at by for
+    with about against between into through during before after above below to from up
+    down in out on off over under again further then once here there when where why how
+    all any both each few more most other some such no nor not only own same so than too
+    very s t can will just don should now
+""".split())
+
+
+def parse_keyword_phrases(keyword_query: str) -> List[str]:
+    """Split a `'phrase' | 'phrase' | word` query into its phrases, unquoted."""
+    phrases = []
+    for part in keyword_query.split("|"):
+        part = part.strip()
+        if len(part) >= 2 and part[0] == part[-1] and part[0] in "'\"":
+            part = part[1:-1].replace("''", "'")
+        if part.strip():
+            phrases.append(part)
+    return phrases
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Lowercase and collapse whitespace; full-text matching ignores both."""
+    return " ".join(phrase.lower().split())
+
+
+def _is_operator_query(keyword_query: str) -> bool:
+    return bool(_OPERATOR_PATTERN.search(_QUOTED_PATTERN.sub("", keyword_query)))
+
+
+def _contains(words: Tuple[str, ...], shorter: Tuple[str, ...]) -> bool:
+    """Whether `shorter` occurs as a contiguous run of `words`."""
+    size = len(shorter)
+    return any(words[i:i + size] == shorter for i in range(len(words) - size + 1))
+
+
+def reduce_phrases(phrases: Iterable[str]) -> Tuple[List[str], int, int]:
+    """
+    Remove duplicate phrases and phrases made redundant by a shorter one.
+
+    'Hardware Reverse Engineering' is dropped when 'Reverse Engineering' is listed: any
+    text matching the longer phrase matches the shorter, so the OR is unchanged. Only
+    phrases of plain alphanumeric words are compared this way, since Postgres splits
+    those word by word; anything with punctuation is only deduplicated. A phrase of
+    stop words only ('and') has no lexeme left in to_tsquery, so it covers nothing.
+
+    Returns:
+        tuple: (remaining phrases in first-seen order, duplicates removed, phrases covered by a shorter one)
+    """
+    phrases = list(phrases)
+    unique = []
+    seen = set()
+    for phrase in phrases:
+        normalized = normalize_phrase(phrase)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            unique.append(normalized)
+    duplicates = len(phrases) - len(unique)
+
+    simple = {}
+    for phrase in unique:
+        words = tuple(phrase.split(" "))
+        if all(_SIMPLE_WORD.fullmatch(word) for word in words):
+            simple[phrase] = words
+    covering = {
+        phrase: words for phrase, words in simple.items()
+        if any(word not in ENGLISH_STOP_WORDS for word in words)
+    }
+
+    remaining = []
+    for phrase in unique:
+        words = simple.get(phrase)
+        covered = words is not None and any(
+            other != phrase and len(other_words) < len(words) and _contains(words, other_words)
+            for other, other_words in covering.items()
+        )
+        if not covered:
+            remaining.append(phrase)
+    return remaining, duplicates, len(unique) - len(remaining)
+
+
+def _quote(phrase: str) -> str:
+    if _SIMPLE_WORD.fullmatch(phrase):
+        return phrase
+    return "'" + phrase.replace("'", "''") + "'"
+
+
+def compile_keyword_query(keywords: Union[str, Iterable[str]], verbose: bool = True) -> str:
+    """
+    Compile a keyword query, or a list of phrases, into a compact to_tsquery OR-string.
+
+    Queries using operators other than | (&, !, <->, parentheses) are returned unchanged.
+
+    Example:
+        compile_keyword_query("'Command' | 'Command Control' | 'radar' | 'Radar'")
+        # -> "command | radar"
+    """
+    if isinstance(keywords, str):
+        if _is_operator_query(keywords):
+            return keywords
+        phrases = parse_keyword_phrases(keywords)
+        original_length = len(keywords)
+    else:
+        phrases = list(keywords)
+        original_length = None
+
+    remaining, duplicates, covered = reduce_phrases(phrases)
+    compiled = " | ".join(_quote(phrase) for phrase in remaining)
+    if verbose and (duplicates or covered):
+        size = f", {original_length} -> {len(compiled)} characters" if original_length is not None else ""
+        print(f"INFO: Keyword query compiled from {len(phrases)} to {len(remaining)} phrases "
+              f"({duplicates} duplicates, {covered} covered by a shorter phrase){size}")
+    return compiled
+
+
+def register_keyword_search(supabase, name: str, keywords: Union[str, Iterable[str]]) -> str:
+    """
+    Compile a keyword query and save it under a name in the keyword_searches table.
+
+    Postgres parses the query on insert (the table's tsquery column), so a malformed
+    query fails here instead of on the first page of a search.
+
+    Returns:
+        str: The compiled query, ready for text_search.
+    """
+    if not isinstance(keywords, str):
+        keywords = list(keywords)
+    source = keywords if isinstance(keywords, str) else " | ".join(_quote(normalize_phrase(k)) for k in keywords)
+    compiled = compile_keyword_query(keywords)
+    supabase.table("keyword_searches").upsert({
+        "name": name,
+        "source_query": source,
+        "query_text": compiled
+    }).execute()
+    return compiled
+
+
+def load_keyword_search(supabase, name: str) -> Optional[str]:
+    """Return the compiled query saved under a name, or None if there is none."""
+    response = supabase.table("keyword_searches") \
+        .select("query_text") \
+        .eq("name", name) \
+        .limit(1) \
+        .execute()
+    return response.data[0]["query_text"] if response.data else None
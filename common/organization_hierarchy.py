@@ -0,0 +1,50 @@
+"""
+Organization hierarchy lookups backed by the organization_closure table
+(supabase/migrations/20261016130000_organization_closure.sql).
+
+Notices under a set of organizations are selected in Postgres by the
+notices_under_organizations RPC, which joins organization_closure to notices; the
+descendant keys never travel to the client. An organization's descendants include
+the organization itself.
+"""
+from typing import Iterable, List
+
+PAGE_SIZE = 1000
+
+# RPC returning the notices at or under the given organizations (setof notices, so
+# PostgREST filters, ordering, embeds and limits apply to it as to the table).
+NOTICES_UNDER_ORGANIZATIONS = "notices_under_organizations"
+ANCESTOR_KEYS_PARAM = "p_ancestor_keys"
+
+
+def notices_under_organizations(supabase, ancestor_keys: Iterable[int], select: str = "*"):
+    """Start a notices query restricted to the given organizations and everything under them."""
+    return supabase.rpc(NOTICES_UNDER_ORGANIZATIONS, {ANCESTOR_KEYS_PARAM: [int(key) for key in ancestor_keys]}) \
+        .select(select)
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so the name is matched literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def find_organization_keys_by_name(supabase, names: Iterable[str]) -> List[int]:
+    """Return the keys of the organizations whose name contains any of the given names (case-insensitive)."""
+    keys = set()
+    # One ilike filter per name: values in a plain filter need no PostgREST quoting,
+    # unlike the members of an or= list.
+    for name in dict.fromkeys(name for name in names if name):
+        offset = 0
+        while True:
+            response = supabase.table("organizations") \
+                .select("organization_key") \
+                .ilike("name", f"%{_escape_like(name)}%") \
+                .order("organization_key") \
+                .range(offset, offset + PAGE_SIZE - 1) \
+                .execute()
+            rows = response.data or []
+            keys.update(row["organization_key"] for row in rows)
+            if len(rows) < PAGE_SIZE:
+                break
+            offset += PAGE_SIZE
+    return sorted(keys)
@@ -0,0 +1,66 @@
+"""
+Partitioned scans: split a key space into disjoint ranges and fetch them concurrently.
+
+Each partition is a (lower, upper) pair meaning lower <= key < upper, with None for an
+open end. The first partition is open below and the last open above, so together they
+cover every key even if the bounds were estimated from stale data.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_PARTITIONS = 4
+
+Partition = Tuple[Optional[Any], Optional[Any]]
+
+
+def split_int_range(minimum: int, maximum: int, partitions: int) -> List[Partition]:
+    """Split the integer keys minimum..maximum into at most `partitions` contiguous ranges."""
+    partitions = max(1, min(partitions, maximum - minimum + 1))
+    step = (maximum - minimum + 1) / partitions
+    bounds = [minimum + round(i * step) for i in range(1, partitions)]
+    return list(zip([None] + bounds, bounds + [None]))
+
+
+def split_hex_keys(partitions: int, width: int = 2) -> List[Partition]:
+    """
+    Split lowercase hex string keys (such as notice_id) into ranges of equal expected size
+    using fixed-width hex prefixes as bounds.
+    """
+    space = 16 ** width
+    partitions = max(1, min(partitions, space))
+    bounds = [format(space * i // partitions, f"0{width}x") for i in range(1, partitions)]
+    return list(zip([None] + bounds, bounds + [None]))
+
+
+def apply_bounds(query, column: str, partition: Partition):
+    """Restrict a PostgREST query to lower <= column < upper."""
+    lower, upper = partition
+    if lower is not None:
+        query = query.gte(column, lower)
+    if upper is not None:
+        query = query.lt(column, upper)
+    return query
+
+
+def scan_partitions(
+    fetch_partition: Callable[[Partition], List[Dict[str, Any]]],
+    partitions: List[Partition],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every partition concurrently and concatenate the rows in partition order,
+    so the result does not depend on which partition finishes first.
+
+    Args:
+        fetch_partition: Callable returning all rows of one partition.
+        partitions: Partitions from split_int_range / split_hex_keys.
+        max_workers: Number of partitions fetched at once (defaults to one per partition).
+    """
+    if len(partitions) == 1:
+        return fetch_partition(partitions[0])
+    with ThreadPoolExecutor(max_workers=max_workers or len(partitions)) as executor:
+        results = list(executor.map(fetch_partition, partitions))
+    rows = []
+    for partition_rows in results:
+        rows.extend(partition_rows)
+    return rows
@@ -0,0 +1,118 @@
+"""
+Projections: which columns and embedded relations a query asks PostgREST for.
+
+Callers name a profile, a list of fields, or both:
+
+    summary  the columns a list view shows, no embedded relations
+    detail   every column and relation (the default, what the filters always selected)
+    export   flat columns for spreadsheets, plus the small code lookups
+
+Fields are column names or the names of embedded relations in EMBEDS (such as
+naics_details). The table's key columns are always selected, since keyset pagination
+and result matching depend on them.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PROFILE = "detail"
+
+# Columns selected whatever the projection.
+KEY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "awards": ("usa_spending_id", "piid"),
+    "notices": ("notice_id", "solicitation_id")
+}
+
+# Embedded relation name -> PostgREST embed expression.
+EMBEDS: Dict[str, Dict[str, str]] = {
+    "awards": {},
+    "notices": {
+        "naics_details": "naics_details:naics!naics_id(*)",
+        "psc_details": "psc_details:psc!psc_id(*)",
+        "setasides_details": "setasides_details:setasides!set_aside_id(*)",
+        "solicitations_details": "solicitations_details:solicitations!solicitation_id(*)",
+        "addresses_details": "addresses_details:addresses!organization_address_key(*)",
+        "organization_details": "organization_details:organizations!Notices_organization_key_fkey(*)",
+        "organization_level_1_details": "organization_level_1_details:organizations!Notices_organization_level_1_key_fkey(*)",
+        "organization_level_2_details": "organization_level_2_details:organizations!Notices_organization_level_2_key_fkey(*)",
+        "organization_level_3_details": "organization_level_3_details:organizations!Notices_organization_level_3_key_fkey(*)",
+        "organization_level_4_details": "organization_level_4_details:organizations!Notices_organization_level_4_key_fkey(*)",
+        "organization_level_5_details": "organization_level_5_details:organizations!Notices_organization_level_5_key_fkey(*)",
+        "organization_level_6_details": "organization_level_6_details:organizations!Notices_organization_level_6_key_fkey(*)",
+        "organization_level_7_details": "organization_level_7_details:organizations!Notices_organization_level_7_key_fkey(*)",
+        "solicitation_type_details": "solicitation_type_details:solicitation_types!type(*)"
+    }
+}
+
+_AWARDS_SUMMARY = [
+    "generated_unique_award_id", "description", "recipient_name", "recipient_uei", "total_obligation",
+    "date_signed", "period_of_performance_start_date", "period_of_performance_potential_end_date",
+    "naics", "product_or_service_code", "type_set_aside", "extent_competed_description",
+    "awarding_agency_toptier_agency_name", "awarding_agency_subtier_agency_name",
+    "funding_agency_subtier_agency_code"
+]
+
+_NOTICES_SUMMARY = [
+    "title", "type", "posted_date", "solicitation_response_deadline", "naics", "psc",
+    "solicitation_set_aside", "set_aside_id", "organization_key", "organization_level_1_name",
+    "organization_level_2_name", "latest"
+]
+
+PROFILES: Dict[str, Dict[str, List[str]]] = {
+    "awards": {
+        "summary": _AWARDS_SUMMARY,
+        "detail": ["*"],
+        "export": _AWARDS_SUMMARY + [
+            "type_description", "naics_description", "product_or_service_description",
+            "type_set_aside_description", "type_of_contract_pricing_description", "parent_award_piid",
+            "solicitation_identifier", "base_exercised_options", "base_and_all_options",
+            "number_of_offers_received", "period_of_performance_end_date", "parent_recipient_uei",
+            "parent_recipient_name", "recipient_location_city_name", "recipient_location_state_code",
+            "place_of_performance_city_name", "place_of_performance_state_code",
+            "awarding_agency_office_agency_name", "funding_agency_toptier_agency_name",
+            "funding_agency_subtier_agency_name", "funding_agency_office_agency_name"
+        ]
+    },
+    "notices": {
+        "summary": _NOTICES_SUMMARY,
+        "detail": ["*"] + list(EMBEDS["notices"]),
+        "export": _NOTICES_SUMMARY + [
+            "organization_level_3_name", "organization_level_4_name", "organization_level_5_name",
+            "organization_level_6_name", "organization_level_7_name", "primary_poc_full_name",
+            "primary_poc_email", "primary_poc_phone", "pop_city_name", "pop_state_code", "archive_date",
+            "award_number", "award_date", "award_amount", "awardee_name", "awardee_uei",
+            "naics_details", "psc_details", "setasides_details", "solicitation_type_details"
+        ]
+    }
+}
+
+
+def resolve_fields(table: str, projection: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Return the field names a projection selects: the key columns, then the profile's
+    fields, then any extra fields, without duplicates.
+
+    Args:
+        table: "awards" or "notices".
+        projection: Profile name (summary, detail, export). Defaults to detail when no fields are given.
+        fields: Column or embedded relation names to select in addition to (or instead of) a profile.
+    """
+    if table not in PROFILES:
+        raise ValueError(f"No projections for table {table}: {sorted(PROFILES)}")
+    if projection is None and not fields:
+        projection = DEFAULT_PROFILE
+    if projection is not None and projection not in PROFILES[table]:
+        raise ValueError(f"Unknown projection {projection} for {table}: {sorted(PROFILES[table])}")
+
+    selected = []
+    for field in list(KEY_COLUMNS[table]) + PROFILES[table].get(projection, []) + list(fields or []):
+        if field not in selected:
+            selected.append(field)
+    if "*" in selected:
+        # Every column is already selected; keep only the star and the embeds.
+        selected = ["*"] + [field for field in selected if field in EMBEDS[table]]
+    return selected
+
+
+def build_select(table: str, projection: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> str:
+    """Return the PostgREST select string of a projection."""
+    embeds = EMBEDS[table] if table in EMBEDS else {}
+    return ",".join(embeds.get(field, field) for field in resolve_fields(table, projection, fields))
@@ -0,0 +1,348 @@
+"""
+Compile include/exclude value lists into compact PostgREST predicates.
+
+Every list becomes a single `column=in.(...)` or `column=not.in.(...)` parameter instead
+of one `neq` per value, and conditions registered more than once on a column are merged
+before anything is sent:
+
+    includes on the same column   -> intersected
+    excludes on the same column   -> unioned
+    include and exclude together  -> the excluded values are removed from the include list
+
+A compiled filter is a callable taking a query builder and returning it with the
+predicate applied.
+
+On top of that, FilterSpec declares once how each field of a query dataclass maps to a
+column and operator, and compile_plan turns a query into an immutable, hashable
+QueryPlan that is applied unchanged to every page and partition.
+"""
+import hashlib
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Lists longer than this make URLs that some proxies reject (PostgREST sends filters in
+# the query string); move them to a table or an RPC parameter instead.
+MAX_FILTER_VALUES = 500
+
+# Seconds a plan compiled by get_plan is reused for an equal query.
+PLAN_CACHE_TTL = 300
+
+# Plans kept by get_plan; past this the oldest are evicted.
+PLAN_CACHE_MAX_ENTRIES = 256
+
+Filter = Callable[[Any], Any]
+
+_plan_cache: Dict[str, Tuple[float, "QueryPlan"]] = {}
+_plan_cache_lock = threading.Lock()
+
+
+def unique_values(values: Optional[Iterable[Any]]) -> List[Any]:
+    """Return the values without duplicates, None or blank strings, in their first-seen order."""
+    seen = set()
+    unique = []
+    for value in values or []:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if value not in seen:
+            seen.add(value)
+            unique.append(value)
+    return unique
+
+
+def _quote(value: Any) -> str:
+    """Quote a value for a PostgREST or= list if it contains reserved characters."""
+    text = str(value)
+    if any(char in text for char in ',.:()"\\ '):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+def _warn_if_oversized(column: str, values: Sequence[Any]) -> None:
+    if len(values) > MAX_FILTER_VALUES:
+        print(f"WARNING: Filter on {column} has {len(values)} values (more than {MAX_FILTER_VALUES}); "
+              f"the request URL may exceed server limits")
+
+
+class FilterCompiler:
+    """
+    Collects include/exclude lists per column and compiles them into one predicate each.
+
+    Example:
+        compiler = FilterCompiler()
+        compiler.include("naics", ["541511", "541512"])
+        compiler.exclude("naics", ["541512"])
+        compiler.exclude("psc", ["R425", "R425", "R499"])
+        filters.extend(compiler.compile())
+        # -> naics=in.(541511), psc=not.in.(R425,R499)
+    """
+
+    def __init__(self):
+        self._include: Dict[str, List[Any]] = {}
+        self._exclude: Dict[str, List[Any]] = {}
+        self._include_any: List[Tuple[Tuple[str, ...], List[Any]]] = []
+
+    def include(self, column: str, values: Optional[Iterable[Any]]) -> "FilterCompiler":
+        """Keep rows whose column is one of the values. Nothing is added for an empty list."""
+        values = unique_values(values)
+        if not values:
+            return self
+        if column in self._include:
+            allowed = set(values)
+            values = [value for value in self._include[column] if value in allowed]
+        self._include[column] = values
+        return self
+
+    def exclude(self, column: str, values: Optional[Iterable[Any]]) -> "FilterCompiler":
+        """Drop rows whose column is one of the values. Nothing is added for an empty list."""
+        values = unique_values(values)
+        if values:
+            self._exclude[column] = unique_values(self._exclude.get(column, []) + values)
+        return self
+
+    def include_any(self, columns: Sequence[str], values: Optional[Iterable[Any]]) -> "FilterCompiler":
+        """Keep rows where any of the columns is one of the values (one or= predicate)."""
+        values = unique_values(values)
+        if values:
+            self._include_any.append((tuple(columns), values))
+        return self
+
+    def conditions(self) -> List["Condition"]:
+        """Return the merged conditions as (operator, column, value) tuples, one per predicate."""
+        conditions = []
+        for column, values in self._include.items():
+            excluded = set(self._exclude.get(column, []))
+            values = [value for value in values if value not in excluded]
+            if not values:
+                print(f"WARNING: Include filter on {column} is empty after exclusions; no rows will match")
+            _warn_if_oversized(column, values)
+            conditions.append(("in", column, tuple(values)))
+
+        for column, values in self._exclude.items():
+            # An include list on the same column already leaves the excluded values out.
+            if column in self._include:
+                continue
+            _warn_if_oversized(column, values)
+            conditions.append(("not_in", column, tuple(values)))
+
+        for columns, values in self._include_any:
+            _warn_if_oversized("/".join(columns), values)
+            value_list = ",".join(_quote(value) for value in values)
+            conditions.append(("or", ",".join(columns), ",".join(f"{column}.in.({value_list})" for column in columns)))
+        return conditions
+
+    def compile(self) -> List[Filter]:
+        """Return one filter per column (and per include_any group), merged as described above."""
+        return [lambda q, c=condition: apply_condition(q, c) for condition in self.conditions()]
+
+
+# (operator, column, value): operator is "in" / "not_in" with a tuple of values, "or" with a
+# ready-made PostgREST or= string, or one of COMPARISON_OPERATORS with a single value.
+Condition = Tuple[str, str, Any]
+
+COMPARISON_OPERATORS = ("eq", "neq", "gt", "gte", "lt", "lte")
+
+
+def apply_condition(query, condition: Condition):
+    """Apply one compiled condition to a PostgREST query."""
+    operator, column, value = condition
+    if operator == "in":
+        return query.in_(column, value)
+    if operator == "not_in":
+        return query.not_.in_(column, value)
+    if operator == "or":
+        return query.or_(value)
+    return getattr(query, operator)(column, value)
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """
+    How one field of a query dataclass (AwardsQuery, NoticesQuery) filters a table.
+
+    Args:
+        field: Attribute of the query dataclass. Unset fields (None, False, empty) add nothing.
+        column: Column filtered on; for "in_any" a tuple of columns, any of which may match;
+            for "rpc" a (function, parameter) pair.
+        operator: "in", "not_in", "in_any", "text_search", "rpc" or one of COMPARISON_OPERATORS.
+            "rpc" queries a set-returning function called with the value instead of the
+            table, for restrictions that need a join in Postgres.
+        resolve: Optional callable value -> value run at compile time, e.g. to convert
+            types. Resolving to None drops the filter; resolving an "in" list to [] makes
+            the whole query match nothing.
+        needs_client: Call resolve as (supabase, value), for resolvers that look values up
+            in the database. Plans from such specs are cached per client by get_plan.
+        options: text_search options as (name, value) pairs.
+    """
+    field: str
+    column: Union[str, Tuple[str, ...]]
+    operator: str
+    resolve: Optional[Callable[..., Any]] = None
+    needs_client: bool = False
+    options: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    A compiled, immutable set of conditions, applied unchanged to every page and partition.
+
+    The text search is kept apart because it has to be applied last: PostgREST's
+    text_search returns a builder that takes no further filters. source, if set, is the
+    (function, parameter, value) of an RPC queried instead of the table.
+    """
+    conditions: Tuple[Condition, ...] = ()
+    text_search: Optional[Tuple[str, str, Tuple[Tuple[str, str], ...]]] = None
+    matches_nothing: bool = False
+    source: Optional[Tuple[str, str, Any]] = None
+
+    @property
+    def key(self) -> str:
+        """Stable hash of the plan, equal for plans that send the same predicates."""
+        payload = json.dumps([self.conditions, self.text_search, self.matches_nothing, self.source], default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def query(self, supabase, table: str, select: str = "*"):
+        """Start a query on the table (or the plan's RPC source) with the conditions applied."""
+        if self.source is None:
+            query = supabase.from_(table).select(select)
+        else:
+            function, parameter, value = self.source
+            query = supabase.rpc(function, {parameter: list(value)}).select(select)
+        return self.apply(query)
+
+    def apply(self, query):
+        for condition in self.conditions:
+            query = apply_condition(query, condition)
+        return query
+
+    def apply_text_search(self, query):
+        if self.text_search is None:
+            return query
+        column, text, options = self.text_search
+        options = dict(options)
+        if hasattr(query, "text_search"):
+            return query.text_search(column, text, options)
+        # RPC builders have no text_search; send the same fts operator through filter().
+        config = options.get("config")
+        return query.filter(column, f"fts({config})" if config else "fts", text)
+
+
+def _is_unset(value: Any) -> bool:
+    return value is None or value is False or (isinstance(value, (list, tuple, set, str)) and not value)
+
+
+def compile_plan(specs: Sequence[FilterSpec], query: Any, supabase=None) -> QueryPlan:
+    """
+    Compile a query dataclass into a QueryPlan following its filter specs.
+
+    Include/exclude lists go through FilterCompiler, so they are deduplicated and merged
+    per column; comparisons keep the order of the specs.
+    """
+    compiler = FilterCompiler()
+    comparisons = []
+    text_search = None
+    source = None
+    matches_nothing = False
+    printed = set()
+
+    for spec in specs:
+        value = getattr(query, spec.field)
+        if _is_unset(value):
+            continue
+        if spec.resolve is not None:
+            value = spec.resolve(supabase, value) if spec.needs_client else spec.resolve(value)
+            if value is None:
+                continue
+            if spec.operator == "in" and not value:
+                print(f"WARNING: {spec.field} resolved to no values; no rows will match")
+                matches_nothing = True
+                continue
+        if spec.field not in printed:
+            printed.add(spec.field)
+            print(f"Applying {spec.field} filter with value:", value)
+
+        if spec.operator == "in":
+            compiler.include(spec.column, value)
+        elif spec.operator == "not_in":
+            compiler.exclude(spec.column, value)
+        elif spec.operator == "in_any":
+            compiler.include_any(spec.column, value)
+        elif spec.operator == "text_search":
+            text_search = (spec.column, value, spec.options)
+        elif spec.operator == "rpc":
+            if source is not None:
+                raise ValueError(f"Only one rpc filter can be set; {spec.field} conflicts with {source[0]}")
+            function, parameter = spec.column
+            source = (function, parameter, tuple(value))
+        elif spec.operator in COMPARISON_OPERATORS:
+            comparisons.append((spec.operator, spec.column, value))
+        else:
+            raise ValueError(f"Unknown filter operator {spec.operator!r} for {spec.field}")
+
+    return QueryPlan(tuple(compiler.conditions() + comparisons), text_search, matches_nothing, source)
+
+
+def _spec_key(spec: FilterSpec) -> List[Any]:
+    resolve = spec.resolve
+    resolver = None if resolve is None else f"{resolve.__module__}.{getattr(resolve, '__qualname__', repr(resolve))}"
+    return [spec.field, spec.column, spec.operator, resolver, spec.needs_client, spec.options]
+
+
+def _client_key(supabase) -> Any:
+    """Identify the database (and credentials) a client queries, so lookups made through
+    one client are never reused for another."""
+    if supabase is None:
+        return None
+    url = getattr(supabase, "supabase_url", None)
+    if url:
+        return [str(url), getattr(supabase, "supabase_key", None)]
+    return id(supabase)
+
+
+def query_key(query: Any, specs: Sequence[FilterSpec] = (), supabase=None) -> str:
+    """
+    Hash of a query dataclass's type and field values, the specs compiling it and, if a
+    set field resolves through the database, the client it resolves with.
+    """
+    looks_up = any(spec.needs_client and not _is_unset(getattr(query, spec.field)) for spec in specs)
+    client = _client_key(supabase) if looks_up else None
+    payload = json.dumps(
+        [type(query).__name__, asdict(query), [_spec_key(spec) for spec in specs], client],
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_plan(specs: Sequence[FilterSpec], query: Any, supabase=None, ttl: int = PLAN_CACHE_TTL) -> QueryPlan:
+    """
+    Return the compiled plan of a query, reusing the one compiled for an equal query with
+    the same specs (and, for specs that look values up, the same client) in the last ttl
+    seconds. Saved searches that run repeatedly skip compilation and the lookups their
+    resolvers make. At most PLAN_CACHE_MAX_ENTRIES plans are kept.
+    """
+    key = query_key(query, specs, supabase)
+    now = time.monotonic()
+    with _plan_cache_lock:
+        cached = _plan_cache.get(key)
+        if cached is not None and cached[0] > now:
+            print(f"INFO: Reusing query plan {cached[1].key[:12]}")
+            return cached[1]
+
+    plan = compile_plan(specs, query, supabase)
+    with _plan_cache_lock:
+        # Drop expired plans, then the oldest ones over the size limit (dicts keep insertion order).
+        for expired in [k for k, (expires_at, _) in _plan_cache.items() if expires_at <= now]:
+            del _plan_cache[expired]
+        _plan_cache.pop(key, None)
+        _plan_cache[key] = (now + ttl, plan)
+        while len(_plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            del _plan_cache[next(iter(_plan_cache))]
+    return plan
+
+
+def clear_plan_cache() -> None:
+    with _plan_cache_lock:
+        _plan_cache.clear()
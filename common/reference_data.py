@@ -0,0 +1,135 @@
+"""
+In-memory cache of the small, static reference tables (naics, psc, setasides,
+solicitation_types), shared by the comparison and filter code.
+
+Each table is bulk-loaded once and reloaded after the TTL, replacing one Supabase
+round trip per code lookup with a dict lookup.
+"""
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+DEFAULT_TTL = 24 * 60 * 60
+PAGE_SIZE = 1000
+
+# Reference table -> (code column, key column, column to order the bulk load by).
+REFERENCE_TABLES = {
+    "naics": ("naics_code", "naics_id", "naics_id"),
+    "psc": ("psc_code", "psc_id", "psc_id"),
+    "setasides": ("set_aside_code", "set_aside_id", "set_aside_id"),
+    "solicitation_types": ("type", "solicitation_type", "type")
+}
+
+_shared: Dict[int, "ReferenceData"] = {}
+_shared_lock = threading.Lock()
+
+
+class ReferenceData:
+    """
+    Reference tables of one Supabase project, loaded on first use and refreshed after ttl seconds.
+
+    Args:
+        supabase: Initialized Supabase client.
+        ttl: Seconds before a table is reloaded.
+    """
+
+    def __init__(self, supabase, ttl: int = DEFAULT_TTL):
+        self.supabase = supabase
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_code: Dict[str, Dict[str, Any]] = {}
+        self._expires_at: Dict[str, float] = {}
+
+    def _load(self, table: str) -> None:
+        code_column, key_column, order_column = REFERENCE_TABLES[table]
+        rows = []
+        offset = 0
+        while True:
+            response = self.supabase.table(table) \
+                .select("*") \
+                .order(order_column) \
+                .range(offset, offset + PAGE_SIZE - 1) \
+                .execute()
+            rows.extend(response.data or [])
+            if len(response.data or []) < PAGE_SIZE:
+                break
+            offset += PAGE_SIZE
+
+        by_code = {}
+        for row in rows:
+            # A code listed more than once (e.g. NAICS across source years) maps to its lowest key.
+            if row.get(code_column) is not None:
+                by_code.setdefault(row[code_column], row[key_column])
+        self._rows[table] = rows
+        self._by_code[table] = by_code
+        self._expires_at[table] = time.monotonic() + self.ttl
+
+    def _ensure(self, table: str) -> None:
+        if table not in REFERENCE_TABLES:
+            raise ValueError(f"{table} is not a reference table: {sorted(REFERENCE_TABLES)}")
+        if self._expires_at.get(table, 0) > time.monotonic():
+            return
+        with self._lock:
+            if self._expires_at.get(table, 0) <= time.monotonic():
+                self._load(table)
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        """Return every row of a reference table."""
+        self._ensure(table)
+        return self._rows[table]
+
+    def lookup(self, table: str, code: Optional[str]) -> Optional[Any]:
+        """Return the key of a code (e.g. the naics_id of a NAICS code), or None if unknown."""
+        if code is None:
+            return None
+        self._ensure(table)
+        return self._by_code[table].get(code)
+
+    def known_codes(self, table: str) -> Set[str]:
+        self._ensure(table)
+        return set(self._by_code[table])
+
+    def unknown_codes(self, table: str, codes: Optional[Iterable[Any]]) -> List[Any]:
+        """Return the codes that do not exist in the reference table, in their given order."""
+        if not codes:
+            return []
+        self._ensure(table)
+        by_code = self._by_code[table]
+        return [code for code in codes if str(code) not in by_code]
+
+    def naics_id(self, naics_code: Optional[str]) -> Optional[int]:
+        return self.lookup("naics", naics_code)
+
+    def psc_id(self, psc_code: Optional[str]) -> Optional[int]:
+        return self.lookup("psc", psc_code)
+
+    def set_aside_id(self, set_aside_code: Optional[str]) -> Optional[int]:
+        return self.lookup("setasides", set_aside_code)
+
+    def solicitation_type(self, type_code: Optional[str]) -> Optional[str]:
+        return self.lookup("solicitation_types", type_code)
+
+    def refresh(self, table: Optional[str] = None) -> None:
+        """Force a reload of one reference table, or all of them, on next use."""
+        with self._lock:
+            for name in [table] if table else list(self._expires_at):
+                self._expires_at.pop(name, None)
+
+
+def get_reference_data(supabase, ttl: int = DEFAULT_TTL) -> ReferenceData:
+    """Return the ReferenceData shared by every caller using this Supabase client."""
+    with _shared_lock:
+        reference_data = _shared.get(id(supabase))
+        if reference_data is None or reference_data.supabase is not supabase:
+            reference_data = ReferenceData(supabase, ttl)
+            _shared[id(supabase)] = reference_data
+        return reference_data
+
+
+def warn_unknown_codes(supabase, table: str, codes: Optional[Iterable[Any]], label: str) -> List[Any]:
+    """Print a warning for filter codes that do not exist in a reference table, and return them."""
+    unknown = get_reference_data(supabase).unknown_codes(table, codes)
+    if unknown:
+        print(f"WARNING: {label} not found in the {table} table, they will match nothing: {unknown}")
+    return unknown
@@ -1,12 +1,36 @@
 import os
+import sys
 import requests
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import Optional, List, Dict, Any, Union, Tuple
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Union, Tuple
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
-def highergov_get_all_awards(
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Highergov"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from highergov_client import DEFAULT_MAX_WORKERS
+from highergov_endpoints import iter_contract, iter_opportunity
+from organization_hierarchy import find_organization_keys_by_name, notices_under_organizations
+from reference_data import get_reference_data
+
+# Number of piids per Supabase query in batch award comparisons.
+AWARD_BATCH_SIZE = 200
+
+# Rows per request when paging through a chunk's awards; PostgREST's max-rows cuts
+# longer responses short without an error.
+AWARD_PAGE_SIZE = 1000
+
+# How long the filtered-and-latest notice IDs of a query are reused across page requests.
+CANDIDATE_CACHE_TTL = 300
+
+_candidate_cache: Dict[Tuple, Tuple[float, List[str]]] = {}
+_candidate_cache_lock = threading.Lock()
+
+def highergov_iter_awards(
   api_key                : str,
   award_id               : Optional[str] = None,
   awardee_key            : Optional[int] = None,
@@ -22,10 +46,14 @@ def highergov_get_all_awards(
   parent_award_id        : Optional[str] = None,
   psc_code               : Optional[str] = None,
   search_id              : Optional[str] = None,
-  vehicle_key            : Optional[int] = None
-) -> List[Dict[str, Any]]:
+  vehicle_key            : Optional[int] = None,
+  max_workers            : int = DEFAULT_MAX_WORKERS
+) -> Iterator[Dict[str, Any]]:
     """
-    Fetch all awards from the HigherGov API by iterating through all pages.
+    Lazily yield all awards from the HigherGov API, in page order.
+
+    Pages are fetched a few at a time ahead of the consumer, so records can be
+    filtered or written at constant memory before the last page arrives.
 
     Args:
         api_key: API key for authentication
@@ -44,9 +72,10 @@ def highergov_get_all_awards(
         psc_code: PSC code (e.g., "8440")
         search_id: HigherGov SearchID
         vehicle_key: HigherGov Vehicle key
+        max_workers: Number of pages fetched concurrently after the first page
 
-    Returns:
-        List of contract dictionaries retrieved from the API
+    Yields:
+        Contract dictionaries retrieved from the API
 
     Raises:
         ValueError: If api_key is missing or page_size exceeds 100
@@ -58,55 +87,96 @@ def highergov_get_all_awards(
     if page_size > 100:
         raise ValueError("page_size cannot exceed 100")
 
-    # Convert date object to string if needed
-    if isinstance(last_modified_date, date):
-        last_modified_date = last_modified_date.isoformat()
-
-    url = "https://www.highergov.com/api-external/contract/"
-    all_contracts: List[Dict[str, Any]] = []
-    page_number = 1
-
-    while True:
-        # Build request parameters
-        params = {
-            'api_key': api_key,
-            'award_id': award_id,
-            'awardee_key': awardee_key,
-            'awardee_key_parent': awardee_key_parent,
-            'awardee_uei': awardee_uei,
-            'awardee_uei_parent': awardee_uei_parent,
-            'awarding_agency_key': awarding_agency_key,
-            'funding_agency_key': funding_agency_key,
-            'last_modified_date': last_modified_date,
-            'naics_code': naics_code,
-            'ordering': ordering,
-            'page_number': page_number,
-            'page_size': page_size,
-            'parent_award_id': parent_award_id,
-            'psc_code': psc_code,
-            'search_id': search_id,
-            'vehicle_key': vehicle_key
-        }
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
-
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        contracts = data.get('results', [])
-        all_contracts.extend(contracts)
+    # Dates are converted and all parameters validated against the OpenAPI spec.
+    return iter_contract(
+        api_key=api_key,
+        award_id=award_id,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        naics_code=naics_code,
+        ordering=ordering,
+        page_size=page_size,
+        parent_award_id=parent_award_id,
+        psc_code=psc_code,
+        search_id=search_id,
+        vehicle_key=vehicle_key,
+        max_workers=max_workers
+    )
 
-        # Check if we've reached the last page
-        if len(contracts) < page_size:
-            break
+def highergov_get_all_awards(
+  api_key                : str,
+  award_id               : Optional[str] = None,
+  awardee_key            : Optional[int] = None,
+  awardee_key_parent     : Optional[int] = None,
+  awardee_uei            : Optional[str] = None,
+  awardee_uei_parent     : Optional[str] = None,
+  awarding_agency_key    : Optional[int] = None,
+  funding_agency_key     : Optional[int] = None,
+  last_modified_date     : Optional[Union[str, date]] = None,
+  naics_code             : Optional[str] = None,
+  ordering               : Optional[str] = None,
+  page_size              : int = 10,
+  parent_award_id        : Optional[str] = None,
+  psc_code               : Optional[str] = None,
+  search_id              : Optional[str] = None,
+  vehicle_key            : Optional[int] = None,
+  max_workers            : int = DEFAULT_MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all awards from the HigherGov API by iterating through all pages.
 
-        # Move to next page
-        page_number += 1
+    Args:
+        api_key: API key for authentication
+        award_id: The government Award ID (e.g., "70RDAD21D00000002-70CDCR22FR0000013")
+        awardee_key: HigherGov Awardee Key
+        awardee_key_parent: HigherGov Awardee Key (Parent Level)
+        awardee_uei: Awardee UEI (e.g., "SMNWM6HN79X5")
+        awardee_uei_parent: Awardee UEI Parent
+        awarding_agency_key: HigherGov Awarding Agency key
+        funding_agency_key: HigherGov Funding Agency key
+        last_modified_date: Last modified date filter (format: YYYY-MM-DD)
+        naics_code: Awards NAICS code (e.g., "541330")
+        ordering: Field to use when ordering the results (e.g., "-last_modified_date")
+        page_size: Number of records returned per page (max 100)
+        parent_award_id: The government Award ID of the parent Award
+        psc_code: PSC code (e.g., "8440")
+        search_id: HigherGov SearchID
+        vehicle_key: HigherGov Vehicle key
+        max_workers: Number of pages fetched concurrently after the first page
 
-    return all_contracts
+    Returns:
+        List of contract dictionaries retrieved from the API
 
-def highergov_get_all_opportunities(
+    Raises:
+        ValueError: If api_key is missing or page_size exceeds 100
+        requests.exceptions.RequestException: For unrecoverable network errors
+    """
+    return list(highergov_iter_awards(
+        api_key=api_key,
+        award_id=award_id,
+        awardee_key=awardee_key,
+        awardee_key_parent=awardee_key_parent,
+        awardee_uei=awardee_uei,
+        awardee_uei_parent=awardee_uei_parent,
+        awarding_agency_key=awarding_agency_key,
+        funding_agency_key=funding_agency_key,
+        last_modified_date=last_modified_date,
+        naics_code=naics_code,
+        ordering=ordering,
+        page_size=page_size,
+        parent_award_id=parent_award_id,
+        psc_code=psc_code,
+        search_id=search_id,
+        vehicle_key=vehicle_key,
+        max_workers=max_workers
+    ))
+
+def highergov_iter_opportunities(
     api_key: str,
     agency_key: Optional[int] = None,
     captured_date: Optional[Union[str, date]] = None,
@@ -117,10 +187,14 @@ def highergov_get_all_opportunities(
     search_id: Optional[str] = None,
     source_id: Optional[str] = None,
     source_type: Optional[str] = None,
-    version_key: Optional[str] = None
-) -> List[Dict[str, Any]]:
+    version_key: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[Dict[str, Any]]:
     """
-    Fetch all opportunities from the HigherGov API by iterating through all pages.
+    Lazily yield all opportunities from the HigherGov API, in page order.
+
+    Pages are fetched a few at a time ahead of the consumer, so records can be
+    filtered or written at constant memory before the last page arrives.
 
     Args:
         api_key: API key for authentication
@@ -135,9 +209,10 @@ def highergov_get_all_opportunities(
         source_id: The source opportunity ID
         source_type: Opportunity source type (sam, dibbs, sbir, grant, sled)
         version_key: The HigherGov opportunity version key
+        max_workers: Number of pages fetched concurrently after the first page
 
-    Returns:
-        List of opportunity dictionaries retrieved from the API
+    Yields:
+        Opportunity dictionaries retrieved from the API
 
     Raises:
         ValueError: If api_key is missing or page_size exceeds 100
@@ -149,50 +224,75 @@ def highergov_get_all_opportunities(
     if page_size > 100:
         raise ValueError("page_size cannot exceed 100")
 
-    # Convert date objects to strings if needed
-    if isinstance(captured_date, date):
-        captured_date = captured_date.isoformat()
-    if isinstance(posted_date, date):
-        posted_date = posted_date.isoformat()
-
-    url = "https://www.highergov.com/api-external/opportunity/"
-    all_opportunities: List[Dict[str, Any]] = []
-    page_number = 1
-
-    while True:
-        # Build request parameters
-        params = {
-            'api_key': api_key,
-            'agency_key': agency_key,
-            'captured_date': captured_date,
-            'opp_key': opp_key,
-            'ordering': ordering,
-            'page_number': page_number,
-            'page_size': page_size,
-            'posted_date': posted_date,
-            'search_id': search_id,
-            'source_id': source_id,
-            'source_type': source_type,
-            'version_key': version_key
-        }
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
-
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+    # Dates are converted and all parameters validated against the OpenAPI spec.
+    return iter_opportunity(
+        api_key=api_key,
+        agency_key=agency_key,
+        captured_date=captured_date,
+        opp_key=opp_key,
+        ordering=ordering,
+        page_size=page_size,
+        posted_date=posted_date,
+        search_id=search_id,
+        source_id=source_id,
+        source_type=source_type,
+        version_key=version_key,
+        max_workers=max_workers
+    )
 
-        data = response.json()
-        opportunities = data.get('results', [])
-        all_opportunities.extend(opportunities)
+def highergov_get_all_opportunities(
+    api_key: str,
+    agency_key: Optional[int] = None,
+    captured_date: Optional[Union[str, date]] = None,
+    opp_key: Optional[str] = None,
+    ordering: Optional[str] = None,
+    page_size: int = 10,
+    posted_date: Optional[Union[str, date]] = None,
+    search_id: Optional[str] = None,
+    source_id: Optional[str] = None,
+    source_type: Optional[str] = None,
+    version_key: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all opportunities from the HigherGov API by iterating through all pages.
 
-        # Check if we've reached the last page
-        if len(opportunities) < page_size:
-            break
+    Args:
+        api_key: API key for authentication
+        agency_key: HigherGov Agency key
+        captured_date: Date the opportunity was added to HigherGov (format: YYYY-MM-DD)
+        opp_key: The HigherGov opportunity key
+        ordering: Field to use when ordering the results
+                 (e.g., -captured_date, -due_date, -posted_date)
+        page_size: Number of records returned per page (max 100)
+        posted_date: Date the opportunity was posted by the agency (format: YYYY-MM-DD)
+        search_id: HigherGov SearchID
+        source_id: The source opportunity ID
+        source_type: Opportunity source type (sam, dibbs, sbir, grant, sled)
+        version_key: The HigherGov opportunity version key
+        max_workers: Number of pages fetched concurrently after the first page
 
-        # Move to next page
-        page_number += 1
+    Returns:
+        List of opportunity dictionaries retrieved from the API
 
-    return all_opportunities
+    Raises:
+        ValueError: If api_key is missing or page_size exceeds 100
+        requests.exceptions.RequestException: For unrecoverable network errors
+    """
+    return list(highergov_iter_opportunities(
+        api_key=api_key,
+        agency_key=agency_key,
+        captured_date=captured_date,
+        opp_key=opp_key,
+        ordering=ordering,
+        page_size=page_size,
+        posted_date=posted_date,
+        search_id=search_id,
+        source_id=source_id,
+        source_type=source_type,
+        version_key=version_key,
+        max_workers=max_workers
+    ))
 
 def get_award_by_piid(supabase: Client, piid: str) -> Dict[str, Any]:
     """
@@ -230,36 +330,240 @@ def get_award_by_piid(supabase: Client, piid: str) -> Dict[str, Any]:
         print(f"Error fetching award with piid {piid}: {str(e)}")
         raise Exception(f"Database error: {str(e)}")
 
-def get_nested_value(obj: Dict[str, Any], field: str) -> Any:
-    """Helper function to get nested dictionary values using dot notation."""
-    try:
-        for key in field.split('.'):
-            obj = obj[key]
-        return obj
-    except (KeyError, TypeError, AttributeError):
-        return None
-
-def standardize_value(value: Any) -> Any:
-    """Helper function to standardize values for comparison."""
-    if value is None:
-        return None
-
-    # Convert to string and strip whitespace
-    if isinstance(value, str):
-        return value.strip()
-
-    # Convert numeric types to float for consistent comparison
-    if isinstance(value, (int, float)):
-        return float(value)
-
-    return value
-
 def safe_compare_text(x: Optional[str], y: Optional[str], condition: callable) -> bool:
     """Helper function to safely compare text values that might be None."""
     if x is None or y is None:
         return False
     return condition(x, y)
 
+class FieldComparator:
+    """
+    Field mappings compiled once into a reusable comparator.
+
+    Each mapping is (higher_gov_field, supabase_field, display_name) with an optional
+    custom comparison called as custom_compare(higher_gov_value, supabase_value, context).
+    Dotted paths are split once, and the mapped keys are kept in sets, so comparing a
+    record pair costs one pass over the mappings and the record keys.
+
+    Args:
+        mappings: Field mappings as described above.
+        unmapped_by: How a record key counts as mapped when looking for unmapped fields:
+            "field" if it equals a mapped field exactly, "root" if it is the first
+            segment of a mapped dotted path.
+    """
+
+    _NORMALIZERS = {str: str.strip, int: float, float: float, bool: float}
+
+    def __init__(self, mappings: List[Tuple], unmapped_by: str = "field"):
+        if unmapped_by not in ("field", "root"):
+            raise ValueError("unmapped_by must be 'field' or 'root'")
+        self.fields = []
+        for mapping in mappings:
+            hg_field, sb_field, display_name = mapping[:3]
+            custom_compare = mapping[3] if len(mapping) > 3 else None
+            self.fields.append((tuple(hg_field.split('.')), tuple(sb_field.split('.')), display_name, custom_compare))
+        if unmapped_by == "root":
+            self.mapped_higher_gov = {hg_path[0] for hg_path, _, _, _ in self.fields}
+            self.mapped_supabase = {sb_path[0] for _, sb_path, _, _ in self.fields}
+        else:
+            self.mapped_higher_gov = {'.'.join(hg_path) for hg_path, _, _, _ in self.fields}
+            self.mapped_supabase = {'.'.join(sb_path) for _, sb_path, _, _ in self.fields}
+
+    @staticmethod
+    def _get(obj: Any, path: Tuple[str, ...]) -> Any:
+        try:
+            for key in path:
+                obj = obj[key]
+            return obj
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+    @classmethod
+    def _normalize(cls, value: Any) -> Any:
+        """Strip strings and turn numbers (bools included) into floats; other values are returned as is."""
+        normalize = cls._NORMALIZERS.get(type(value))
+        return normalize(value) if normalize else value
+
+    @staticmethod
+    def _unmapped(record: Dict[str, Any], mapped: set) -> List[Dict[str, Any]]:
+        unmapped = []
+        for field, value in record.items():
+            if field in mapped:
+                continue
+            if isinstance(value, dict):
+                # For nested objects, include all nested fields
+                for nested_field, nested_value in _flatten_dict(value, parent_key=field).items():
+                    unmapped.append({"field": nested_field, "value": nested_value})
+            else:
+                unmapped.append({"field": field, "value": value})
+        return unmapped
+
+    def compare(self, hg: Dict[str, Any], sb: Dict[str, Any], context: Any = None) -> Dict[str, Any]:
+        """
+        Compare a HigherGov record with a Supabase row.
+
+        Args:
+            hg: HigherGov record
+            sb: Supabase row
+            context: Passed to the custom comparisons (e.g. reference data)
+
+        Returns:
+            Dict containing matches, mismatches and the unmapped fields of each side
+        """
+        matches = []
+        mismatches = []
+        for hg_path, sb_path, display_name, custom_compare in self.fields:
+            hg_value = self._normalize(self._get(hg, hg_path))
+            sb_value = self._normalize(self._get(sb, sb_path))
+
+            # Use custom comparison function if provided, otherwise use direct equality
+            if custom_compare:
+                matched = custom_compare(hg_value, sb_value, context)
+            else:
+                matched = hg_value == sb_value
+
+            if matched:
+                matches.append({
+                    "field": display_name,
+                    "value": f"{hg_value} -> {sb_value}" if custom_compare else hg_value
+                })
+            else:
+                mismatches.append({
+                    "field": display_name,
+                    "higher_gov_value": hg_value,
+                    "supabase_value": sb_value
+                })
+
+        return {
+            "matches": matches,
+            "mismatches": mismatches,
+            "unmapped_higher_gov_fields": self._unmapped(hg, self.mapped_higher_gov),
+            "unmapped_supabase_fields": self._unmapped(sb, self.mapped_supabase)
+        }
+
+# HigherGov contract field -> Supabase awards column, display name and optional custom comparison.
+AWARD_FIELD_MAPPINGS = [
+    # Basic Award Information
+    ("award_id", "piid", "Award ID/PIID"),
+    ("parent_award_id", "parent_award_piid", "Parent Award ID"),
+    ("award_description_original", "description", "Description"),
+    ("award_type", "type_description", "Award Type"),
+    ("solicitation_identifier", "solicitation_identifier", "Solicitation ID"),
+
+    # Financial Information
+    ("total_dollars_obligated", "total_obligation", "Total Obligation"),
+    ("current_total_value_of_award", "base_exercised_options", "Current Total Value"),
+    ("potential_total_value_of_award", "base_and_all_options", "Potential Total Value"),
+
+    # Dates
+    ("period_of_performance_start_date", "period_of_performance_start_date", "Performance Start Date"),
+    ("period_of_performance_current_end_date", "period_of_performance_end_date", "Performance End Date"),
+    ("period_of_performance_potential_end_date", "period_of_performance_potential_end_date", "Potential End Date"),
+    ("last_modified_date", "period_of_performance_last_modified_date", "Last Modified Date"),
+
+    # Recipient Information
+    ("awardee.clean_name", "recipient_name", "Recipient Name"),
+    ("awardee.uei", "recipient_uei", "Recipient UEI"),
+    ("awardee_parent.clean_name", "parent_recipient_name", "Parent Recipient Name"),
+    ("awardee_parent.uei", "parent_recipient_uei", "Parent Recipient UEI"),
+
+    # Place of Performance
+    ("primary_place_of_performance_city_name", "place_of_performance_city_name", "Place of Performance City"),
+    ("primary_place_of_performance_state_code", "place_of_performance_state_code", "Place of Performance State"),
+    ("primary_place_of_performance_country_name", "place_of_performance_country_name", "Place of Performance Country"),
+    ("primary_place_of_performance_zip", "place_of_performance_zip5", "Place of Performance ZIP"),
+
+    # Classification Codes
+    ("psc_code.psc_code", "product_or_service_code", "PSC Code"),
+    ("naics_code.naics_code", "naics", "NAICS Code"),
+    ("naics_code.naics_description", "naics_description", "NAICS Description"),
+
+    # Competition Information
+    ("number_of_offers_received", "number_of_offers_received", "Number of Offers"),
+    ("extent_competed", "extent_competed_description", "Extent Competed"),
+    ("solicitation_procedures", "solicitation_procedures_description", "Solicitation Procedures"),
+    ("type_of_contract_pricing_description", "type_of_contract_pricing_description", "Contract Pricing Type"),
+
+    # Additional Details
+    ("subcontracting_plan", "subcontracting_plan_description", "Subcontracting Plan"),
+    ("clinger_cohen_act_planning", "clinger_cohen_act_planning_description", "Clinger Cohen Act Planning"),
+
+    # Agency Information
+    ("awarding_agency.agency_name", "awarding_agency_subtier_agency_name", "Awarding Agency"),
+    ("funding_agency.agency_name", "funding_agency_subtier_agency_name", "Funding Agency"),
+
+    # Transaction Information
+    ("latest_action_date", "transactions.0.action_date", "Latest Action Date"),
+    ("latest_transaction_key", "transactions.0.id", "Latest Transaction ID"),
+
+    # Additional Award Details
+    ("award_type", "type_description", "Award Type"),
+    ("category", "category", "Award Category"),
+    ("latest_action_date", "date_signed", "Award Date"),
+    ("latest_action_date_fiscal_year", "fiscal_year", "Fiscal Year"),
+
+    # Additional Recipient Details
+    ("awardee.cage_code", "recipient_cage_code", "Recipient CAGE Code"),
+    ("recipient_location_address_line1", "recipient_location_address_line1", "Recipient Address"),
+    ("recipient_location_zip4", "recipient_location_zip4", "Recipient ZIP+4"),
+    ("recipient_location_zip5", "recipient_location_zip5", "Recipient ZIP5"),
+    ("recipient_location_congressional_code", "recipient_location_congressional_code", "Recipient Congressional District"),
+    ("business_categories", "business_categories", "Business Categories"),
+
+    # Additional Place of Performance Details
+    ("primary_place_of_performance_county_name", "place_of_performance_county_name", "Place of Performance County"),
+    ("primary_place_of_performance_congressional_code", "place_of_performance_congressional_code", "Place of Performance Congressional District"),
+    ("primary_place_of_performance_zip4", "place_of_performance_zip4", "Place of Performance ZIP+4"),
+
+    # Extended Classification Details
+    ("psc_code.psc_name", "psc_hierarchy_base_code_description", "PSC Description"),
+    ("psc_code.psc_description", "product_or_service_description", "PSC Full Description"),
+    ("naics_code.naics_description", "naics_hierarchy_base_code_description", "NAICS Description"),
+
+    # Competition and Contract Details
+    ("type_of_set_aside", "type_set_aside", "Set Aside Type"),
+    ("other_than_full_and_open_competition", "other_than_full_and_open", "Other Than Full and Open Competition"),
+    ("commercial_item_acquisition", "commercial_item_acquisition", "Commercial Item Acquisition"),
+    ("consolidated_contract", "consolidated_contract", "Consolidated Contract"),
+    ("multi_year_contract", "multi_year_contract", "Multi Year Contract"),
+    ("purchase_card_as_payment_method", "purchase_card_as_payment_method", "Purchase Card as Payment Method"),
+
+    # Agency Details
+    ("funding_agency.agency_name", "funding_agency_office_agency_name", "Funding Office Name"),
+    ("awarding_agency.agency_name", "awarding_agency_office_agency_name", "Awarding Office Name"),
+    ("funding_agency_toptier_agency_name", "funding_agency_toptier_agency_name", "Funding Agency Top Tier Name"),
+    ("awarding_agency_toptier_agency_name", "awarding_agency_toptier_agency_name", "Awarding Agency Top Tier Name"),
+
+    # Financial Details
+    ("total_account_obligation", "total_account_obligation", "Total Account Obligation"),
+    ("total_account_outlay", "total_account_outlay", "Total Account Outlay"),
+
+    # System/Reference IDs
+    ("generated_unique_award_id", "generated_unique_award_id", "Generated Unique Award ID"),
+    ("usa_spending_id", "usa_spending_id", "USA Spending ID"),
+
+    # Custom comparisons for fields that need special handling
+    ("type_of_contract_pricing_description", "type_of_contract_pricing_description", "Contract Pricing Type",
+     lambda x, y, _: safe_compare_text(x, y, lambda a, b: a == "Fixed Price" and b == "FIRM FIXED PRICE")),
+
+    ("extent_competed", "extent_competed_description", "Extent Competed",
+     lambda x, y, _: safe_compare_text(x, y, lambda a, b: a == "Not Competed" and b == "NOT COMPETED")),
+
+    ("solicitation_procedures", "solicitation_procedures_description", "Solicitation Procedures",
+     lambda x, y, _: safe_compare_text(x, y, lambda a, b: a == "Sole Source" and b == "ONLY ONE SOURCE")),
+
+    ("subcontracting_plan", "subcontracting_plan_description", "Subcontracting Plan",
+     lambda x, y, _: safe_compare_text(x, y, lambda a, b: a == "Plan Not Required" and b == "PLAN NOT REQUIRED")),
+
+    ("clinger_cohen_act_planning", "clinger_cohen_act_planning_description", "Clinger Cohen Act Planning",
+     lambda x, y, _: safe_compare_text(x, y, lambda a, b: a == "No" and b == "NO")),
+
+    ("domestic_or_foreign_entity_description", "domestic_or_foreign_entity_description", "Domestic/Foreign Entity",
+     lambda x, y, _: safe_compare_text(x, y, lambda a, b: "U.S." in a and "U.S." in b))
+]
+
+AWARD_COMPARATOR = FieldComparator(AWARD_FIELD_MAPPINGS, unmapped_by="field")
+
 def compare_award_data(
     api_key: str,
     supabase: Client,
@@ -298,203 +602,155 @@ def compare_award_data(
     print("Supabase Data:")
     print(json.dumps(sb, indent=4))
 
-    # Define fields to compare with their mappings
-    comparison_results = {
-        "matches": [],
-        "mismatches": [],
-        "higher_gov_only": [],
-        "supabase_only": [],
-        "unmapped_higher_gov_fields": [],
-        "unmapped_supabase_fields": []
-    }
+    return compare_award_records(hg, sb)
 
-    # Updated field mappings to include previously unmapped fields
-    field_mappings = [
-        # Basic Award Information
-        ("award_id", "piid", "Award ID/PIID"),
-        ("parent_award_id", "parent_award_piid", "Parent Award ID"),
-        ("award_description_original", "description", "Description"),
-        ("award_type", "type_description", "Award Type"),
-        ("solicitation_identifier", "solicitation_identifier", "Solicitation ID"),
-
-        # Financial Information
-        ("total_dollars_obligated", "total_obligation", "Total Obligation"),
-        ("current_total_value_of_award", "base_exercised_options", "Current Total Value"),
-        ("potential_total_value_of_award", "base_and_all_options", "Potential Total Value"),
-
-        # Dates
-        ("period_of_performance_start_date", "period_of_performance_start_date", "Performance Start Date"),
-        ("period_of_performance_current_end_date", "period_of_performance_end_date", "Performance End Date"),
-        ("period_of_performance_potential_end_date", "period_of_performance_potential_end_date", "Potential End Date"),
-        ("last_modified_date", "period_of_performance_last_modified_date", "Last Modified Date"),
-
-        # Recipient Information
-        ("awardee.clean_name", "recipient_name", "Recipient Name"),
-        ("awardee.uei", "recipient_uei", "Recipient UEI"),
-        ("awardee_parent.clean_name", "parent_recipient_name", "Parent Recipient Name"),
-        ("awardee_parent.uei", "parent_recipient_uei", "Parent Recipient UEI"),
-
-        # Place of Performance
-        ("primary_place_of_performance_city_name", "place_of_performance_city_name", "Place of Performance City"),
-        ("primary_place_of_performance_state_code", "place_of_performance_state_code", "Place of Performance State"),
-        ("primary_place_of_performance_country_name", "place_of_performance_country_name", "Place of Performance Country"),
-        ("primary_place_of_performance_zip", "place_of_performance_zip5", "Place of Performance ZIP"),
-
-        # Classification Codes
-        ("psc_code.psc_code", "product_or_service_code", "PSC Code"),
-        ("naics_code.naics_code", "naics", "NAICS Code"),
-        ("naics_code.naics_description", "naics_description", "NAICS Description"),
-
-        # Competition Information
-        ("number_of_offers_received", "number_of_offers_received", "Number of Offers"),
-        ("extent_competed", "extent_competed_description", "Extent Competed"),
-        ("solicitation_procedures", "solicitation_procedures_description", "Solicitation Procedures"),
-        ("type_of_contract_pricing_description", "type_of_contract_pricing_description", "Contract Pricing Type"),
-
-        # Additional Details
-        ("subcontracting_plan", "subcontracting_plan_description", "Subcontracting Plan"),
-        ("clinger_cohen_act_planning", "clinger_cohen_act_planning_description", "Clinger Cohen Act Planning"),
-
-        # Agency Information
-        ("awarding_agency.agency_name", "awarding_agency_subtier_agency_name", "Awarding Agency"),
-        ("funding_agency.agency_name", "funding_agency_subtier_agency_name", "Funding Agency"),
-
-        # Transaction Information
-        ("latest_action_date", "transactions.0.action_date", "Latest Action Date"),
-        ("latest_transaction_key", "transactions.0.id", "Latest Transaction ID"),
-
-        # Additional Award Details
-        ("award_type", "type_description", "Award Type"),
-        ("category", "category", "Award Category"),
-        ("latest_action_date", "date_signed", "Award Date"),
-        ("latest_action_date_fiscal_year", "fiscal_year", "Fiscal Year"),
-
-        # Additional Recipient Details
-        ("awardee.cage_code", "recipient_cage_code", "Recipient CAGE Code"),
-        ("recipient_location_address_line1", "recipient_location_address_line1", "Recipient Address"),
-        ("recipient_location_zip4", "recipient_location_zip4", "Recipient ZIP+4"),
-        ("recipient_location_zip5", "recipient_location_zip5", "Recipient ZIP5"),
-        ("recipient_location_congressional_code", "recipient_location_congressional_code", "Recipient Congressional District"),
-        ("business_categories", "business_categories", "Business Categories"),
-
-        # Additional Place of Performance Details
-        ("primary_place_of_performance_county_name", "place_of_performance_county_name", "Place of Performance County"),
-        ("primary_place_of_performance_congressional_code", "place_of_performance_congressional_code", "Place of Performance Congressional District"),
-        ("primary_place_of_performance_zip4", "place_of_performance_zip4", "Place of Performance ZIP+4"),
-
-        # Extended Classification Details
-        ("psc_code.psc_name", "psc_hierarchy_base_code_description", "PSC Description"),
-        ("psc_code.psc_description", "product_or_service_description", "PSC Full Description"),
-        ("naics_code.naics_description", "naics_hierarchy_base_code_description", "NAICS Description"),
-
-        # Competition and Contract Details
-        ("type_of_set_aside", "type_set_aside", "Set Aside Type"),
-        ("other_than_full_and_open_competition", "other_than_full_and_open", "Other Than Full and Open Competition"),
-        ("commercial_item_acquisition", "commercial_item_acquisition", "Commercial Item Acquisition"),
-        ("consolidated_contract", "consolidated_contract", "Consolidated Contract"),
-        ("multi_year_contract", "multi_year_contract", "Multi Year Contract"),
-        ("purchase_card_as_payment_method", "purchase_card_as_payment_method", "Purchase Card as Payment Method"),
-
-        # Agency Details
-        ("funding_agency.agency_name", "funding_agency_office_agency_name", "Funding Office Name"),
-        ("awarding_agency.agency_name", "awarding_agency_office_agency_name", "Awarding Office Name"),
-        ("funding_agency_toptier_agency_name", "funding_agency_toptier_agency_name", "Funding Agency Top Tier Name"),
-        ("awarding_agency_toptier_agency_name", "awarding_agency_toptier_agency_name", "Awarding Agency Top Tier Name"),
-
-        # Financial Details
-        ("total_account_obligation", "total_account_obligation", "Total Account Obligation"),
-        ("total_account_outlay", "total_account_outlay", "Total Account Outlay"),
-
-        # System/Reference IDs
-        ("generated_unique_award_id", "generated_unique_award_id", "Generated Unique Award ID"),
-        ("usa_spending_id", "usa_spending_id", "USA Spending ID"),
-
-        # Custom comparisons for fields that need special handling
-        ("type_of_contract_pricing_description", "type_of_contract_pricing_description", "Contract Pricing Type",
-         lambda x, y: safe_compare_text(x, y, lambda a, b: a == "Fixed Price" and b == "FIRM FIXED PRICE")),
-
-        ("extent_competed", "extent_competed_description", "Extent Competed",
-         lambda x, y: safe_compare_text(x, y, lambda a, b: a == "Not Competed" and b == "NOT COMPETED")),
-
-        ("solicitation_procedures", "solicitation_procedures_description", "Solicitation Procedures",
-         lambda x, y: safe_compare_text(x, y, lambda a, b: a == "Sole Source" and b == "ONLY ONE SOURCE")),
-
-        ("subcontracting_plan", "subcontracting_plan_description", "Subcontracting Plan",
-         lambda x, y: safe_compare_text(x, y, lambda a, b: a == "Plan Not Required" and b == "PLAN NOT REQUIRED")),
-
-        ("clinger_cohen_act_planning", "clinger_cohen_act_planning_description", "Clinger Cohen Act Planning",
-         lambda x, y: safe_compare_text(x, y, lambda a, b: a == "No" and b == "NO")),
-
-        ("domestic_or_foreign_entity_description", "domestic_or_foreign_entity_description", "Domestic/Foreign Entity",
-         lambda x, y: safe_compare_text(x, y, lambda a, b: "U.S." in a and "U.S." in b))
-    ]
+def compare_award_records(hg: Dict[str, Any], sb: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare a HigherGov contract record with a Supabase award row using AWARD_FIELD_MAPPINGS.
 
-    # Compare each field
-    for mapping in field_mappings:
-        # Unpack mapping values, with custom_compare being optional
-        hg_field, sb_field, display_name = mapping[:3]
-        custom_compare = mapping[3] if len(mapping) > 3 else None
+    Returns:
+        Dict containing matches, mismatches and the unmapped fields of each side
+    """
+    comparison_results = AWARD_COMPARATOR.compare(hg, sb)
+    comparison_results["higher_gov_only"] = []
+    comparison_results["supabase_only"] = []
+    return comparison_results
 
-        hg_value = get_nested_value(hg, hg_field)
-        sb_value = get_nested_value(sb, sb_field)
+def get_awards_by_piids(supabase: Client, piids: List[str], chunk_size: int = AWARD_BATCH_SIZE) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieve awards from Supabase's Awards table for many piids, one in_ query per chunk.
 
-        # Convert to same type for comparison
-        hg_value = standardize_value(hg_value)
-        sb_value = standardize_value(sb_value)
+    A chunk can match more rows than the server returns per response (several awards may
+    share a piid), so each chunk is paged through until a short page.
 
-        # Use custom comparison function if provided, otherwise use direct equality
-        if custom_compare:
-            matches = custom_compare(hg_value, sb_value)
-        else:
-            matches = hg_value == sb_value
+    Returns:
+        Dict mapping each piid found to its award row (the first row if several share a piid)
+    """
+    awards: Dict[str, Dict[str, Any]] = {}
+    unique_piids = list(dict.fromkeys(p for p in piids if p))
+    for start in range(0, len(unique_piids), chunk_size):
+        chunk = unique_piids[start:start + chunk_size]
+        offset = 0
+        while True:
+            try:
+                response = supabase.table("awards") \
+                    .select("*") \
+                    .in_("piid", chunk) \
+                    .order("usa_spending_id") \
+                    .order("piid") \
+                    .range(offset, offset + AWARD_PAGE_SIZE - 1) \
+                    .execute()
+            except Exception as e:
+                print(f"Error fetching awards for {len(chunk)} piids: {str(e)}")
+                raise Exception(f"Database error: {str(e)}")
+            rows = response.data or []
+            for row in rows:
+                awards.setdefault(row["piid"], row)
+            if len(rows) < AWARD_PAGE_SIZE:
+                break
+            offset += AWARD_PAGE_SIZE
+    return awards
+
+def compare_award_data_batch(
+    api_key: str,
+    supabase: Client,
+    awards: List[Tuple[str, str]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    chunk_size: int = AWARD_BATCH_SIZE,
+    max_examples: int = 5
+) -> Dict[str, Any]:
+    """
+    Compare many awards between HigherGov and Supabase and aggregate the mismatches.
 
-        if matches:
-            comparison_results["matches"].append({
-                "field": display_name,
-                "value": f"{hg_value} -> {sb_value}" if custom_compare else hg_value
-            })
-        else:
-            comparison_results["mismatches"].append({
-                "field": display_name,
-                "higher_gov_value": hg_value,
-                "supabase_value": sb_value
-            })
-
-    # Find unmapped fields in HigherGov data
-    for field in hg.keys():
-        if field not in [f[0] for f in field_mappings]:
-            value = hg[field]
-            if isinstance(value, dict):
-                # For nested objects, include all nested fields
-                for nested_field, nested_value in _flatten_dict(value, parent_key=field).items():
-                    comparison_results["unmapped_higher_gov_fields"].append({
-                        "field": nested_field,
-                        "value": nested_value
-                    })
-            else:
-                comparison_results["unmapped_higher_gov_fields"].append({
-                    "field": field,
-                    "value": value
-                })
+    Supabase awards are fetched with one query per chunk of piids; HigherGov awards are
+    fetched concurrently through the shared, rate-limited client.
 
-    # Find unmapped fields in Supabase data
-    for field in sb.keys():
-        if field not in [f[1] for f in field_mappings]:
-            value = sb[field]
-            if isinstance(value, dict):
-                # For nested objects, include all nested fields
-                for nested_field, nested_value in _flatten_dict(value, parent_key=field).items():
-                    comparison_results["unmapped_supabase_fields"].append({
-                        "field": nested_field,
-                        "value": nested_value
-                    })
-            else:
-                comparison_results["unmapped_supabase_fields"].append({
-                    "field": field,
-                    "value": value
+    Args:
+        api_key (str): HigherGov API key
+        supabase (Client): Initialized Supabase client
+        awards (List[Tuple[str, str]]): (HigherGov award_id, Supabase piid) pairs
+        max_workers (int): Number of HigherGov awards fetched concurrently
+        chunk_size (int): Number of piids per Supabase query
+        max_examples (int): Number of example values kept per mismatched field
+
+    Returns:
+        Dict containing:
+            - compared: Number of awards found in both sources and compared
+            - missing_higher_gov: award_ids HigherGov returned nothing for
+            - failed_higher_gov: (award_id, error) for HigherGov requests that raised
+            - missing_supabase: piids missing from Supabase
+            - awards_with_mismatches: Number of compared awards with at least one mismatch
+            - field_mismatches: Per field, the mismatch count and example values
+            - results: Per piid, the full comparison result
+    """
+    supabase_awards = get_awards_by_piids(supabase, [piid for _, piid in awards], chunk_size)
+
+    # One failed request must not abort the batch; failures are reported per award.
+    def fetch_higher_gov(award_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            records = highergov_get_all_awards(api_key=api_key, award_id=award_id, max_workers=1)
+        except Exception as e:
+            return None, str(e)
+        return (records[0] if records else None), None
+
+    award_ids = list(dict.fromkeys(award_id for award_id, _ in awards))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        fetched = dict(zip(award_ids, executor.map(fetch_higher_gov, award_ids)))
+    higher_gov_awards = {award_id: record for award_id, (record, _) in fetched.items()}
+    failed_higher_gov = {award_id: error for award_id, (_, error) in fetched.items() if error is not None}
+
+    report = {
+        "compared": 0,
+        "missing_higher_gov": [],
+        "failed_higher_gov": [(award_id, error) for award_id, error in failed_higher_gov.items()],
+        "missing_supabase": [],
+        "awards_with_mismatches": 0,
+        "field_mismatches": {},
+        "results": {}
+    }
+    for award_id, piid in awards:
+        hg = higher_gov_awards.get(award_id)
+        sb = supabase_awards.get(piid)
+        if hg is None and award_id not in failed_higher_gov:
+            report["missing_higher_gov"].append(award_id)
+        if sb is None:
+            report["missing_supabase"].append(piid)
+        if hg is None or sb is None:
+            continue
+
+        result = compare_award_records(hg, sb)
+        report["results"][piid] = result
+        report["compared"] += 1
+        if result["mismatches"]:
+            report["awards_with_mismatches"] += 1
+        for mismatch in result["mismatches"]:
+            field_report = report["field_mismatches"].setdefault(mismatch["field"], {"count": 0, "examples": []})
+            field_report["count"] += 1
+            if len(field_report["examples"]) < max_examples:
+                field_report["examples"].append({
+                    "piid": piid,
+                    "higher_gov_value": mismatch["higher_gov_value"],
+                    "supabase_value": mismatch["supabase_value"]
                 })
 
-    return comparison_results
+    return report
+
+def print_award_batch_report(report: Dict[str, Any]) -> None:
+    print("\n----- Award Comparison Report -----")
+    print(f"Awards compared: {report['compared']}")
+    print(f"Awards with mismatches: {report['awards_with_mismatches']}")
+    print(f"Missing from HigherGov: {len(report['missing_higher_gov'])}")
+    print(f"HigherGov requests failed: {len(report['failed_higher_gov'])}")
+    for award_id, error in report["failed_higher_gov"]:
+        print(f"  {award_id}: {error}")
+    print(f"Missing from Supabase: {len(report['missing_supabase'])}")
+
+    print("\nMismatches by field:")
+    by_count = sorted(report["field_mismatches"].items(), key=lambda item: item[1]["count"], reverse=True)
+    for field, field_report in by_count:
+        print(f"{field}: {field_report['count']} of {report['compared']}")
+        for example in field_report["examples"]:
+            print(f"  {example['piid']}: HigherGov {example['higher_gov_value']!r} / Supabase {example['supabase_value']!r}")
 
 def get_opportunity_by_solicitation_id(supabase: Client, solicitation_id: str) -> Dict[str, Any]:
     """
@@ -547,37 +803,92 @@ def get_opportunity_by_solicitation_id(supabase: Client, solicitation_id: str) -
         raise Exception(f"Database error: {str(e)}")
 
 def get_naics_id_by_code(supabase: Client, naics_code: str) -> Optional[int]:
-    """Get NAICS ID from the NAICS table using the code."""
+    """Get NAICS ID from the cached NAICS table using the code."""
     try:
-        response = supabase.table("naics") \
-            .select("naics_id") \
-            .eq("naics_code", naics_code) \
-            .limit(1) \
-            .execute()
-
-        if response.data:
-            return response.data[0].get("naics_id")
-        return None
+        return get_reference_data(supabase).naics_id(naics_code)
     except Exception as e:
         print(f"Error fetching NAICS ID for code {naics_code}: {str(e)}")
         return None
 
 def get_psc_id_by_code(supabase: Client, psc_code: str) -> Optional[int]:
-    """Get PSC ID from the PSC table using the code."""
+    """Get PSC ID from the cached PSC table using the code."""
     try:
-        response = supabase.table("psc") \
-            .select("psc_id") \
-            .eq("psc_code", psc_code) \
-            .limit(1) \
-            .execute()
-
-        if response.data:
-            return response.data[0].get("psc_id")
-        return None
+        return get_reference_data(supabase).psc_id(psc_code)
     except Exception as e:
         print(f"Error fetching PSC ID for code {psc_code}: {str(e)}")
         return None
 
+# HigherGov opportunity type description -> Supabase notice type code.
+OPPORTUNITY_TYPE_CODES = {
+    "Award Notice": "a",
+    "Foreign Government Standard": "f",
+    "Sale of Surplus Property": "g",
+    "Consolidate/(Substantially) Bundle": "i",
+    "Justification and Approval (J&A)": "j",
+    "Combined Synopsis/Solicitation": "k",
+    "Fair Opportunity / Limited Sources Justification": "l",
+    "Modification/Amendment": "m",
+    "Solicitation": "o",
+    "Presolicitation": "p",
+    "Sources Sought": "r",
+    "Special Notice": "s",
+    "Justification": "u"
+}
+
+# HigherGov opportunity field -> Supabase notices column, display name and optional custom comparison.
+# The NAICS/PSC ID comparisons receive the ReferenceData as context.
+OPPORTUNITY_FIELD_MAPPINGS = [
+    # Basic Opportunity Information
+    ("source_id", "solicitation_id", "Solicitation ID"),
+    ("source_id_version", "notice_id", "Notice ID"),
+    ("title", "title", "Title"),
+    ("description_text", "description_body", "Description"),
+    ("opp_type.description", "type", "Notice Type", lambda x, y, _: OPPORTUNITY_TYPE_CODES.get(x) == y),
+
+    # Dates
+    ("posted_date", "posted_date", "Posted Date"),
+    ("due_date", "solicitation_response_deadline", "Response Deadline"),
+
+    # Agency Information
+    ("agency.agency_name", "organization_level_1_name", "Department Name"),
+
+    # Classification Codes
+    ("naics_code.naics_code", "naics", "NAICS Code"),
+    ("psc_code.psc_code", "psc", "PSC Code"),
+    # Add custom comparisons for IDs
+    ("naics_code.naics_code", "naics_id", "NAICS ID", lambda x, y, reference: reference.naics_id(x) == y),
+    ("psc_code.psc_code", "psc_id", "PSC ID", lambda x, y, reference: reference.psc_id(x) == y),
+
+    # Set Aside Information
+    ("set_aside", "solicitation_set_aside", "Set Aside Type"),
+
+    # Primary Contact Information
+    ("primary_contact_email.contact_title", "primary_poc_title", "Primary Contact Title"),
+    ("primary_contact_email.contact_name", "primary_poc_full_name", "Primary Contact Name"),
+    ("primary_contact_email.contact_email", "primary_poc_email", "Primary Contact Email"),
+    ("primary_contact_email.contact_phone", "primary_poc_phone", "Primary Contact Phone"),
+
+    # Secondary Contact Information
+    ("secondary_contact_email.contact_title", "secondary_poc_title", "Secondary Contact Title"),
+    ("secondary_contact_email.contact_name", "secondary_poc_full_name", "Secondary Contact Name"),
+    ("secondary_contact_email.contact_email", "secondary_poc_email", "Secondary Contact Email"),
+    ("secondary_contact_email.contact_phone", "secondary_poc_phone", "Secondary Contact Phone"),
+
+    # Location Information
+    ("pop_city", "pop_city_name", "City"),
+    ("pop_state", "pop_state_name", "State"),
+    ("pop_zip", "pop_zip", "ZIP Code"),
+    ("pop_country", "pop_country_name", "Country"),
+
+    # Award Information (if available)
+    ("award_amount", "award_amount", "Award Amount"),
+    ("award_date", "award_date", "Award Date"),
+    ("awardee_name", "awardee_name", "Awardee Name"),
+    ("awardee_uei", "awardee_uei", "Awardee UEI")
+]
+
+OPPORTUNITY_COMPARATOR = FieldComparator(OPPORTUNITY_FIELD_MAPPINGS, unmapped_by="root")
+
 def compare_opportunity_data(
     api_key: str,
     supabase: Client,
@@ -614,161 +925,8 @@ def compare_opportunity_data(
     print("Supabase Data:")
     print(json.dumps(sb, indent=4))
 
-    # Track which fields we've compared
-    hg_fields_checked = set()
-    sb_fields_checked = set()
-
-    comparison_results = {
-        "matches": [],
-        "mismatches": [],
-        "unmapped_higher_gov_fields": [],
-        "unmapped_supabase_fields": []
-    }
-
-    # Define type mapping between HigherGov and Supabase
-    type_mapping = {
-        "Award Notice": "a",
-        "Foreign Government Standard": "f",
-        "Sale of Surplus Property": "g",
-        "Consolidate/(Substantially) Bundle": "i",
-        "Justification and Approval (J&A)": "j",
-        "Combined Synopsis/Solicitation": "k",
-        "Fair Opportunity / Limited Sources Justification": "l",
-        "Modification/Amendment": "m",
-        "Solicitation": "o",
-        "Presolicitation": "p",
-        "Sources Sought": "r",
-        "Special Notice": "s",
-        "Justification": "u"
-    }
-
-    # Get NAICS and PSC IDs if codes are available
-    naics_code = get_nested_value(hg, "naics_code.naics_code")
-    psc_code = get_nested_value(hg, "psc_code.psc_code")
-
-    naics_id = get_naics_id_by_code(supabase, naics_code) if naics_code else None
-    psc_id = get_psc_id_by_code(supabase, psc_code) if psc_code else None
-
-    # Updated field mappings based on new schema
-    field_mappings = [
-        # Basic Opportunity Information
-        ("source_id", "solicitation_id", "Solicitation ID"),
-        ("source_id_version", "notice_id", "Notice ID"),
-        ("title", "title", "Title"),
-        ("description_text", "description_body", "Description"),
-        ("opp_type.description", "type", "Notice Type", lambda x, y: type_mapping.get(x) == y),
-
-        # Dates
-        ("posted_date", "posted_date", "Posted Date"),
-        ("due_date", "solicitation_response_deadline", "Response Deadline"),
-
-        # Agency Information
-        ("agency.agency_name", "organization_level_1_name", "Department Name"),
-
-        # Classification Codes
-        ("naics_code.naics_code", "naics", "NAICS Code"),
-        ("psc_code.psc_code", "psc", "PSC Code"),
-        # Add custom comparisons for IDs
-        ("naics_code.naics_code", "naics_id", "NAICS ID", lambda x, _: get_naics_id_by_code(supabase, x) == _),
-        ("psc_code.psc_code", "psc_id", "PSC ID", lambda x, _: get_psc_id_by_code(supabase, x) == _),
-
-        # Set Aside Information
-        ("set_aside", "solicitation_set_aside", "Set Aside Type"),
-
-        # Primary Contact Information
-        ("primary_contact_email.contact_title", "primary_poc_title", "Primary Contact Title"),
-        ("primary_contact_email.contact_name", "primary_poc_full_name", "Primary Contact Name"),
-        ("primary_contact_email.contact_email", "primary_poc_email", "Primary Contact Email"),
-        ("primary_contact_email.contact_phone", "primary_poc_phone", "Primary Contact Phone"),
-
-        # Secondary Contact Information
-        ("secondary_contact_email.contact_title", "secondary_poc_title", "Secondary Contact Title"),
-        ("secondary_contact_email.contact_name", "secondary_poc_full_name", "Secondary Contact Name"),
-        ("secondary_contact_email.contact_email", "secondary_poc_email", "Secondary Contact Email"),
-        ("secondary_contact_email.contact_phone", "secondary_poc_phone", "Secondary Contact Phone"),
-
-        # Location Information
-        ("pop_city", "pop_city_name", "City"),
-        ("pop_state", "pop_state_name", "State"),
-        ("pop_zip", "pop_zip", "ZIP Code"),
-        ("pop_country", "pop_country_name", "Country"),
-
-        # Award Information (if available)
-        ("award_amount", "award_amount", "Award Amount"),
-        ("award_date", "award_date", "Award Date"),
-        ("awardee_name", "awardee_name", "Awardee Name"),
-        ("awardee_uei", "awardee_uei", "Awardee UEI")
-    ]
-
-    # Compare mapped fields
-    for mapping in field_mappings:
-        hg_field, sb_field, display_name = mapping[:3]
-        custom_compare = mapping[3] if len(mapping) > 3 else None
-
-        # Track which fields we've checked
-        hg_fields_checked.add(hg_field.split('.')[0])
-        sb_fields_checked.add(sb_field.split('.')[0])
-
-        hg_value = get_nested_value(hg, hg_field)
-        sb_value = get_nested_value(sb, sb_field)
-
-        # Convert to same type for comparison
-        hg_value = standardize_value(hg_value)
-        sb_value = standardize_value(sb_value)
-
-        # Use custom comparison function if provided, otherwise use direct equality
-        if custom_compare:
-            matches = custom_compare(hg_value, sb_value)
-        else:
-            matches = hg_value == sb_value
-
-        if matches:
-            comparison_results["matches"].append({
-                "field": display_name,
-                "value": f"{hg_value} -> {sb_value}" if custom_compare else hg_value
-            })
-        else:
-            comparison_results["mismatches"].append({
-                "field": display_name,
-                "higher_gov_value": hg_value,
-                "supabase_value": sb_value
-            })
-
-    # Find unmapped fields in HigherGov data
-    for field in hg.keys():
-        if field not in hg_fields_checked:
-            value = hg[field]
-            if isinstance(value, dict):
-                # For nested objects, include all nested fields
-                for nested_field, nested_value in _flatten_dict(value, parent_key=field).items():
-                    comparison_results["unmapped_higher_gov_fields"].append({
-                        "field": nested_field,
-                        "value": nested_value
-                    })
-            else:
-                comparison_results["unmapped_higher_gov_fields"].append({
-                    "field": field,
-                    "value": value
-                })
-
-    # Find unmapped fields in Supabase data
-    for field in sb.keys():
-        if field not in sb_fields_checked:
-            value = sb[field]
-            if isinstance(value, dict):
-                # For nested objects, include all nested fields
-                for nested_field, nested_value in _flatten_dict(value, parent_key=field).items():
-                    comparison_results["unmapped_supabase_fields"].append({
-                        "field": nested_field,
-                        "value": nested_value
-                    })
-            else:
-                comparison_results["unmapped_supabase_fields"].append({
-                    "field": field,
-                    "value": value
-                })
-
-    return comparison_results
+    # NAICS and PSC IDs are looked up in the cached reference tables
+    return OPPORTUNITY_COMPARATOR.compare(hg, sb, context=get_reference_data(supabase))
 
 def _flatten_dict(d: Dict[str, Any], parent_key: str = '') -> Dict[str, Any]:
     """
@@ -827,6 +985,217 @@ def run_opportunity_comparison(api_key: str, supabase: Client) -> None:
     print("\nOpportunity Comparison Results:")
     print_award_comparison(results)
 
+def _candidate_cache_key(supabase: Client, **filters) -> Tuple:
+    """Normalize filter arguments so equivalent queries share a cache entry."""
+    key = [id(supabase)]
+    for name in sorted(filters):
+        value = filters[name]
+        if isinstance(value, (list, tuple, set)):
+            value = tuple(sorted(set(value))) or None
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        key.append((name, value))
+    return tuple(key)
+
+
+def clear_candidate_cache() -> None:
+    """Drop every cached filtered-and-latest notice ID list."""
+    with _candidate_cache_lock:
+        _candidate_cache.clear()
+
+
+def get_filtered_latest_notice_ids(
+    supabase: Client,
+    active: bool = True,
+    agencies: Optional[List[str]] = None,
+    date_due_start: Optional[datetime] = None,
+    date_due_end: Optional[datetime] = None,
+    date_posted_start: Optional[datetime] = None,
+    date_posted_end: Optional[datetime] = None,
+    naics_codes: Optional[List[str]] = None,
+    psc_codes: Optional[List[str]] = None,
+    set_asides: Optional[List[str]] = None,
+    use_cache: bool = True
+) -> List[str]:
+    """
+    Return the IDs of the notices matching the filters that are also the latest notice of their solicitation.
+
+    This is the expensive part of get_filtered_opportunities: an unbounded filter query
+    on notices plus a solicitations lookup. The result is cached for CANDIDATE_CACHE_TTL
+    seconds per supabase client and filter set, so paging through a query only runs
+    it once. Within the TTL, notices whose deadline passes are still returned.
+
+    Args:
+        supabase (Client): Initialized Supabase client
+        active (bool): If True, only return opportunities with future response deadlines
+        agencies (List[str], optional): List of agency names to filter by
+        date_due_start (datetime, optional): Start of due date range
+        date_due_end (datetime, optional): End of due date range
+        date_posted_start (datetime, optional): Start of posted date range
+        date_posted_end (datetime, optional): End of posted date range
+        naics_codes (List[str], optional): List of NAICS codes to filter by
+        psc_codes (List[str], optional): List of PSC codes to filter by
+        set_asides (List[str], optional): List of set-aside types to filter by
+        use_cache (bool): Reuse a cached result and store the new one
+    """
+    cache_key = _candidate_cache_key(
+        supabase,
+        active=active,
+        agencies=agencies,
+        date_due_start=date_due_start,
+        date_due_end=date_due_end,
+        date_posted_start=date_posted_start,
+        date_posted_end=date_posted_end,
+        naics_codes=naics_codes,
+        psc_codes=psc_codes,
+        set_asides=set_asides
+    )
+    if use_cache:
+        with _candidate_cache_lock:
+            cached = _candidate_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    notice_ids = _query_filtered_latest_notice_ids(
+        supabase, active, agencies, date_due_start, date_due_end,
+        date_posted_start, date_posted_end, naics_codes, psc_codes, set_asides
+    )
+    if use_cache:
+        with _candidate_cache_lock:
+            now = time.monotonic()
+            for key in [k for k, (expires_at, _) in _candidate_cache.items() if expires_at <= now]:
+                del _candidate_cache[key]
+            _candidate_cache[cache_key] = (now + CANDIDATE_CACHE_TTL, notice_ids)
+    return notice_ids
+
+
+def filter_notices_by_codes(
+    notices: List[Dict[str, Any]],
+    naics_codes: Optional[List[str]] = None,
+    psc_codes: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Keep the notices whose NAICS and PSC codes are in the given lists, preserving order.
+
+    The codes are looked up in sets, so this is linear in the number of notices.
+    A notice without a code does not match a filter on that code.
+    """
+    naics_set = set(naics_codes) if naics_codes else None
+    psc_set = set(psc_codes) if psc_codes else None
+    return [
+        notice for notice in notices
+        if (naics_set is None or notice.get("naics") in naics_set)
+        and (psc_set is None or notice.get("psc") in psc_set)
+    ]
+
+
+def select_latest_notice_ids(notices: List[Dict[str, Any]], latest_notice_ids: Iterable[str]) -> List[str]:
+    """Return, in order, the IDs of the notices that are the latest notice of their solicitation."""
+    latest = latest_notice_ids if isinstance(latest_notice_ids, (set, frozenset)) else set(latest_notice_ids)
+    return [notice["notice_id"] for notice in notices if notice["notice_id"] in latest]
+
+
+def _query_filtered_latest_notice_ids(
+    supabase: Client,
+    active: bool,
+    agencies: Optional[List[str]],
+    date_due_start: Optional[datetime],
+    date_due_end: Optional[datetime],
+    date_posted_start: Optional[datetime],
+    date_posted_end: Optional[datetime],
+    naics_codes: Optional[List[str]],
+    psc_codes: Optional[List[str]],
+    set_asides: Optional[List[str]]
+) -> List[str]:
+    """Run the filter and latest-notice queries of get_filtered_opportunities, uncached."""
+    # Step 1: Apply filters to notices and get basic data (minimal fields)
+    # Include naics and psc fields to use for verification later
+    columns = """
+        notice_id,
+        solicitation_id,
+        solicitation_response_deadline,
+        naics,
+        psc
+    """
+    if agencies:
+        # Agency filters: organizations whose name matches, plus every organization under
+        # them, joined through organization_closure in Postgres.
+        organization_keys = find_organization_keys_by_name(supabase, agencies)
+        if not organization_keys:
+            return []
+        filter_query = notices_under_organizations(supabase, organization_keys, columns)
+    else:
+        filter_query = supabase.from_("notices").select(columns)
+
+    # Apply all filters
+    if active:
+        filter_query = filter_query.gt("solicitation_response_deadline", "now()")
+
+    # Date filters
+    if date_due_start:
+        filter_query = filter_query.gte("solicitation_response_deadline", date_due_start.isoformat())
+    if date_due_end:
+        filter_query = filter_query.lte("solicitation_response_deadline", date_due_end.isoformat())
+    if date_posted_start:
+        filter_query = filter_query.gte("posted_date", date_posted_start.isoformat())
+    if date_posted_end:
+        filter_query = filter_query.lte("posted_date", date_posted_end.isoformat())
+
+    # NAICS and PSC code filters - Apply directly to text columns
+    if naics_codes:
+        filter_query = filter_query.in_("naics", naics_codes)
+    if psc_codes:
+        filter_query = filter_query.in_("psc", psc_codes)
+
+    # Set-aside filter
+    if set_asides:
+        filter_query = filter_query.in_("solicitation_set_aside", set_asides)
+
+    # Notice type filters
+    filter_query = filter_query.in_("type", ["o", "p", "k", "r", "i"])
+    filter_query = filter_query.not_.in_("type", ["a", "s", "j", "g", "f", "u", "v", "z"])
+
+    # Execute the filtering query
+    filtered_notices = filter_query.execute()
+
+    if not filtered_notices.data:
+        return []
+
+    # Verify that the notices actually match our NAICS/PSC criteria
+    # This is necessary because sometimes the filter doesn't work perfectly
+    if naics_codes or psc_codes:
+        filtered_notices.data = filter_notices_by_codes(filtered_notices.data, naics_codes, psc_codes)
+
+    if not filtered_notices.data:
+        return []
+
+    # Step 2: Get unique solicitation IDs from filtered notices
+    solicitation_ids = list(set(notice["solicitation_id"] for notice in filtered_notices.data
+                              if notice.get("solicitation_id")))
+
+    if not solicitation_ids:
+        return []
+
+    # Step 3: Get latest notice IDs for these solicitations
+    latest_notices_response = supabase.from_("solicitations") \
+        .select("solicitation_id, latest_notice_id") \
+        .in_("solicitation_id", solicitation_ids) \
+        .execute()
+
+    # Map solicitation_id to latest_notice_id
+    latest_notice_map = {item["solicitation_id"]: item["latest_notice_id"]
+                       for item in latest_notices_response.data if item.get("latest_notice_id")}
+
+    # Extract all latest notice IDs
+    latest_notice_ids = set(latest_notice_map.values())
+
+    if not latest_notice_ids:
+        return []
+
+    # Step 4: Find notices that are both filtered and the latest
+    return select_latest_notice_ids(filtered_notices.data, latest_notice_ids)
+
+
 def get_filtered_opportunities(
     supabase: Client,
     active: bool = True,
@@ -839,11 +1208,15 @@ def get_filtered_opportunities(
     psc_codes: Optional[List[str]] = None,
     set_asides: Optional[List[str]] = None,
     page: int = 1,
-    page_size: int = 20
+    page_size: int = 20,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Get filtered opportunities from the Notices table, only returning the latest notice for each solicitation.
 
+    The filtered-and-latest notice IDs are cached (see get_filtered_latest_notice_ids),
+    so after the first page each request only fetches the details of its page.
+
     Args:
         supabase (Client): Initialized Supabase client
         active (bool): If True, only return opportunities with future response deadlines
@@ -857,6 +1230,7 @@ def get_filtered_opportunities(
         set_asides (List[str], optional): List of set-aside types to filter by
         page (int): Page number for pagination (1-based)
         page_size (int): Number of records per page
+        use_cache (bool): Reuse the cached filtered-and-latest notice IDs of this query
 
     Returns:
         Dict containing:
@@ -871,129 +1245,20 @@ def get_filtered_opportunities(
         Exception: For database errors
     """
     try:
-        # Step 1: Apply filters to notices and get basic data (minimal fields)
-        # Include naics and psc fields to use for verification later
-        filter_query = supabase.from_("notices").select("""
-            notice_id,
-            solicitation_id,
-            solicitation_response_deadline,
-            naics,
-            psc
-        """)
-
-        # Apply all filters
-        if active:
-            filter_query = filter_query.gt("solicitation_response_deadline", "now()")
-
-        # Date filters
-        if date_due_start:
-            filter_query = filter_query.gte("solicitation_response_deadline", date_due_start.isoformat())
-        if date_due_end:
-            filter_query = filter_query.lte("solicitation_response_deadline", date_due_end.isoformat())
-        if date_posted_start:
-            filter_query = filter_query.gte("posted_date", date_posted_start.isoformat())
-        if date_posted_end:
-            filter_query = filter_query.lte("posted_date", date_posted_end.isoformat())
-
-        # NAICS and PSC code filters - Apply directly to text columns
-        if naics_codes:
-            filter_query = filter_query.in_("naics", naics_codes)
-        if psc_codes:
-            filter_query = filter_query.in_("psc", psc_codes)
-
-        # Set-aside filter
-        if set_asides:
-            filter_query = filter_query.in_("solicitation_set_aside", set_asides)
-
-        # Agency filters
-        if agencies:
-            agency_conditions = []
-            for agency in agencies:
-                for i in range(1, 8):
-                    agency_conditions.append(f"organization_level_{i}_name.ilike.%{agency}%")
-            if agency_conditions:
-                filter_query = filter_query.or_(agency_conditions)
-
-        # Notice type filters
-        filter_query = filter_query.in_("type", ["o", "p", "k", "r", "i"])
-        filter_query = filter_query.not_.in_("type", ["a", "s", "j", "g", "f", "u", "v", "z"])
-
-        # Execute the filtering query
-        filtered_notices = filter_query.execute()
-
-        if not filtered_notices.data:
-            return {
-                "count": 0,
-                "data": [],
-                "page": page,
-                "page_size": page_size,
-                "total_pages": 0
-            }
-
-        # Verify that the notices actually match our NAICS/PSC criteria
-        # This is necessary because sometimes the filter doesn't work perfectly
-        if naics_codes or psc_codes:
-            verified_notices = []
-            for notice in filtered_notices.data:
-                # Check if NAICS code matches (if we're filtering by NAICS)
-                naics_match = not naics_codes or (notice.get("naics") in naics_codes)
-                # Check if PSC code matches (if we're filtering by PSC)
-                psc_match = not psc_codes or (notice.get("psc") in psc_codes)
-
-                # Only include if both criteria match
-                if naics_match and psc_match:
-                    verified_notices.append(notice)
-
-            # Replace the filtered notices with the verified ones
-            filtered_notices.data = verified_notices
-
-        if not filtered_notices.data:
-            return {
-                "count": 0,
-                "data": [],
-                "page": page,
-                "page_size": page_size,
-                "total_pages": 0
-            }
-
-        # Step 2: Get unique solicitation IDs from filtered notices
-        solicitation_ids = list(set(notice["solicitation_id"] for notice in filtered_notices.data
-                                  if notice.get("solicitation_id")))
-
-        if not solicitation_ids:
-            return {
-                "count": 0,
-                "data": [],
-                "page": page,
-                "page_size": page_size,
-                "total_pages": 0
-            }
-
-        # Step 3: Get latest notice IDs for these solicitations
-        latest_notices_response = supabase.from_("solicitations") \
-            .select("solicitation_id, latest_notice_id") \
-            .in_("solicitation_id", solicitation_ids) \
-            .execute()
-
-        # Map solicitation_id to latest_notice_id
-        latest_notice_map = {item["solicitation_id"]: item["latest_notice_id"]
-                           for item in latest_notices_response.data if item.get("latest_notice_id")}
-
-        # Extract all latest notice IDs
-        latest_notice_ids = list(latest_notice_map.values())
-
-        if not latest_notice_ids:
-            return {
-                "count": 0,
-                "data": [],
-                "page": page,
-                "page_size": page_size,
-                "total_pages": 0
-            }
-
-        # Step 4: Find notices that are both filtered and the latest
-        filtered_and_latest = [notice for notice in filtered_notices.data
-                              if notice["notice_id"] in latest_notice_ids]
+        # Steps 1-4: notices matching the filters that are the latest of their solicitation
+        filtered_and_latest = get_filtered_latest_notice_ids(
+            supabase=supabase,
+            active=active,
+            agencies=agencies,
+            date_due_start=date_due_start,
+            date_due_end=date_due_end,
+            date_posted_start=date_posted_start,
+            date_posted_end=date_posted_end,
+            naics_codes=naics_codes,
+            psc_codes=psc_codes,
+            set_asides=set_asides,
+            use_cache=use_cache
+        )
 
         total_count = len(filtered_and_latest)
         total_pages = (total_count + page_size - 1) // page_size
@@ -1003,7 +1268,7 @@ def get_filtered_opportunities(
         end_idx = min(start_idx + page_size, total_count)
 
         # Get the notice IDs for this page
-        page_notice_ids = [notice["notice_id"] for notice in filtered_and_latest[start_idx:end_idx]]
+        page_notice_ids = filtered_and_latest[start_idx:end_idx]
 
         if not page_notice_ids:
             return {
@@ -1061,25 +1326,12 @@ def get_filtered_opportunities(
 
         # Final verification on the detailed data to ensure it matches our criteria
         if naics_codes or psc_codes:
-            verified_detailed_data = []
-            for notice in detailed_response.data:
-                # Check for NAICS match
-                naics_match = True
-                if naics_codes:
-                    notice_naics = notice.get("naics")
-                    naics_match = notice_naics in naics_codes if notice_naics else False
-
-                # Check for PSC match
-                psc_match = True
-                if psc_codes:
-                    notice_psc = notice.get("psc")
-                    psc_match = notice_psc in psc_codes if notice_psc else False
-
-                # Include only if both match
-                if naics_match and psc_match:
-                    verified_detailed_data.append(notice)
-                else:
-                    print(f"INFO: Filtered out notice {notice.get('notice_id')} with NAICS: {notice.get('naics')} and PSC: {notice.get('psc')}")
+            verified_detailed_data = filter_notices_by_codes(detailed_response.data, naics_codes, psc_codes)
+            if len(verified_detailed_data) < len(detailed_response.data):
+                verified_ids = {notice.get("notice_id") for notice in verified_detailed_data}
+                for notice in detailed_response.data:
+                    if notice.get("notice_id") not in verified_ids:
+                        print(f"INFO: Filtered out notice {notice.get('notice_id')} with NAICS: {notice.get('naics')} and PSC: {notice.get('psc')}")
 
             # Update count based on verified data
             actual_count = len(verified_detailed_data)
@@ -1105,6 +1357,65 @@ def get_filtered_opportunities(
         print(f"Error fetching opportunities: {str(e)}")
         raise
 
+def get_filtered_opportunities_rpc(
+    supabase: Client,
+    active: bool = True,
+    agencies: Optional[List[str]] = None,
+    date_due_start: Optional[datetime] = None,
+    date_due_end: Optional[datetime] = None,
+    date_posted_start: Optional[datetime] = None,
+    date_posted_end: Optional[datetime] = None,
+    naics_codes: Optional[List[str]] = None,
+    psc_codes: Optional[List[str]] = None,
+    set_asides: Optional[List[str]] = None,
+    page: int = 1,
+    page_size: int = 20
+) -> Dict[str, Any]:
+    """
+    Same as get_filtered_opportunities, but runs on the server in one round trip.
+
+    Calls the filtered_latest_notices Postgres function
+    (supabase/migrations/20261016120000_filtered_latest_notices.sql), which filters the
+    notices, keeps the latest notice of each solicitation and returns one page plus
+    the total count. Pages are ordered by response deadline, then notice_id. Agencies
+    select the notices at or under the organizations whose name contains them, as in
+    get_filtered_opportunities (20261016180000_filtered_latest_notices_organization_keys.sql).
+
+    Returns:
+        Dict containing count, data, page, page_size and total_pages, as get_filtered_opportunities.
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be positive")
+
+    params = {
+        "p_active": active,
+        "p_agencies": agencies or None,
+        "p_due_start": date_due_start.isoformat() if date_due_start else None,
+        "p_due_end": date_due_end.isoformat() if date_due_end else None,
+        "p_posted_start": date_posted_start.isoformat() if date_posted_start else None,
+        "p_posted_end": date_posted_end.isoformat() if date_posted_end else None,
+        "p_naics": naics_codes or None,
+        "p_psc": psc_codes or None,
+        "p_set_asides": set_asides or None,
+        "p_limit": page_size,
+        "p_offset": (page - 1) * page_size
+    }
+
+    try:
+        result = supabase.rpc("filtered_latest_notices", params).execute()
+    except Exception as e:
+        print(f"Error fetching opportunities: {str(e)}")
+        raise
+
+    total_count = result.data["count"]
+    return {
+        "count": total_count,
+        "data": result.data["data"],
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total_count + page_size - 1) // page_size
+    }
+
 def get_all_filtered_opportunities(
     supabase: Client,
     active: bool = True,
@@ -1117,15 +1428,26 @@ def get_all_filtered_opportunities(
     psc_codes: Optional[List[str]] = None,
     set_asides: Optional[List[str]] = None,
     page_size: int = 100,
-    max_pages: Optional[int] = None
+    max_pages: Optional[int] = None,
+    use_rpc: bool = False
 ) -> Dict[str, Any]:
     """
     Get all pages of filtered opportunities from the Notices table.
 
     Args:
-        ... (same as get_filtered_opportunities) ...
+        supabase (Client): Initialized Supabase client
+        active (bool): If True, only return opportunities with future response deadlines
+        agencies (List[str], optional): List of agency names to filter by
+        date_due_start (datetime, optional): Start of due date range
+        date_due_end (datetime, optional): End of due date range
+        date_posted_start (datetime, optional): Start of posted date range
+        date_posted_end (datetime, optional): End of posted date range
+        naics_codes (List[str], optional): List of NAICS codes to filter by
+        psc_codes (List[str], optional): List of PSC codes to filter by
+        set_asides (List[str], optional): List of set-aside types to filter by
         page_size (int): Number of records per page (default 100)
         max_pages (Optional[int]): Maximum number of pages to fetch (None for all)
+        use_rpc (bool): Fetch each page with get_filtered_opportunities_rpc (one round trip per page)
 
     Returns:
         Dict containing:
@@ -1134,8 +1456,10 @@ def get_all_filtered_opportunities(
             - pages_retrieved: Number of pages retrieved
             - total_pages: Total number of available pages
     """
+    fetch_page = get_filtered_opportunities_rpc if use_rpc else get_filtered_opportunities
+
     # Get first page and total count
-    first_page = get_filtered_opportunities(
+    first_page = fetch_page(
         supabase=supabase,
         active=active,
         agencies=agencies,
@@ -1161,7 +1485,7 @@ def get_all_filtered_opportunities(
     for page in range(2, pages_to_fetch + 1):
         print(f"Fetching page {page} of {pages_to_fetch}...")
 
-        page_data = get_filtered_opportunities(
+        page_data = fetch_page(
             supabase=supabase,
             active=active,
             agencies=agencies,
@@ -1204,7 +1528,8 @@ def main():
         naics_codes=naics_codes,
         psc_codes=psc_codes,
         page_size=100,  # 100 records per page
-        max_pages=None  # Get all pages
+        max_pages=None,  # Get all pages
+        use_rpc=True
     )
 
     print(json.dumps(opportunities['data'], indent=2))
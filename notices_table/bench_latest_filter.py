@@ -0,0 +1,87 @@
+"""
+Micro-benchmark of the in-Python filter stage of get_filtered_opportunities.
+
+Compares the list-based NAICS/PSC verification and latest-notice selection it used to
+do against the set-based filter_notices_by_codes / select_latest_notice_ids. The real
+notices in results/*.json are replicated with fresh notice IDs up to the target size.
+
+Usage:
+    python bench_latest_filter.py [number_of_notices]
+"""
+import glob
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+from Nyle_testing import filter_notices_by_codes, select_latest_notice_ids
+
+RESULTS_GLOB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "*.json")
+DEFAULT_NOTICES = 20000
+
+
+def load_notices(target: int) -> List[Dict[str, Any]]:
+    base = []
+    for path in sorted(glob.glob(RESULTS_GLOB)):
+        with open(path, "r") as f:
+            base.extend(json.load(f))
+    if not base:
+        raise ValueError(f"No notices found in {RESULTS_GLOB}")
+
+    notices = []
+    while len(notices) < target:
+        for notice in base[:target - len(notices)]:
+            copy = dict(notice)
+            copy["notice_id"] = f"{len(notices):032x}"
+            copy["solicitation_id"] = f"sol-{len(notices) // 2}"
+            notices.append(copy)
+    return notices
+
+
+def list_based(notices, latest_notice_ids, naics_codes, psc_codes) -> List[str]:
+    """The previous implementation: membership tests against lists."""
+    latest_notice_ids = list(latest_notice_ids)
+    verified = []
+    for notice in notices:
+        naics_match = not naics_codes or (notice.get("naics") in naics_codes)
+        psc_match = not psc_codes or (notice.get("psc") in psc_codes)
+        if naics_match and psc_match:
+            verified.append(notice)
+    return [notice["notice_id"] for notice in verified if notice["notice_id"] in latest_notice_ids]
+
+
+def set_based(notices, latest_notice_ids, naics_codes, psc_codes) -> List[str]:
+    verified = filter_notices_by_codes(notices, naics_codes, psc_codes)
+    return select_latest_notice_ids(verified, set(latest_notice_ids))
+
+
+def timed(function, *args) -> tuple:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NOTICES
+    notices = load_notices(target)
+
+    # The codes present in the data plus unrelated ones, as a long user filter would be.
+    naics_codes = sorted({n["naics"] for n in notices if n.get("naics")}) + [f"9{i:05d}" for i in range(50)]
+    psc_codes = sorted({n["psc"] for n in notices if n.get("psc")}) + [f"Z{i:03d}" for i in range(50)]
+    # Every second notice is the latest of its solicitation.
+    latest_notice_ids = [n["notice_id"] for i, n in enumerate(notices) if i % 2]
+
+    print(f"{len(notices)} notices, {len(latest_notice_ids)} latest IDs, "
+          f"{len(naics_codes)} NAICS codes, {len(psc_codes)} PSC codes")
+    list_seconds, list_result = timed(list_based, notices, latest_notice_ids, naics_codes, psc_codes)
+    set_seconds, set_result = timed(set_based, notices, latest_notice_ids, naics_codes, psc_codes)
+    if list_result != set_result:
+        raise AssertionError("Set-based filter returned different notices")
+
+    print(f"list-based: {list_seconds:.3f}s")
+    print(f"set-based:  {set_seconds:.3f}s ({list_seconds / max(set_seconds, 1e-9):.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,72 @@
 import os
 import re
+import sys
 import json
 from typing import List, Dict, Optional
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime, timezone
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from columnar_store import write_parquet
+from fulltext_search import FULLTEXT_COLUMNS, FULLTEXT_CONFIG
+from keyword_compiler import compile_keyword_query
+from organization_hierarchy import ANCESTOR_KEYS_PARAM, NOTICES_UNDER_ORGANIZATIONS
+from partitioned_scan import apply_bounds, scan_partitions, split_hex_keys
+from projection import build_select
+from query_compiler import FilterSpec, compile_plan
+from reference_data import warn_unknown_codes
+
+
+@dataclass
+class NoticesQuery:
+    active: bool = True
+    include_naics: Optional[List[str]] = None
+    exclude_naics: Optional[List[str]] = None
+    include_solicitation_types: Optional[List[str]] = None
+    exclude_solicitation_types: Optional[List[str]] = None
+    include_psc: Optional[List[str]] = None
+    exclude_psc: Optional[List[str]] = None
+    include_set_aside_ids: Optional[List[str]] = None
+    exclude_set_aside_ids: Optional[List[str]] = None
+    include_organization_keys: Optional[List[str]] = None
+    exclude_organization_keys: Optional[List[str]] = None
+    keyword_query: Optional[str] = None
+
+
+def _current_time(active: bool) -> str:
+    current_time = datetime.now(timezone.utc).isoformat()
+    print("Current time:", current_time)
+    return current_time
+
+
+def _to_int_keys(values: List[str]) -> List[int]:
+    # set_aside_id and organization_key are int8 columns.
+    return [int(x) for x in values]
+
+
+# How each NoticesQuery field filters the notices table.
+NOTICES_FILTER_SPECS = (
+    # Only the latest notice of each solicitation, with a future response deadline.
+    FilterSpec("active", "latest", "eq", resolve=lambda active: True),
+    FilterSpec("active", "solicitation_response_deadline", "gt", resolve=_current_time),
+    FilterSpec("include_naics", "naics", "in"),
+    FilterSpec("exclude_naics", "naics", "not_in"),
+    FilterSpec("include_solicitation_types", "type", "in"),
+    FilterSpec("exclude_solicitation_types", "type", "not_in"),
+    FilterSpec("include_psc", "psc", "in"),
+    FilterSpec("exclude_psc", "psc", "not_in"),
+    FilterSpec("include_set_aside_ids", "set_aside_id", "in", resolve=_to_int_keys),
+    FilterSpec("exclude_set_aside_ids", "set_aside_id", "not_in", resolve=_to_int_keys),
+    # Notices at or under the organizations, joined through organization_closure in Postgres.
+    FilterSpec("include_organization_keys", (NOTICES_UNDER_ORGANIZATIONS, ANCESTOR_KEYS_PARAM), "rpc",
+               resolve=_to_int_keys),
+    FilterSpec("exclude_organization_keys", "organization_key", "not_in", resolve=_to_int_keys),
+    FilterSpec("keyword_query", FULLTEXT_COLUMNS["notices"][0], "text_search", resolve=compile_keyword_query,
+               options=(("config", FULLTEXT_CONFIG),))
+)
+
 
 def get_filtered_notices(
     supabase: Client,
@@ -19,119 +81,83 @@ def get_filtered_notices(
     exclude_set_aside_ids: Optional[List[str]] = None,  # new filter: exclude by set_aside_id
     include_organization_keys: Optional[List[str]] = None,  # new filter: include by organization_key (int8)
     exclude_organization_keys: Optional[List[str]] = None,
-    keyword_query: Optional[str] = None
+    keyword_query: Optional[str] = None,
+    partitions: int = 1,
+    max_workers: Optional[int] = None,
+    projection: Optional[str] = None,
+    fields: Optional[List[str]] = None
 ) -> List[Dict[str, any]]:
     """
     Retrieve rows from the 'notices' table applying the provided filters and paginating through all the available data.
+
+    The filters are compiled once into a QueryPlan following NOTICES_FILTER_SPECS, then
+    applied to every page. The plan is not cached: the active filter depends on the current time.
+
+    With partitions > 1 the notice_id key space is split into that many ranges, which are
+    paged through concurrently and merged back in notice_id order.
+
+    projection names a profile of common/projection.py (summary, detail, export) and fields
+    lists extra columns or embedded relations; by default every column and relation is
+    selected. notice_id and solicitation_id are always included.
     """
-    all_notices = []
     limit = 1000  # Batch size for pagination.
-    offset = 0
-    
+    select = build_select("notices", projection, fields)
+
+    # Catch typos in code filters before they silently empty the result.
+    warn_unknown_codes(supabase, "naics", include_naics, "Included NAICS codes")
+    warn_unknown_codes(supabase, "psc", include_psc, "Included PSC codes")
+    warn_unknown_codes(supabase, "solicitation_types", include_solicitation_types, "Included solicitation types")
 
-    while True:
-        print("offset: ", offset)
-        # Build the base query with embedded joins.
-        query = supabase.from_("notices").select("""
-            *,
-            naics_details:naics!naics_id(*),
-            psc_details:psc!psc_id(*),
-            setasides_details:setasides!set_aside_id(*),
-            solicitations_details:solicitations!solicitation_id(*),
-            addresses_details:addresses!organization_address_key(*),
-            organization_details:organizations!Notices_organization_key_fkey(*),
-            organization_level_1_details:organizations!Notices_organization_level_1_key_fkey(*),
-            organization_level_2_details:organizations!Notices_organization_level_2_key_fkey(*),
-            organization_level_3_details:organizations!Notices_organization_level_3_key_fkey(*),
-            organization_level_4_details:organizations!Notices_organization_level_4_key_fkey(*),
-            organization_level_5_details:organizations!Notices_organization_level_5_key_fkey(*),
-            organization_level_6_details:organizations!Notices_organization_level_6_key_fkey(*),
-            organization_level_7_details:organizations!Notices_organization_level_7_key_fkey(*),
-            solicitation_type_details:solicitation_types!type(*)
-        """)
-
-        if active:
-            print("Applying active filter")
-            query = query.eq("latest", True)
-            current_time = datetime.now(timezone.utc).isoformat()
-            print("Current time:", current_time)
-            # Only include notices with a future solicitation_response_deadline.
-            query = query.gt("solicitation_response_deadline", current_time)
-
-        if include_naics:
-            print("Including NAICS codes:", include_naics)
-            query = query.in_("naics", include_naics)
-        if exclude_naics:
-            for code in exclude_naics:
-                query = query.neq("naics", code)
-
-        if include_solicitation_types:
-            query = query.in_("type", include_solicitation_types)
-        if exclude_solicitation_types:
-            print("Excluding solicitation types:", exclude_solicitation_types)
-            for s_type in exclude_solicitation_types:
-                query = query.neq("type", s_type)
-
-        if include_psc:
-            query = query.in_("psc", include_psc)
-        if exclude_psc:
-            for psc in exclude_psc:
-                query = query.neq("psc", psc)
-
-        if include_set_aside_ids:
-            # Convert set_aside_ids to integers for matching database type.
-            include_set_aside_ids = [int(x) for x in include_set_aside_ids]
-            print("Including set_aside_ids:", include_set_aside_ids)
-            query = query.in_("set_aside_id", include_set_aside_ids)
-        if exclude_set_aside_ids:
-            # Convert set_aside_ids to integers for matching database type.
-            exclude_set_aside_ids = [int(x) for x in exclude_set_aside_ids]
-            print("Excluding set_aside_ids:", exclude_set_aside_ids)
-            for set_aside_id in exclude_set_aside_ids:
-                query = query.neq("set_aside_id", set_aside_id)
-
-        if include_organization_keys:
-            # Convert organization_keys to integers for matching database type.
-            include_organization_keys = [int(x) for x in include_organization_keys]
-            print("Including organization keys across multiple columns:", include_organization_keys)
-            conditions = []
-            for key in include_organization_keys:
-                conditions.append(f"organization_key.eq.{key}")
-                conditions.append(f"organization_level_1_key.eq.{key}")
-                conditions.append(f"organization_level_2_key.eq.{key}")
-                conditions.append(f"organization_level_3_key.eq.{key}")
-                conditions.append(f"organization_level_4_key.eq.{key}")
-                conditions.append(f"organization_level_5_key.eq.{key}")
-                conditions.append(f"organization_level_6_key.eq.{key}")
-                conditions.append(f"organization_level_7_key.eq.{key}")
-            or_filter = ",".join(conditions)
-            query = query.or_(or_filter)
-
-        if exclude_organization_keys:
-            # Convert organization_keys to integers for matching database type.
-            exclude_organization_keys = [int(x) for x in exclude_organization_keys]
-            print("Excluding organization_keys:", exclude_organization_keys)
-            for org_key in exclude_organization_keys:
-                query = query.neq("organization_key", org_key)
-
-        query = query.range(offset, offset + limit - 1)
-        
-        if keyword_query:
-            print("Applying keyword search filter:", keyword_query)
-            # Use full-text search on the "opportunity_text" field.
-            query = query.text_search("opportunity_text", keyword_query, {'config': 'english', 'type': 'websearch'})
-            
-        result = query.execute()
-        
-        # Exit loop if no more data is returned.
-        if not result.data:
-            break
-        
-
-        all_notices.extend(result.data)
-        offset += limit
-
-    return all_notices
+    nq = NoticesQuery(
+        active=active,
+        include_naics=include_naics,
+        exclude_naics=exclude_naics,
+        include_solicitation_types=include_solicitation_types,
+        exclude_solicitation_types=exclude_solicitation_types,
+        include_psc=include_psc,
+        exclude_psc=exclude_psc,
+        include_set_aside_ids=include_set_aside_ids,
+        exclude_set_aside_ids=exclude_set_aside_ids,
+        include_organization_keys=include_organization_keys,
+        exclude_organization_keys=exclude_organization_keys,
+        keyword_query=keyword_query
+    )
+    plan = compile_plan(NOTICES_FILTER_SPECS, nq, supabase)
+    if plan.matches_nothing:
+        return []
+
+    # Keyset pagination on notice_id within each partition.
+    def fetch_partition(partition) -> List[Dict[str, any]]:
+        notices = []
+        last_notice_id = None
+        while True:
+            query = plan.query(supabase, "notices", select)
+            query = apply_bounds(query, "notice_id", partition)
+            if last_notice_id is not None:
+                query = query.gt("notice_id", last_notice_id)
+
+            query = query.order("notice_id").limit(limit)
+
+            # Full-text search on "opportunity_text" must come last: text_search returns a
+            # builder that takes no further filters.
+            query = plan.apply_text_search(query)
+
+            result = query.execute()
+
+            # Exit loop if no more data is returned.
+            if not result.data:
+                break
+            notices.extend(result.data)
+            if len(result.data) < limit:
+                break
+            last_notice_id = result.data[-1]["notice_id"]
+        return notices
+
+    # notice_id is a hex string, so its key space splits evenly on hex prefixes.
+    key_partitions = split_hex_keys(partitions)
+    if len(key_partitions) > 1:
+        print(f"Scanning {len(key_partitions)} notice_id partitions concurrently")
+    return scan_partitions(fetch_partition, key_partitions, max_workers)
 
 def main():
     load_dotenv()
@@ -167,10 +193,8 @@ def main():
     exclude_set_aside_ids = [16, 24, 17, 18, 19, 20, 22, 21, 23]  # example set_aside_id values to exclude
 
     # filters for organization keys (int8).
-    # Filter for organization keys across multiple columns. 
-    # When a key is provided, notices with that key in any of the following columns will be returned:
-    # organization_key, organization_level_1_key, organization_level_2_key, organization_level_3_key,
-    # organization_level_4_key, organization_level_5_key, organization_level_6_key, organization_level_7_key.
+    # When a key is provided, notices of that organization or of any organization under it
+    # (looked up in the organization_closure table) will be returned.
     
     include_organization_keys = [300000201]  # example organization keys to include (int8)
     exclude_organization_keys = []  # example organization keys to exclude (int8)
@@ -193,13 +217,20 @@ def main():
         exclude_set_aside_ids=exclude_set_aside_ids,
         include_organization_keys=include_organization_keys,
         exclude_organization_keys=exclude_organization_keys,
-        keyword_query=keyword_query
+        keyword_query=keyword_query,
+        partitions=4
     )
 
     print("Number of results:", len(notices))
+    # Compact JSON is kept for results_compre_Lawrence.py.
     with open("wnzTPS5NfNK5vVqRhbQ9i_results.json", "w") as f:
-        json.dump(notices, f, indent=2, default=str)
-    print("Saved results to wnzTPS5NfNK5vVqRhbQ9i_result.json file")
+        json.dump(notices, f, separators=(",", ":"), default=str)
+    print("Saved results to wnzTPS5NfNK5vVqRhbQ9i_results.json")
+    try:
+        write_parquet(notices, "wnzTPS5NfNK5vVqRhbQ9i_results.parquet", "notices")
+        print("Saved results to wnzTPS5NfNK5vVqRhbQ9i_results.parquet")
+    except ImportError as e:
+        print(f"WARNING: {e}; skipping Parquet output")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
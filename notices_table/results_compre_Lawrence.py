@@ -1,68 +1,215 @@
 import csv
 import json
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-def load_csv_opportunities(filepath):
+CHUNK_SIZE = 64 * 1024
+
+def iter_json_array(filepath: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array file one at a time, reading it in chunks,
+    so only the current element is held in memory.
+    """
+    decoder = json.JSONDecoder()
+    with open(filepath, "r", encoding="utf-8") as f:
+        buffer = ""
+        while not buffer:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer = chunk.lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{filepath} does not hold a JSON array")
+        pos = 1
+        eof = False
+        # What may come next: "first" (an element or "]"), "separator" ("," or "]") or
+        # "element" (after a comma).
+        expected = "first"
+        while True:
+            # Skip whitespace, reading more input when the buffer runs out.
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    break
+                buffer, pos = f.read(chunk_size), 0
+                eof = not buffer
+            if pos >= len(buffer):
+                raise ValueError(f"{filepath} ends before the JSON array is closed")
+            char = buffer[pos]
+            if char == "]" and expected != "element":
+                # Like json.load, accept nothing but whitespace after the array.
+                trailing = buffer[pos + 1:]
+                while not trailing.strip():
+                    trailing = f.read(chunk_size)
+                    if not trailing:
+                        return
+                raise ValueError(f"{filepath} holds invalid JSON: data after the closing ']'")
+            if char == "," and expected == "separator":
+                pos += 1
+                expected = "element"
+                continue
+            if expected == "separator" or char in ",]":
+                raise ValueError(f"{filepath} holds invalid JSON: unexpected {char!r} in the array")
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise ValueError(f"{filepath} holds invalid JSON: {e}") from e
+                element, end = None, None
+            # An element not followed by a separator may be cut short (a chunk ending in "[2."
+            # decodes as 2): read more and decode again. Reading at least as much as is
+            # buffered keeps elements spanning many chunks from being decoded once per chunk.
+            if end is None or (not eof and (end == len(buffer) or buffer[end] not in " \t\r\n,]")):
+                chunk = f.read(max(chunk_size, len(buffer) - pos))
+                eof = not chunk
+                # Consumed input is only dropped here, when the buffer is refilled anyway.
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            yield element
+            pos = end
+            expected = "separator"
+
+def iter_json_records(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a results file one at a time: JSON Lines for .jsonl files,
+    otherwise a JSON array, or a HigherGov response wrapping it in "results".
+    """
+    if filepath.endswith(".jsonl"):
+        with open(filepath, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    with open(filepath, "r", encoding="utf-8") as f:
+        first = f.read(CHUNK_SIZE).lstrip()[:1]
+    if first == "{":
+        # A single response object: it has to be loaded whole.
+        with open(filepath, "r", encoding="utf-8") as f:
+            yield from json.load(f).get("results", [])
+        return
+    yield from iter_json_array(filepath)
+
+def write_jsonl(records: Iterable[Dict[str, Any]], filepath: str) -> int:
     """
-    Load the contract opportunity CSV file and extract opportunity identifiers.
-    Each opportunity is represented as a set containing:
-      - source_id
-      - source_id_version
-    Returns a list of sets.
+    Write records as JSON Lines, one record per line.
+    Returns the number of records written.
+    """
+    count = 0
+    with open(filepath, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":"), default=str))
+            f.write("\n")
+            count += 1
+    return count
+
+def iter_csv_opportunities(filepath):
+    """
+    Stream the contract opportunity CSV file and yield the identifiers of each opportunity.
+    Each opportunity is represented as a dict mapping each identifier to the column it came from:
+      - Solicitation ID
+      - Solicitation Title
+      - Notice ID
     """
-    opportunities = []
     with open(filepath, newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             #print(row)
-            ids = set()
+            ids = {}
             # Check and add identifier fields if present and non-empty.
             if 'Solicitation ID' in row and row['Solicitation ID']:
-                ids.add(row['Solicitation ID'])
+                ids.setdefault(row['Solicitation ID'], 'Solicitation ID')
             if 'Solicitation Title' in row and row['Solicitation Title']:
-                ids.add(row['Solicitation Title'])
+                ids.setdefault(row['Solicitation Title'], 'Solicitation Title')
             if '\ufeffNotice ID' in row and row['\ufeffNotice ID']:
                 #print("catch")
-                ids.add(row['\ufeffNotice ID'])
-            opportunities.append(ids)
-    return opportunities
+                ids.setdefault(row['\ufeffNotice ID'], 'Notice ID')
+            yield ids
 
-def load_results_opportunities(filepath):
+def load_csv_opportunities(filepath):
+    """
+    Load the identifiers of every opportunity of the contract opportunity CSV file.
+    Returns a list of dicts (see iter_csv_opportunities).
+    """
+    return list(iter_csv_opportunities(filepath))
+
+def iter_results_opportunities(filepath):
     """
-    Load the supabase JSON file and extract opportunity identifiers.
-    Each opportunity is represented as a set containing:
+    Stream the supabase results file (JSON array or JSON Lines) and yield the identifiers of each opportunity.
+    Each opportunity is represented as a dict mapping each identifier to the field it came from:
       - solicitation_id (if it exists)
       - notice_id (if it exists)
+      - title (if it exists)
       - solicitationNumber from any history records (if available)
-    Returns a list of sets.
+    Full records are discarded as soon as their identifiers are extracted.
     """
-    with open(filepath, "r") as f:
-        data = json.load(f)
-    opportunities = []
-    for record in data:
-        ids = set()
+    for record in iter_json_records(filepath):
+        ids = {}
         if "solicitation_id" in record and record["solicitation_id"]:
-            ids.add(record["solicitation_id"])
+            ids.setdefault(record["solicitation_id"], "solicitation_id")
         if "notice_id" in record and record["notice_id"]:
-            ids.add(record["notice_id"])
+            ids.setdefault(record["notice_id"], "notice_id")
         if "title" in record and record["title"]:
-            ids.add(record["title"])
+            ids.setdefault(record["title"], "title")
         if "history" in record:
-            for hist in record["history"]:
+            for hist in record["history"] or []:
                 if "solicitationNumber" in hist and hist["solicitationNumber"]:
-                    ids.add(hist["solicitationNumber"])
-        opportunities.append(ids)
-    return opportunities
+                    ids.setdefault(hist["solicitationNumber"], "history.solicitationNumber")
+        yield ids
+
+def load_results_opportunities(filepath):
+    """
+    Load the identifiers of every opportunity of the supabase results file.
+    Returns a list of dicts (see iter_results_opportunities).
+    """
+    return list(iter_results_opportunities(filepath))
+
+def build_index(opportunities: Iterable[Dict[str, str]]) -> Dict[str, List[int]]:
+    """
+    Build an inverted index from identifier to the positions of the opportunities carrying it.
+    """
+    index = {}
+    for position, opportunity in enumerate(opportunities):
+        for identifier in opportunity:
+            index.setdefault(identifier, []).append(position)
+    return index
 
-def find_match(opportunity, other_opportunities):
+def find_match(opportunity: Dict[str, str], index: Dict[str, List[int]]) -> Optional[Tuple[str, int]]:
     """
-    Given a set representing an opportunity, check if there is any opportunity in other_opportunities
-    that has a non-empty intersection with it.
-    If so, the opportunity is considered to have a match.
+    Given an opportunity, look its identifiers up in the index of the other file.
+    Returns the identifier that matched and the position of the first opportunity carrying it,
+    or None if no identifier is shared.
     """
-    for other in other_opportunities:
-        if opportunity.intersection(other):
-            return True
-    return False
+    for identifier in opportunity:
+        positions = index.get(identifier)
+        if positions:
+            return identifier, positions[0]
+    return None
+
+def reconcile(left: List[Dict[str, str]], right: List[Dict[str, str]]) -> Dict[str, list]:
+    """
+    Match two lists of opportunities in both directions in time linear in their size.
+
+    Returns a dict with:
+      - matches: (left position, right position, identifier, left field, right field) for every matched left opportunity
+      - unmatched_left: left opportunities sharing no identifier with the right
+      - unmatched_right: right opportunities sharing no identifier with the left
+    """
+    right_index = build_index(right)
+    left_index = build_index(left)
+
+    matches = []
+    unmatched_left = []
+    for position, opportunity in enumerate(left):
+        match = find_match(opportunity, right_index)
+        if match is None:
+            unmatched_left.append(opportunity)
+            continue
+        identifier, right_position = match
+        matches.append((position, right_position, identifier, opportunity[identifier], right[right_position][identifier]))
+
+    unmatched_right = [op for op in right if find_match(op, left_index) is None]
+    return {"matches": matches, "unmatched_left": unmatched_left, "unmatched_right": unmatched_right}
 
 def main():
     csv_file = "contract_opportunity-03-17-25-18-48-13.csv"
@@ -73,11 +220,12 @@ def main():
     results_ops = load_results_opportunities(results_file)
     #print("CSV opportunities:", csv_ops)
     
-    # Determine mismatches by checking each opportunity against the other file.
-    mismatch_records_csv = [op for op in csv_ops if not find_match(op, results_ops)]
+    # Determine mismatches by looking each opportunity up in the index of the other file.
+    reconciliation = reconcile(csv_ops, results_ops)
+    mismatch_records_csv = reconciliation["unmatched_left"]
     mismatches_csv = len(mismatch_records_csv)
     
-    mismatch_records_results = [op for op in results_ops if not find_match(op, csv_ops)]
+    mismatch_records_results = reconciliation["unmatched_right"]
     mismatches_results = len(mismatch_records_results)
     
     total_mismatches = mismatches_csv + mismatches_results
@@ -88,6 +236,12 @@ def main():
     print("Opportunities in highergov CSV with no match in supabase:", mismatches_csv)
     print("Opportunities in supabase with no match in highergov CSV:", mismatches_results)
     print("Total mismatches:", total_mismatches)
+
+    # Print which identifiers produced the matches
+    print("\nMatches by identifier (CSV column -> supabase field):")
+    match_fields = Counter((csv_field, results_field) for _, _, _, csv_field, results_field in reconciliation["matches"])
+    for (csv_field, results_field), count in match_fields.most_common():
+        print(f"  {csv_field} -> {results_field}: {count}")
     
     # Print out the mismatch details
     print("\nDetailed Mismatches:")
@@ -100,4 +254,4 @@ def main():
         print(op)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
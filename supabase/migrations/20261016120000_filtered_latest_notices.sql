@@ -0,0 +1,101 @@
+-- Filter notices, keep only the latest notice of each solicitation and return one page
+-- of it with the total count, in a single round trip:
+--
+--   supabase.rpc("filtered_latest_notices", {"p_naics": [...], "p_limit": 20, "p_offset": 0})
+--
+-- Returns {"count": <matching notices>, "data": [<notice with embedded details>, ...]}.
+-- Pages are ordered by solicitation_response_deadline, then notice_id.
+
+create index if not exists solicitations_latest_notice_id_idx
+    on public.solicitations (latest_notice_id);
+
+create or replace function public.filtered_latest_notices(
+    p_active boolean default true,
+    p_agencies text[] default null,
+    p_due_start timestamptz default null,
+    p_due_end timestamptz default null,
+    p_posted_start timestamptz default null,
+    p_posted_end timestamptz default null,
+    p_naics text[] default null,
+    p_psc text[] default null,
+    p_set_asides text[] default null,
+    p_limit integer default 20,
+    p_offset integer default 0
+)
+returns jsonb
+language sql
+stable
+as $$
+    with matched as (
+        select n.*
+        from public.notices n
+        join public.solicitations s
+          on s.solicitation_id = n.solicitation_id
+         and s.latest_notice_id = n.notice_id
+        where n.type in ('o', 'p', 'k', 'r', 'i')
+          and (not p_active or n.solicitation_response_deadline > now())
+          and (p_due_start is null or n.solicitation_response_deadline >= p_due_start)
+          and (p_due_end is null or n.solicitation_response_deadline <= p_due_end)
+          and (p_posted_start is null or n.posted_date >= p_posted_start)
+          and (p_posted_end is null or n.posted_date <= p_posted_end)
+          and (p_naics is null or n.naics = any(p_naics))
+          and (p_psc is null or n.psc = any(p_psc))
+          and (p_set_asides is null or n.solicitation_set_aside = any(p_set_asides))
+          and (p_agencies is null or exists (
+                select 1
+                from unnest(p_agencies) as agency
+                where n.organization_level_1_name ilike '%' || agency || '%'
+                   or n.organization_level_2_name ilike '%' || agency || '%'
+                   or n.organization_level_3_name ilike '%' || agency || '%'
+                   or n.organization_level_4_name ilike '%' || agency || '%'
+                   or n.organization_level_5_name ilike '%' || agency || '%'
+                   or n.organization_level_6_name ilike '%' || agency || '%'
+                   or n.organization_level_7_name ilike '%' || agency || '%'
+          ))
+    ),
+    page as (
+        select m.*
+        from matched m
+        order by m.solicitation_response_deadline, m.notice_id
+        limit p_limit
+        offset p_offset
+    )
+    select jsonb_build_object(
+        'count', (select count(*) from matched),
+        'data', coalesce((
+            select jsonb_agg(
+                to_jsonb(p) || jsonb_build_object(
+                    'naics_details', (
+                        select jsonb_build_object(
+                            'naics_id', x.naics_id, 'naics_code', x.naics_code,
+                            'naics_title', x.naics_title, 'naics_size', x.naics_size)
+                        from public.naics x where x.naics_id = p.naics_id),
+                    'psc_details', (
+                        select jsonb_build_object(
+                            'psc_id', x.psc_id, 'psc_code', x.psc_code,
+                            'psc_name', x.psc_name, 'psc_full_name', x.psc_full_name)
+                        from public.psc x where x.psc_id = p.psc_id),
+                    'set_aside_details', (
+                        select jsonb_build_object(
+                            'set_aside_id', x.set_aside_id, 'set_aside_code', x.set_aside_code,
+                            'set_aside_name', x.set_aside_name)
+                        from public.setasides x where x.set_aside_id = p.set_aside_id),
+                    'organization', (
+                        select jsonb_build_object(
+                            'organization_key', x.organization_key, 'name', x.name, 'type', x.type,
+                            'full_parent_path', x.full_parent_path,
+                            'full_parent_path_name', x.full_parent_path_name)
+                        from public.organizations x where x.organization_key = p.organization_key),
+                    'organization_address', (
+                        select jsonb_build_object(
+                            'address_key', x.address_key, 'street_address', x.street_address,
+                            'street_address_2', x.street_address_2, 'city', x.city, 'state', x.state,
+                            'zipcode', x.zipcode, 'country_code', x.country_code)
+                        from public.addresses x where x.address_key = p.organization_address_key)
+                )
+                order by p.solicitation_response_deadline, p.notice_id
+            )
+            from page p
+        ), '[]'::jsonb)
+    );
+$$;
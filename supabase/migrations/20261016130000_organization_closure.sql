@@ -0,0 +1,58 @@
+-- Ancestor closure of the organization hierarchy: one row per (ancestor, descendant)
+-- pair, including each organization as its own ancestor at depth 0.
+--
+-- "Notices under organization X" becomes
+--   notices.organization_key in (select descendant_key from organization_closure where ancestor_key = X)
+-- which is two index lookups instead of an OR across organization_level_1..7_key.
+--
+-- Built from organizations.full_parent_path, the dot-separated keys from the
+-- department down to the organization itself. Re-run refresh_organization_closure()
+-- after loading organizations.
+
+create table if not exists public.organization_closure (
+    ancestor_key bigint not null,
+    descendant_key bigint not null,
+    depth integer not null,
+    primary key (ancestor_key, descendant_key)
+);
+
+create index if not exists organization_closure_descendant_key_idx
+    on public.organization_closure (descendant_key);
+
+create index if not exists notices_organization_key_idx
+    on public.notices (organization_key);
+
+create or replace function public.refresh_organization_closure()
+returns bigint
+language plpgsql
+as $$
+declare
+    inserted bigint;
+begin
+    delete from public.organization_closure;
+
+    insert into public.organization_closure (ancestor_key, descendant_key, depth)
+    select distinct on (path.ancestor_key, o.organization_key)
+        path.ancestor_key,
+        o.organization_key,
+        path.depth
+    from public.organizations o
+    cross join lateral (
+        select
+            part::bigint as ancestor_key,
+            cardinality(string_to_array(o.full_parent_path, '.')) - part_index as depth
+        from unnest(string_to_array(o.full_parent_path, '.')) with ordinality as p(part, part_index)
+        where part ~ '^[0-9]+$'
+        union all
+        -- Every organization is its own ancestor, even without a full_parent_path.
+        select o.organization_key, 0
+    ) as path
+    order by path.ancestor_key, o.organization_key, path.depth;
+
+    get diagnostics inserted = row_count;
+    analyze public.organization_closure;
+    return inserted;
+end;
+$$;
+
+select public.refresh_organization_closure();
@@ -0,0 +1,29 @@
+-- Saved keyword searches, compiled by common/keyword_compiler.py.
+--
+-- query_text is the compiled to_tsquery string sent to the fts filters; the generated
+-- query column parses it with the english configuration when the row is written, so a
+-- malformed query is rejected on save rather than on the first page of a search.
+
+create table if not exists public.keyword_searches (
+    name text primary key,
+    source_query text not null,
+    query_text text not null,
+    query tsquery generated always as (to_tsquery('english'::regconfig, query_text)) stored,
+    created_at timestamp with time zone not null default now(),
+    updated_at timestamp with time zone not null default now()
+);
+
+create or replace function public.keyword_searches_touch_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := now();
+    return new;
+end;
+$$;
+
+drop trigger if exists keyword_searches_touch_updated_at on public.keyword_searches;
+create trigger keyword_searches_touch_updated_at
+    before update on public.keyword_searches
+    for each row execute function public.keyword_searches_touch_updated_at();
@@ -0,0 +1,57 @@
+-- GIN indexes for the keyword filters on awards.description and notices.opportunity_text.
+--
+-- PostgREST turns `description=fts(english).<query>` into
+--   to_tsvector('english', description) @@ to_tsquery('english', <query>)
+-- so an index on exactly that expression serves it, without a stored tsvector column
+-- that `select=*` would send back with every row. The config here must match
+-- FULLTEXT_CONFIG in common/fulltext_search.py, or the planner cannot use the index.
+--
+-- Building the indexes on a live database: run the two create index statements on
+-- their own with `concurrently` added, since that cannot run inside a transaction.
+
+create index if not exists awards_description_fts_idx
+    on public.awards using gin (to_tsvector('english'::regconfig, description));
+
+create index if not exists notices_opportunity_text_fts_idx
+    on public.notices using gin (to_tsvector('english'::regconfig, opportunity_text));
+
+-- The plan of a keyword search as the filters send it, for checking that the index is used.
+create or replace function public.explain_keyword_search(p_table text, p_query text)
+returns setof text
+language plpgsql
+stable
+as $$
+declare
+    search_column text;
+    plan_line text;
+begin
+    search_column := case p_table
+        when 'awards' then 'description'
+        when 'notices' then 'opportunity_text'
+    end;
+    if search_column is null then
+        raise exception 'No full-text index for table %', p_table;
+    end if;
+
+    for plan_line in execute format(
+        'explain select * from public.%I where to_tsvector(%L, %I) @@ to_tsquery(%L, %L) limit 1000',
+        p_table, 'english', search_column, 'english', p_query
+    ) loop
+        return next plan_line;
+    end loop;
+end;
+$$;
+
+-- Refresh the planner statistics of the indexed expressions, e.g. after a bulk load.
+create or replace function public.refresh_fts_statistics()
+returns void
+language plpgsql
+as $$
+begin
+    analyze public.awards;
+    analyze public.notices;
+end;
+$$;
+
+analyze public.awards;
+analyze public.notices;
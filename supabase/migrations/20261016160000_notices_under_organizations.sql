@@ -0,0 +1,26 @@
+-- Select notices by organization hierarchy in Postgres instead of expanding the
+-- descendant keys on the client and sending them back as organization_key=in.(...).
+--
+--   supabase.rpc("notices_under_organizations", {"p_ancestor_keys": [300000201]})
+--       .select("*").gt("notice_id", ...).order("notice_id").limit(1000)
+--
+-- The function returns setof notices and is a plain SQL function, so Postgres inlines it
+-- and the PostgREST filters, ordering and limit apply as if querying the table. The keys
+-- are sent in the request body, so long lists do not lengthen the URL.
+
+create or replace function public.notices_under_organizations(p_ancestor_keys bigint[])
+returns setof public.notices
+language sql
+stable
+as $$
+    select n.*
+    from public.notices n
+    where n.organization_key in (
+        select c.descendant_key
+        from public.organization_closure c
+        where c.ancestor_key = any(p_ancestor_keys)
+    );
+$$;
+
+-- refresh_organization_closure() rebuilds the whole table; keep it off the API.
+revoke execute on function public.refresh_organization_closure() from public, anon, authenticated;
@@ -0,0 +1,32 @@
+-- Keep the full-text maintenance functions off the API: explain_keyword_search runs
+-- EXPLAIN and refresh_fts_statistics runs ANALYZE, neither of which anon or
+-- authenticated clients should be able to trigger. Call them with the service role.
+
+create or replace function public.explain_keyword_search(p_table text, p_query text)
+returns setof text
+language plpgsql
+stable
+as $$
+declare
+    search_column text;
+    plan_line text;
+begin
+    if p_table not in ('awards', 'notices') then
+        raise exception 'No full-text index for table %', p_table;
+    end if;
+    search_column := case p_table
+        when 'awards' then 'description'
+        when 'notices' then 'opportunity_text'
+    end;
+
+    for plan_line in execute format(
+        'explain select * from public.%I where to_tsvector(%L, %I) @@ to_tsquery(%L, %L) limit 1000',
+        p_table, 'english', search_column, 'english', p_query
+    ) loop
+        return next plan_line;
+    end loop;
+end;
+$$;
+
+revoke execute on function public.explain_keyword_search(text, text) from public, anon, authenticated;
+revoke execute on function public.refresh_fts_statistics() from public, anon, authenticated;
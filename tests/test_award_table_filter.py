@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "award_table"))
+
+pytest.importorskip("supabase")
+pytest.importorskip("dotenv")
+
+from award_table_filter import _keyset_condition
+
+
+def test_keyset_condition_selects_rows_after_the_key():
+    assert _keyset_condition(42, "W91CRB20C0001") == \
+        'usa_spending_id.gt.42,and(usa_spending_id.eq.42,piid.gt."W91CRB20C0001")'
+
+
+@pytest.mark.parametrize("piid, quoted", [
+    ("A,B(C).D", '"A,B(C).D"'),
+    ('A"B', '"A\\"B"'),
+    ("A\\B", '"A\\\\B"'),
+])
+def test_keyset_condition_quotes_reserved_characters_in_piid(piid, quoted):
+    assert _keyset_condition(7, piid) == f"usa_spending_id.gt.7,and(usa_spending_id.eq.7,piid.gt.{quoted})"
@@ -0,0 +1,24 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+
+from keyword_compiler import compile_keyword_query, reduce_phrases
+
+
+def test_duplicates_and_covered_phrases_are_dropped():
+    remaining, duplicates, covered = reduce_phrases(["Radar", "radar", "radar systems"])
+    assert remaining == ["radar"]
+    assert duplicates == 1
+    assert covered == 1
+
+
+def test_stopword_only_phrase_covers_nothing():
+    remaining, duplicates, covered = reduce_phrases(["research and development", "and"])
+    assert remaining == ["research and development", "and"]
+    assert covered == 0
+
+
+def test_compiled_query_keeps_phrase_containing_stopword_phrase():
+    compiled = compile_keyword_query("'Research and Development' | 'and'", verbose=False)
+    assert "'research and development'" in compiled
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+
+from projection import EMBEDS, KEY_COLUMNS, build_select, resolve_fields
+
+
+@pytest.mark.parametrize("table", ["awards", "notices"])
+@pytest.mark.parametrize("projection", ["summary", "export"])
+def test_key_columns_come_first(table, projection):
+    fields = resolve_fields(table, projection)
+    assert tuple(fields[:len(KEY_COLUMNS[table])]) == KEY_COLUMNS[table]
+    assert len(fields) == len(set(fields))
+
+
+def test_fields_alone_select_keys_and_fields():
+    assert resolve_fields("notices", fields=["title", "notice_id"]) == ["notice_id", "solicitation_id", "title"]
+
+
+def test_detail_is_the_default_and_keeps_only_star_and_embeds():
+    assert resolve_fields("awards") == ["*"]
+    assert resolve_fields("notices") == ["*"] + list(EMBEDS["notices"])
+
+
+def test_build_select_expands_embeds():
+    select = build_select("notices", "summary", ["naics_details"])
+    assert select.startswith("notice_id,solicitation_id,title,")
+    assert select.endswith(",naics_details:naics!naics_id(*)")
+
+
+def test_unknown_table_or_profile_raises():
+    with pytest.raises(ValueError):
+        resolve_fields("contracts")
+    with pytest.raises(ValueError):
+        resolve_fields("awards", "full")
@@ -0,0 +1,148 @@
+import os
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+
+import query_compiler
+from query_compiler import (
+    FilterCompiler, FilterSpec, apply_condition, clear_plan_cache, compile_plan, get_plan, query_key, unique_values
+)
+
+
+class RecordingQuery:
+    """Stands in for a PostgREST builder, recording the filters applied to it."""
+
+    def __init__(self, calls=None, negated=False):
+        self.calls = [] if calls is None else calls
+        self.negated = negated
+
+    @property
+    def not_(self):
+        return RecordingQuery(self.calls, negated=True)
+
+    def in_(self, column, values):
+        self.calls.append(("not_in" if self.negated else "in", column, tuple(values)))
+        return RecordingQuery(self.calls)
+
+    def or_(self, value):
+        self.calls.append(("or", value))
+        return self
+
+    def eq(self, column, value):
+        self.calls.append(("eq", column, value))
+        return self
+
+
+def test_unique_values_drops_duplicates_and_blanks():
+    assert unique_values(["a", None, " ", "b", "a", ""]) == ["a", "b"]
+    assert unique_values(None) == []
+
+
+def test_includes_on_a_column_are_intersected():
+    compiler = FilterCompiler().include("naics", ["1", "2", "3"]).include("naics", ["3", "2", "4"])
+    assert compiler.conditions() == [("in", "naics", ("2", "3"))]
+
+
+def test_excludes_on_a_column_are_unioned():
+    compiler = FilterCompiler().exclude("psc", ["R425", "R425"]).exclude("psc", ["R499", "R425"])
+    assert compiler.conditions() == [("not_in", "psc", ("R425", "R499"))]
+
+
+def test_exclusions_are_removed_from_the_include_list():
+    compiler = FilterCompiler().include("naics", ["541511", "541512"]).exclude("naics", ["541512"])
+    assert compiler.conditions() == [("in", "naics", ("541511",))]
+
+
+def test_include_emptied_by_exclusions_matches_nothing(capsys):
+    compiler = FilterCompiler().include("naics", ["541511"]).exclude("naics", ["541511"])
+    assert compiler.conditions() == [("in", "naics", ())]
+    assert "WARNING" in capsys.readouterr().out
+
+
+def test_empty_lists_add_nothing():
+    assert FilterCompiler().include("naics", []).exclude("psc", None).include_any(("a", "b"), []).conditions() == []
+
+
+def test_include_any_quotes_reserved_characters():
+    compiler = FilterCompiler().include_any(("recipient_uei", "parent_recipient_uei"), ["ABC", "A,B"])
+    assert compiler.conditions() == [
+        ("or", "recipient_uei,parent_recipient_uei", 'recipient_uei.in.(ABC,"A,B"),parent_recipient_uei.in.(ABC,"A,B")')
+    ]
+
+
+def test_compile_applies_one_filter_per_column():
+    compiler = FilterCompiler().include("naics", ["1", "2"]).exclude("naics", ["2"]).exclude("psc", ["X"])
+    query = RecordingQuery()
+    for apply in compiler.compile():
+        query = apply(query)
+    assert query.calls == [("in", "naics", ("1",)), ("not_in", "psc", ("X",))]
+
+
+def test_apply_condition_comparison():
+    query = apply_condition(RecordingQuery(), ("eq", "latest", True))
+    assert query.calls == [("eq", "latest", True)]
+
+
+@dataclass
+class ExampleQuery:
+    include_naics: Optional[List[str]] = None
+    include_keys: Optional[List[str]] = None
+    active: bool = False
+
+
+class ExampleClient:
+    def __init__(self, url, key="key"):
+        self.supabase_url = url
+        self.supabase_key = key
+
+
+def _lookup(supabase, values):
+    return [f"{supabase.supabase_url}:{value}" for value in values]
+
+
+EXAMPLE_SPECS = (
+    FilterSpec("include_naics", "naics", "in"),
+    FilterSpec("include_keys", "code", "in", resolve=_lookup, needs_client=True),
+    FilterSpec("active", "latest", "eq", resolve=lambda active: True),
+)
+
+
+def test_resolvers_get_the_client_only_when_they_need_it():
+    plan = compile_plan(EXAMPLE_SPECS, ExampleQuery(include_keys=["1"], active=True), ExampleClient("db1"))
+    assert plan.conditions == (("in", "code", ("db1:1",)), ("eq", "latest", True))
+
+
+def test_resolving_an_include_list_to_nothing_matches_nothing():
+    specs = (FilterSpec("include_keys", "code", "in", resolve=lambda values: []),)
+    assert compile_plan(specs, ExampleQuery(include_keys=["1"])).matches_nothing
+
+
+def test_cached_plans_are_kept_apart_per_client_and_specs():
+    clear_plan_cache()
+    query = ExampleQuery(include_keys=["1"])
+    first = get_plan(EXAMPLE_SPECS, query, ExampleClient("db1"))
+    assert get_plan(EXAMPLE_SPECS, query, ExampleClient("db1")) is first
+    assert get_plan(EXAMPLE_SPECS, query, ExampleClient("db2")).conditions == (("in", "code", ("db2:1",)),)
+    assert query_key(query, EXAMPLE_SPECS[:1]) != query_key(query, EXAMPLE_SPECS)
+    clear_plan_cache()
+
+
+def test_plans_without_lookups_are_shared_across_clients():
+    query = ExampleQuery(include_naics=["541511"])
+    assert query_key(query, EXAMPLE_SPECS, ExampleClient("db1")) == query_key(query, EXAMPLE_SPECS, ExampleClient("db2"))
+
+
+def test_plan_cache_drops_expired_and_oldest_plans(monkeypatch):
+    clear_plan_cache()
+    get_plan(EXAMPLE_SPECS, ExampleQuery(include_naics=["expired"]), ttl=0)
+    get_plan(EXAMPLE_SPECS, ExampleQuery(include_naics=["kept"]))
+    assert len(query_compiler._plan_cache) == 1
+
+    monkeypatch.setattr(query_compiler, "PLAN_CACHE_MAX_ENTRIES", 3)
+    queries = [ExampleQuery(include_naics=[str(i)]) for i in range(5)]
+    for query in queries:
+        get_plan(EXAMPLE_SPECS, query)
+    assert list(query_compiler._plan_cache) == [query_key(query, EXAMPLE_SPECS) for query in queries[2:]]
+    clear_plan_cache()
@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "notices_table"))
+
+from results_compre_Lawrence import iter_json_array, iter_json_records
+
+
+def _write(tmp_path, text, name="results.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+def test_iter_json_array_matches_json_load(tmp_path, chunk_size):
+    records = [{"notice_id": str(i), "title": "Radar, \"mk]2\"", "values": [1, 2.5, None]} for i in range(200)]
+    path = _write(tmp_path, json.dumps(records, indent=2))
+    assert list(iter_json_array(path, chunk_size)) == records
+
+
+def test_iter_json_array_reads_large_elements_in_small_chunks(tmp_path):
+    records = [{"description": "x" * 200_000}, {"description": "y"}]
+    path = _write(tmp_path, json.dumps(records))
+    assert list(iter_json_array(path, chunk_size=1)) == records
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+@pytest.mark.parametrize("text", ["[1, 2.5, -3e5, 1E-2]", "[2.5]", "[1,-300000.0]", "[true,null,12345678]"])
+def test_iter_json_array_top_level_numbers_split_across_chunks(tmp_path, text, chunk_size):
+    assert list(iter_json_array(_write(tmp_path, text), chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ ]  ", " [1 , 2]\n"])
+def test_iter_json_array_whitespace_and_empty(tmp_path, text):
+    assert list(iter_json_array(_write(tmp_path, text), chunk_size=2)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ['{"results": []}', "", "[1, 2", "[1, }", "[1 2]", "[1,]", "[,1]", "[1,,2]",
+                                  "[1]]", "[1] trailing"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+def test_iter_json_array_rejects_malformed_input(tmp_path, text, chunk_size):
+    with pytest.raises(ValueError):
+        list(iter_json_array(_write(tmp_path, text), chunk_size))
+
+
+def test_iter_json_records_formats(tmp_path):
+    records = [{"notice_id": "1"}, {"notice_id": "2"}]
+    assert list(iter_json_records(_write(tmp_path, json.dumps(records)))) == records
+    assert list(iter_json_records(_write(tmp_path, json.dumps({"results": records})))) == records
+    jsonl = _write(tmp_path, "\n".join(json.dumps(record) for record in records) + "\n", "results.jsonl")
+    assert list(iter_json_records(jsonl)) == records